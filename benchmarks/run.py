@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmarks of the simulation hot paths.
+
+Run ``nox -s bench`` or ``python benchmarks/run.py``.  Four groups of
+benchmarks are timed, each reported as a rate where higher is better:
+
+* micro: calls per second of ``create_wheel``, ``get_outcome``,
+  ``Game.cycle`` and ``Table.is_valid``.
+* players: spins per second of a whole gather, for every registered player.
+* scaling: spins per second against the number of samples, ``max_rounds``
+  and the number of workers.
+* startup: runs per second of ``pycasino --help`` and of a one session
+  ``pycasino roulette``, each in a new interpreter.
+
+``--save PATH`` writes the results as JSON and ``--compare PATH`` fails the
+run when any rate dropped by more than ``--threshold`` from a saved baseline.
+Rates depend on the machine, so a baseline is only compared against runs on
+the machine that saved it and isn't kept in the repository.
+
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import click
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from pycasino.roulette import model, parallel, player, wheel_builder  # noqa: E402
+
+
+def _rate(statement, setup="pass", namespace=None):
+    """Return the calls per second of a statement."""
+    timer = timeit.Timer(statement, setup, globals=namespace)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=3, number=number))
+    return number / best
+
+
+def _game(table_limit=350.0):
+    return model.Game(model.Table(table_limit), wheel_builder.create_wheel())
+
+
+def micro():
+    """Calls per second of the functions every spin depends on."""
+    game = _game()
+    martingale = player.PlayerMartingale(stake=1e12, rounds=10 ** 12)
+    table = model.Table(350.0)
+    table.place_bet(model.Bet(10.0, wheel_builder.get_outcome("Black")))
+    namespace = {
+        "wheel_builder": wheel_builder,
+        "game": game,
+        "martingale": martingale,
+        "table": table,
+    }
+    return {
+        "create_wheel": _rate("wheel_builder.create_wheel()", namespace=namespace),
+        "get_outcome": _rate("wheel_builder.get_outcome('Black')", namespace=namespace),
+        "Game.cycle": _rate("game.cycle(martingale)", namespace=namespace),
+        "Table.is_valid": _rate("table.is_valid()", namespace=namespace),
+    }
+
+
+def _spins_per_second(name, samples, max_rounds, workers=1):
+    simulator = model.Simulator(
+        _game(),
+        player.REGISTERED_PLAYERS[name](
+            stake=100.0, base_bet_amount=10.0, rounds=max_rounds
+        ),
+    )
+    start = time.perf_counter()
+    with parallel.default_executor(workers) as executor:
+        simulator.gather(samples, executor=executor, seed=0)
+    elapsed = time.perf_counter() - start
+    return sum(simulator.durations) / elapsed
+
+
+def players(samples):
+    """Spins per second of a gather, for every registered player."""
+    return {
+        name: _spins_per_second(name, samples, max_rounds=20)
+        for name in player.REGISTERED_PLAYERS
+    }
+
+
+def scaling(samples):
+    """Spins per second of Martingale against the size of the run."""
+    results = dict()
+    for factor in (1, 10):
+        results[f"samples={samples * factor}"] = _spins_per_second(
+            "martingale", samples * factor, max_rounds=20
+        )
+    for max_rounds in (20, 200, 2000):
+        results[f"max_rounds={max_rounds}"] = _spins_per_second(
+            "martingale", samples, max_rounds=max_rounds
+        )
+    for workers in (1, 2, 4):
+        results[f"workers={workers}"] = _spins_per_second(
+            "martingale", samples * 10, max_rounds=20, workers=workers
+        )
+    return results
+
+
+def _runs_per_second(args, repeat=10):
+    """Return the runs per second of the CLI in a new interpreter, at best."""
+    command = [sys.executable, "-m", "pycasino.cli"] + args
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, cwd=ROOT)
+        best = min(best, time.perf_counter() - start)
+    return 1 / best
+
+
+def startup():
+    """Runs per second of short CLI commands, mostly interpreter startup."""
+    return {
+        "--help": _runs_per_second(["--help"]),
+        "roulette -n 1": _runs_per_second(["roulette", "-n", "1", "martingale"]),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return a message for every rate that regressed past the threshold."""
+    regressions = list()
+    for group, rates in baseline["results"].items():
+        for name, expected in rates.items():
+            measured = results.get(group, {}).get(name)
+            if measured is not None and measured < expected * (1 - threshold):
+                regressions.append(
+                    f"{group}/{name}: {measured:.4g}/s, baseline {expected:.4g}/s"
+                )
+    return regressions
+
+
+@click.command()
+@click.option(
+    "--samples",
+    default=2000,
+    show_default=True,
+    help="The number of sessions in the gather benchmarks.",
+)
+@click.option("--save", type=click.Path(dir_okay=False), help="Write results here.")
+@click.option(
+    "--compare",
+    "baseline_path",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Fail on regressions against this baseline.",
+)
+@click.option(
+    "--threshold",
+    default=0.2,
+    show_default=True,
+    help="The tolerated drop of a rate, as a fraction of the baseline.",
+)
+def main(samples, save, baseline_path, threshold):
+    """Time the simulation hot paths."""
+    results = {
+        "micro": micro(),
+        "players": players(samples),
+        "scaling": scaling(samples),
+        "startup": startup(),
+    }
+    for group, rates in results.items():
+        for name, rate in rates.items():
+            click.echo(f"{group}/{name}: {rate:,.0f}/s")
+
+    if save:
+        with open(save, "w") as output:
+            json.dump(
+                {"python": platform.python_version(), "results": results},
+                output,
+                indent=2,
+            )
+
+    if baseline_path:
+        with open(baseline_path) as baseline:
+            regressions = compare(results, json.load(baseline), threshold)
+        if regressions:
+            click.echo("Regressions:\n" + "\n".join(regressions), err=True)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
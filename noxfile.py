@@ -36,3 +36,18 @@ def docs(session):
     if os.path.exists("_build"):
         shutil.rmtree("_build")
     session.run("sphinx-build", "-W", "source/", "_build/html")
+
+
+@nox.session
+def bench(session):
+    session.install("-r", "requirements.txt")
+    session.install("-e", ".", "--no-deps")
+    baseline = os.path.join("benchmarks", "baseline.json")
+    # Pass e.g. `-- --save benchmarks/baseline.json` to record a new baseline.
+    if os.path.exists(baseline):
+        session.run(
+            "python", "benchmarks/run.py", "--compare", baseline, *session.posargs
+        )
+    else:
+        session.warn(f"No {baseline} to compare against, saving this run as one.")
+        session.run("python", "benchmarks/run.py", "--save", baseline, *session.posargs)
@@ -1,27 +1,112 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+"""The command line interface.
 
+The CLI is run many times from scripts, so only what parsing the
+arguments needs is imported up front.  The simulation modules are
+imported by the commands that use them, YAML only for ``--config`` and
+``--strategies``, and the players are looked up in :mod:`registry`
+without importing them.
+
+"""
+import math
 import sys
 import click
-import yaml
-import click_config_file
-from .roulette import model
-from .roulette import player
-from .roulette import wheel_builder
+from . import sinks
+from .roulette import registry
+from .roulette import rng
+
+# The statistics --target-ci can narrow, by their SessionResult field.
+CI_STATISTICS = {
+    "maximum_stake": "maximum",
+    "rounds_played": "duration",
+    "max_drawdown": "drawdown",
+    "ruin_rate": "ruined",
+}
 
 
 def player_factory(player_name, **kwargs):
     """
     kwargs will contain all the params necessary to initialize the player
     """
-    return player.REGISTERED_PLAYERS[player_name](**kwargs)
+    return registry.PLAYERS[player_name](**kwargs)
+
+
+class PlayerChoice(click.Choice):
+    """A case insensitive choice of the players in :mod:`registry`.
+
+    The names are looked up when needed, so players registered while
+    parsing are included and the players of entry points are only looked
+    for when a name isn't built in or all the names are listed.
+
+    """
+
+    def __init__(self):
+        self.case_sensitive = False
+
+    @property
+    def choices(self):
+        return tuple(registry.PLAYERS)
+
+    def convert(self, value, param, ctx):
+        for name in registry.PLAYERS.local_names():
+            if name.casefold() == value.casefold():
+                return name
+        return super().convert(value, param, ctx)
 
 
 def read_config(filepath, cmd_name):
+    import yaml
+
     with open(filepath) as config_data:
         return yaml.safe_load(config_data)[cmd_name]
 
 
+def load_config(ctx, param, filepath):
+    """Use the section of the command in a YAML file as option defaults."""
+    if filepath is None:
+        return
+    try:
+        config = read_config(filepath, ctx.info_name)
+    except Exception as exc:
+        raise click.BadOptionUsage(
+            "--config", f"Error reading configuration file: {exc}", ctx
+        )
+    ctx.default_map = {**(ctx.default_map or {}), **config}
+
+
+config_option = click.option(
+    "--config",
+    type=click.Path(dir_okay=False),
+    is_eager=True,
+    expose_value=False,
+    callback=load_config,
+    help="Read configuration from FILE.",
+)
+
+
+def load_strategies(ctx, param, filepath):
+    """Register the players of the strategies in a YAML file.
+
+    Runs before the player argument is parsed, so the new players can be
+    chosen.
+
+    """
+    if filepath is None:
+        return
+    import yaml
+    from .roulette import player
+    from .roulette import strategy
+
+    with open(filepath) as config_data:
+        config = yaml.safe_load(config_data).get("strategies", {})
+    try:
+        for name, definition in strategy.from_config(config).items():
+            player.register_strategy(name, definition)
+    except (TypeError, ValueError) as exc:
+        raise click.BadParameter(str(exc), ctx=ctx, param=param)
+
+
 @click.group()
 def main():
     """Collects statistics about the outcomes of using particular betting
@@ -29,9 +114,9 @@ def main():
     the game yourself.  Instead, you select your game, a player that
     will play with a certain betting strategy and the number of game sessions
     that player should play.  A players session is limited by his/her stake
-    and a maximum number of rounds to play.  These can be modified in a 
+    and a maximum number of rounds to play.  These can be modified in a
     configuration file.
-    
+
     """
     pass
 
@@ -65,14 +150,211 @@ def main():
     show_default=True,
     help="The maximum amount a bet can be.",
 )
-@click_config_file.configuration_option(provider=read_config, implicit=False)
+@click.option(
+    "--engine",
+    type=click.Choice(["scalar", "vectorized"], case_sensitive=False),
+    default="scalar",
+    show_default=True,
+    help="Play one session at a time or many at once with NumPy.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The number of processes to play the games in.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    help="Seed the games, the results then don't depend on --workers.",
+)
+@click.option(
+    "--rng",
+    "rng_backend",
+    type=click.Choice(sorted(rng.BACKENDS), case_sensitive=False),
+    default=rng.DEFAULT_BACKEND,
+    show_default=True,
+    help="The bit generator for spins and random bets, pcg64 and philox need numpy.",
+)
+@click.option(
+    "--summary",
+    is_flag=True,
+    help="Print summary statistics instead of a line per game.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print the time spent in each phase of play to stderr.",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write cProfile stats of the whole run to this file.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write every result of every game to this file instead of stdout.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(sorted(sinks.FORMATS), case_sensitive=False),
+    default="csv",
+    show_default=True,
+    help="The format of --output, npy needs numpy, arrow and parquet pyarrow.",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(
+        sorted({name for cls in sinks.FORMATS.values() for name in cls.compressions}),
+        case_sensitive=False,
+    ),
+    help="Compress --output: gzip, bz2 or xz for csv and npy, lz4 or zstd for "
+    "arrow, and snappy, gzip, brotli, lz4 or zstd for parquet.",
+)
+@click.option(
+    "--target-ci",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Play until the confidence interval of --ci-statistic is at most "
+    "this wide, with at most --num-games games if given.",
+)
+@click.option(
+    "--ci-statistic",
+    default="maximum_stake",
+    show_default=True,
+    type=click.Choice(list(CI_STATISTICS)),
+    help="The statistic whose confidence interval --target-ci narrows.",
+)
+@click.option(
+    "--confidence",
+    default=0.95,
+    show_default=True,
+    type=click.FloatRange(0, 1, min_open=True, max_open=True),
+    help="The confidence of the interval of --target-ci.",
+)
+@click.option(
+    "--time-budget",
+    type=click.FloatRange(min=0),
+    help="Play until this many seconds have passed, with at most --num-games "
+    "games if given.",
+)
+@click.option(
+    "--checkpoint",
+    "checkpoint_path",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Save the games played and the state of the run to this file, to "
+    "continue it with --resume after an interruption.",
+)
+@click.option(
+    "--checkpoint-interval",
+    default=60.0,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="The seconds between checkpoints.",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Continue the run saved in --checkpoint, if there is one.",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Reuse and keep the results of seeded runs, needs --seed.",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Where to keep cached results, defaults to ~/.cache/pycasino.",
+)
+@click.option(
+    "--cache-size",
+    default=1024,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="The size in MiB the cache is kept under.",
+)
+@click.option(
+    "--strategies",
+    type=click.Path(exists=True, dir_okay=False),
+    is_eager=True,
+    expose_value=False,
+    callback=load_strategies,
+    help="A YAML file whose strategies section defines more players.",
+)
+@config_option
 @click.argument(
     "player",
-    type=click.Choice(player.REGISTERED_PLAYERS.keys(), case_sensitive=False),
+    type=PlayerChoice(),
     nargs=1,
 )
-def roulette(player, stake, base_bet_amount, max_rounds, table_limit, num_games):
+def roulette(
+    player,
+    stake,
+    base_bet_amount,
+    max_rounds,
+    table_limit,
+    num_games,
+    engine,
+    workers,
+    seed,
+    rng_backend,
+    summary,
+    profile,
+    profile_output,
+    output,
+    output_format,
+    compression,
+    target_ci,
+    ci_statistic,
+    confidence,
+    time_budget,
+    checkpoint_path,
+    checkpoint_interval,
+    resume,
+    use_cache,
+    cache_dir,
+    cache_size,
+):
+
+    import collections
+    import contextlib
+    import cProfile
+    from .roulette import checkpoint
+    from .roulette import model
+    from .roulette import parallel
+    from .roulette import profiling
+    from .roulette import stats
+    from .roulette import wheel_builder
 
+    if use_cache and seed is None:
+        raise click.UsageError("--cache needs --seed.")
+    stop = None
+    if target_ci is not None or time_budget is not None:
+        if use_cache:
+            raise click.UsageError("--cache can't stop early.")
+        stop = stats.StoppingRule(
+            CI_STATISTICS[ci_statistic], target_ci, time_budget, confidence
+        )
+        source = click.get_current_context().get_parameter_source("num_games")
+        if source == click.core.ParameterSource.DEFAULT:
+            num_games = None
+    run_checkpoint = None
+    if resume and checkpoint_path is None:
+        raise click.UsageError("--resume needs --checkpoint.")
+    if checkpoint_path is not None:
+        if use_cache or stop is not None:
+            raise click.UsageError(
+                "--checkpoint can't be combined with --cache, --target-ci or "
+                "--time-budget."
+            )
+        run_checkpoint = checkpoint.Checkpoint(
+            checkpoint_path, checkpoint_interval, resume
+        )
     player_args = {
         "stake": stake,
         "base_bet_amount": base_bet_amount,
@@ -82,18 +364,769 @@ def roulette(player, stake, base_bet_amount, max_rounds, table_limit, num_games)
     game = model.Game(
         table=model.Table(table_limit), wheel=wheel_builder.create_wheel()
     )
+    if engine == "vectorized":
+        source = click.get_current_context().get_parameter_source("rng_backend")
+        if source != click.core.ParameterSource.DEFAULT:
+            # The vectorized engine draws all its numbers with NumPy.
+            raise click.UsageError("--rng can't be used with --engine vectorized.")
+        try:
+            from .roulette import vectorized
+        except ImportError:
+            raise click.ClickException("The vectorized engine requires numpy.")
+        sim = vectorized.VectorizedSimulator(
+            game=game, player=player_factory(player_name=player, **player_args)
+        )
+    else:
+        try:
+            sim = model.Simulator(
+                game=game,
+                player=player_factory(player_name=player, **player_args),
+                rng_backend=rng_backend,
+            )
+        except ImportError:
+            raise click.ClickException(f"The {rng_backend} generator requires numpy.")
+    if profile:
+        sim.profile(profiling.PhaseTimes())
+    # Only profiles this process, not the workers.
+    run_profile = cProfile.Profile() if profile_output else None
+    if run_profile is not None:
+        run_profile.enable()
+    result_cache = None
+    if use_cache:
+        from .roulette import cache as caches
+
+        result_cache = caches.ResultCache(cache_dir, cache_size * 2**20)
+    output_sink = None
+    if output is not None:
+        try:
+            output_sink = sinks.open_sink(output, output_format, compression)
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint="--compression")
+        except ImportError as exc:
+            raise click.ClickException(
+                f"The {output_format} format requires {exc.name}."
+            )
+    try:
+        # Closing the sessions when interrupted writes the last checkpoint.
+        with parallel.default_executor(workers) as executor, contextlib.closing(
+            sim.iter_sessions(
+                num_games,
+                executor=executor,
+                seed=seed,
+                cache=result_cache,
+                stop=stop,
+                checkpoint=run_checkpoint,
+            )
+        ) as sessions:
+            if output_sink is not None:
+                with output_sink:
+                    output_sink.write_all(sessions)
+            elif summary:
+                collections.deque(sessions, maxlen=0)
+            else:
+                with sinks.BufferedSink(
+                    sys.stdout,
+                    header="maximum_stake, rounds_played",
+                ) as sink:
+                    sink.write_all(record[:2] for record in sessions)
+            if summary:
+                echo_summary(sim.stats)
+            if stop is not None:
+                echo_stop(stop, sim.stats, ci_statistic)
+    except checkpoint.DifferentRun as exc:
+        raise click.BadParameter(str(exc), param_hint="--resume")
+    except KeyboardInterrupt:
+        if run_checkpoint is None:
+            raise
+        # The games played so far are written, and summarized.
+        if summary:
+            echo_summary(sim.stats)
+        click.echo(
+            f"Interrupted after {sim.stats.count} games, continue with "
+            f"--checkpoint {run_checkpoint.path} --resume.",
+            err=True,
+        )
+        raise click.exceptions.Exit(130)
+    finally:
+        if run_profile is not None:
+            run_profile.disable()
+            run_profile.dump_stats(profile_output)
+    if profile:
+        echo_profile(sim.profiler)
+
+    return 0
+
+
+def echo_stop(stop, session_stats, name):
+    """Print how many games a :class:`stats.StoppingRule` played to stderr."""
+    reasons = {
+        "width": "the confidence interval was narrow enough",
+        "time": "the time budget was spent",
+        None: "all the games were played",
+    }
+    low, high = session_stats.interval(stop.statistic, stop.confidence)
+    click.echo(
+        f"Played {session_stats.count} games, {reasons[stop.reason]}: "
+        f"{stop.confidence:.0%} confidence interval of {name} "
+        f"[{low:.6g}, {high:.6g}].",
+        err=True,
+    )
+
+
+def echo_profile(phase_times):
+    """Print the times of a :class:`profiling.PhaseTimes` to stderr."""
+    click.echo("strategy, phase, calls, seconds, us_per_call", err=True)
+    for player_cls, phase, calls, seconds in phase_times.rows():
+        click.echo(
+            f"{player_cls}, {phase}, {calls}, {seconds:.6g}, "
+            f"{seconds / calls * 1e6:.3g}",
+            err=True,
+        )
+
+
+# The names of the SessionStats statistics in printed tables.
+STATISTIC_NAMES = {
+    "maximum": "maximum_stake",
+    "duration": "rounds_played",
+    "drawdown": "max_drawdown",
+}
+
+
+def echo_summary(session_stats):
+    """Print the statistics of a :class:`stats.SessionStats`."""
+    quantiles = (0.5, 0.9, 0.99)
+    click.echo(
+        "statistic, count, mean, std, min, "
+        + ", ".join(f"p{round(q * 100)}" for q in quantiles)
+        + ", max"
+    )
+    for field, summary in session_stats.summaries.items():
+        moments = summary.moments
+        values = [moments.mean, moments.std, moments.min]
+        values += [summary.sketch.quantile(q) for q in quantiles]
+        values += [moments.max]
+        click.echo(
+            f"{STATISTIC_NAMES[field]}, {moments.count}, "
+            + ", ".join(f"{value:.6g}" for value in values)
+        )
+    # Whether each session was ruined is 0 or 1, so all its statistics
+    # follow from the ruin rate.
+    count, ruined = session_stats.count, session_stats.ruined
+    if count:
+        rate = session_stats.ruin_rate
+        variance = count * rate * (1 - rate) / (count - 1) if count > 1 else math.nan
+        values = [rate, math.sqrt(variance), float(ruined == count)]
+        values += [float(1 - rate < q) for q in quantiles]
+        values += [float(ruined > 0)]
+    else:
+        values = [math.nan] * (len(quantiles) + 4)
+    click.echo(f"ruin_rate, {count}, " + ", ".join(f"{value:.6g}" for value in values))
+
+
+def _parse_values(convert):
+    def callback(ctx, param, values):
+        try:
+            from .roulette import sweep as sweeps
+
+            return sweeps.parse_values(values, convert)
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), ctx=ctx, param=param)
+
+    return callback
+
+
+@main.command()
+@click.option(
+    "--num-games",
+    "-n",
+    default=50,
+    show_default=True,
+    help="The number of games to play per configuration.",
+)
+@click.option(
+    "--player",
+    "players",
+    multiple=True,
+    type=PlayerChoice(),
+    help="A player to sweep, all registered players by default.",
+)
+@click.option(
+    "--stake",
+    "stakes",
+    multiple=True,
+    default=["100"],
+    show_default=True,
+    callback=_parse_values(float),
+    help="A stake or a range start:stop:step.",
+)
+@click.option(
+    "--base-bet-amount",
+    "base_bet_amounts",
+    multiple=True,
+    default=["20"],
+    show_default=True,
+    callback=_parse_values(float),
+    help="A base bet amount or a range start:stop:step.",
+)
+@click.option(
+    "--max-rounds",
+    "max_rounds",
+    multiple=True,
+    default=["20"],
+    show_default=True,
+    callback=_parse_values(int),
+    help="A maximum # of rounds or a range start:stop:step.",
+)
+@click.option(
+    "--table-limit",
+    "table_limits",
+    multiple=True,
+    default=["350"],
+    show_default=True,
+    callback=_parse_values(float),
+    help="A table limit or a range start:stop:step.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["scalar", "vectorized"], case_sensitive=False),
+    default="scalar",
+    show_default=True,
+    help="Play one session at a time or many at once with NumPy.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The number of processes to play the configurations in.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    help="Seed the games, the results then don't depend on --workers.",
+)
+@click.option(
+    "--strategies",
+    type=click.Path(exists=True, dir_okay=False),
+    is_eager=True,
+    expose_value=False,
+    callback=load_strategies,
+    help="A YAML file whose strategies section defines more players.",
+)
+@config_option
+def sweep(
+    num_games,
+    players,
+    stakes,
+    base_bet_amounts,
+    max_rounds,
+    table_limits,
+    engine,
+    workers,
+    seed,
+):
+    """Play every combination of the players, stakes, base bets, maximum
+    rounds and table limits, and print a row of statistics for each.
+
+    Every option but --num-games, --engine, --workers and --seed can be
+    given several times, or as lists in the sweep section of a config file.
+
+    """
+    from .roulette import parallel
+    from .roulette import sweep as sweeps
+
+    if engine == "vectorized":
+        try:
+            from .roulette import vectorized  # noqa: F401
+        except ImportError:
+            raise click.ClickException("The vectorized engine requires numpy.")
+    configs = sweeps.grid(
+        players or list(registry.PLAYERS),
+        stakes,
+        base_bet_amounts,
+        max_rounds,
+        table_limits,
+    )
+    with parallel.default_executor(workers) as executor:
+        results = sweeps.sweep(configs, num_games, executor, seed, engine)
+
+    quantiles = (0.5, 0.9)
+    columns = list(sweeps.Config._fields) + ["games"]
+    for name in STATISTIC_NAMES.values():
+        columns += [f"{name}_mean", f"{name}_std"]
+        columns += [f"{name}_p{round(q * 100)}" for q in quantiles]
+    columns += ["ruin_rate"]
+    click.echo(", ".join(columns))
+    for config, session_stats in zip(configs, results):
+        values = list(config) + [session_stats.count]
+        for field in STATISTIC_NAMES:
+            summary = session_stats.summaries[field]
+            values += [summary.moments.mean, summary.moments.std]
+            values += [summary.sketch.quantile(q) for q in quantiles]
+        values += [session_stats.ruin_rate]
+        click.echo(
+            ", ".join(
+                f"{value:.6g}" if isinstance(value, float) else str(value)
+                for value in values
+            )
+        )
+
+    return 0
+
+
+@main.command()
+@click.option(
+    "--num-games",
+    "-n",
+    default=1000,
+    show_default=True,
+    type=click.IntRange(min=2),
+    help="The number of games each player plays.",
+)
+@click.option(
+    "--stake", "-s", default=100.0, show_default=True, help="The players initial funds."
+)
+@click.option(
+    "--max-rounds",
+    default=20,
+    show_default=True,
+    help="The maximum # of rounds per game.",
+)
+@click.option(
+    "--base-bet-amount",
+    default=20.0,
+    show_default=True,
+    help="The initial bet amount (strategies modify following bets amounts).",
+)
+@click.option(
+    "--table-limit",
+    default=350.0,
+    show_default=True,
+    help="The maximum amount a bet can be.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The number of processes to play the games in.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    help="Seed the games, the results then don't depend on --workers.",
+)
+@click.option(
+    "--strategies",
+    type=click.Path(exists=True, dir_okay=False),
+    is_eager=True,
+    expose_value=False,
+    callback=load_strategies,
+    help="A YAML file whose strategies section defines more players.",
+)
+@config_option
+@click.argument("players", nargs=-1, type=PlayerChoice())
+def compare(
+    players, num_games, stake, max_rounds, base_bet_amount, table_limit, workers, seed
+):
+    """Play PLAYERS, all registered players by default, on the same spins
+    and print the differences of their results from the first player.
+
+    Every game's spins are shared by all the players, so the differences
+    vary much less than those of independent games.  variance_reduction
+    is how many times fewer games that takes for the same confidence.
+
+    """
+    from .roulette import comparison
+    from .roulette import parallel
+
+    players = list(dict.fromkeys(players or registry.PLAYERS))
+    if len(players) < 2:
+        raise click.UsageError("Comparing needs at least two players.")
+    player_args = {
+        "stake": stake,
+        "base_bet_amount": base_bet_amount,
+        "rounds": max_rounds,
+    }
+    with parallel.default_executor(workers) as executor:
+        result = comparison.compare(
+            {name: player_factory(name, **player_args) for name in players},
+            num_games,
+            table_limit,
+            executor,
+            seed,
+        )
+
+    statistic_names = dict(zip(comparison.Comparison.fields, sinks.COLUMNS))
+    click.echo(
+        "player, baseline, statistic, games, mean, difference, "
+        "difference_variance, difference_std_error, variance_reduction"
+    )
+    for name, field, count, *values in result.rows():
+        click.echo(
+            f"{name}, {players[0]}, {statistic_names[field][0]}, {count}, "
+            + ", ".join(f"{value:.6g}" for value in values)
+        )
+
+    return 0
+
+
+@main.command()
+@click.option(
+    "--num-games",
+    "-n",
+    default=1000,
+    show_default=True,
+    help="The number of games to play.",
+)
+@click.option(
+    "--method",
+    default="control",
+    show_default=True,
+    type=click.Choice(["plain", "antithetic", "stratified", "control"]),
+    help="How to reduce the variance of the estimates.",
+)
+@click.option(
+    "--strata-spins",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The first spins stratified by --method stratified.",
+)
+@click.option(
+    "--stake", "-s", default=100.0, show_default=True, help="The players initial funds."
+)
+@click.option(
+    "--max-rounds",
+    default=20,
+    show_default=True,
+    help="The maximum # of rounds per game.",
+)
+@click.option(
+    "--base-bet-amount",
+    default=20.0,
+    show_default=True,
+    help="The initial bet amount (strategies modify following bets amounts).",
+)
+@click.option(
+    "--table-limit",
+    default=350.0,
+    show_default=True,
+    help="The maximum amount a bet can be.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The number of processes to play the games in.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    help="Seed the games, the results then don't depend on --workers.",
+)
+@click.option(
+    "--strategies",
+    type=click.Path(exists=True, dir_okay=False),
+    is_eager=True,
+    expose_value=False,
+    callback=load_strategies,
+    help="A YAML file whose strategies section defines more players.",
+)
+@config_option
+@click.argument("player", type=PlayerChoice())
+def estimate(
+    player,
+    num_games,
+    method,
+    strata_spins,
+    stake,
+    max_rounds,
+    base_bet_amount,
+    table_limit,
+    workers,
+    seed,
+):
+    """Estimate the mean results of PLAYER's games with less variance.
+
+    effective_games is how many independent games would give the same
+    standard error.
+
+    """
+    from .roulette import model
+    from .roulette import parallel
+    from .roulette import variance
+    from .roulette import wheel_builder
+
+    sim = model.Simulator(
+        model.Game(model.Table(table_limit), wheel_builder.create_wheel()),
+        player_factory(
+            player, stake=stake, base_bet_amount=base_bet_amount, rounds=max_rounds
+        ),
+    )
+    if method == "stratified":
+        method = variance.Stratified(len(sim.game.wheel.bins), strata_spins)
+    try:
+        with parallel.default_executor(workers) as executor:
+            estimates = variance.estimate(sim, num_games, method, executor, seed)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--num-games")
+
+    statistic_names = dict(zip(model.SessionResult._fields, sinks.COLUMNS))
+    click.echo("statistic, estimate, std_error, games, effective_games")
+    for field, (mean, std_error, count, effective) in estimates.items():
+        click.echo(
+            f"{statistic_names[field][0]}, {mean:.6g}, {std_error:.6g}, {count}, "
+            f"{effective:.6g}"
+        )
+
+    return 0
+
+
+@main.command()
+@click.option(
+    "--num-games",
+    "-n",
+    default=10_000,
+    show_default=True,
+    help="The number of games to play, at every level for splitting.",
+)
+@click.option(
+    "--target",
+    type=float,
+    help="Estimate the probability of the stake reaching TARGET.",
+)
+@click.option(
+    "--ruin",
+    is_flag=True,
+    help="Estimate the probability of going broke.",
+)
+@click.option(
+    "--method",
+    default="importance",
+    show_default=True,
+    type=click.Choice(["importance", "splitting", "plain"]),
+    help="Tilt the spins towards the event, or split games at stake levels.",
+)
+@click.option(
+    "--scale",
+    default=1.0,
+    show_default=True,
+    help="How strongly importance sampling tilts the spins, 1 for Siegmund's tilt.",
+)
+@click.option(
+    "--levels",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The number of stake levels splitting copies games at.",
+)
+@click.option(
+    "--stake", "-s", default=100.0, show_default=True, help="The players initial funds."
+)
+@click.option(
+    "--max-rounds",
+    default=20,
+    show_default=True,
+    help="The maximum # of rounds per game.",
+)
+@click.option(
+    "--base-bet-amount",
+    default=20.0,
+    show_default=True,
+    help="The initial bet amount (strategies modify following bets amounts).",
+)
+@click.option(
+    "--table-limit",
+    default=350.0,
+    show_default=True,
+    help="The maximum amount a bet can be.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The number of processes to play the games in.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    help="Seed the games, the results then don't depend on --workers.",
+)
+@click.option(
+    "--strategies",
+    type=click.Path(exists=True, dir_okay=False),
+    is_eager=True,
+    expose_value=False,
+    callback=load_strategies,
+    help="A YAML file whose strategies section defines more players.",
+)
+@config_option
+@click.argument("player", type=PlayerChoice())
+def rare(
+    player,
+    num_games,
+    target,
+    ruin,
+    method,
+    scale,
+    levels,
+    stake,
+    max_rounds,
+    base_bet_amount,
+    table_limit,
+    workers,
+    seed,
+):
+    """Estimate the probability of a rare event in PLAYER's games, the
+    stake reaching --target or --ruin.
+
+    effective_games is how many plain games would give the same standard
+    error.
+
+    """
+    from .roulette import model
+    from .roulette import parallel
+    from .roulette import rare as rare_events
+    from .roulette import wheel_builder
+
+    if (target is None) == (not ruin):
+        raise click.UsageError("Give one of --target and --ruin.")
+    event = rare_events.Ruin() if ruin else rare_events.Reach(target)
     sim = model.Simulator(
-        game=game, player=player_factory(player_name=player, **player_args)
+        model.Game(model.Table(table_limit), wheel_builder.create_wheel()),
+        player_factory(
+            player, stake=stake, base_bet_amount=base_bet_amount, rounds=max_rounds
+        ),
     )
-    sim.gather(num_games)
+    try:
+        with parallel.default_executor(workers) as executor:
+            result = rare_events.estimate(
+                sim, event, num_games, method, scale, levels, executor, seed
+            )
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--num-games")
+
+    relative_error = result.std_error / result.mean if result.mean else math.inf
+    click.echo(
+        "event, method, probability, std_error, relative_error, games, "
+        "effective_games"
+    )
+    click.echo(
+        f"{event!r}, {method}, {result.mean:.6g}, {result.std_error:.6g}, "
+        f"{relative_error:.6g}, {result.samples}, {result.effective_samples:.6g}"
+    )
+
+    return 0
+
+
+@main.command()
+@click.option(
+    "--stake", "-s", default=100.0, show_default=True, help="The players initial funds."
+)
+@click.option(
+    "--max-rounds",
+    default=20,
+    show_default=True,
+    help="The maximum # of rounds per game.",
+)
+@click.option(
+    "--base-bet-amount",
+    default=20.0,
+    show_default=True,
+    help="The initial bet amount (strategies modify following bets amounts).",
+)
+@click.option(
+    "--table-limit",
+    default=350.0,
+    show_default=True,
+    help="The maximum amount a bet can be.",
+)
+@click.option(
+    "--strategies",
+    type=click.Path(exists=True, dir_okay=False),
+    is_eager=True,
+    expose_value=False,
+    callback=load_strategies,
+    help="A YAML file whose strategies section defines more players.",
+)
+@config_option
+@click.argument(
+    "player",
+    type=PlayerChoice(),
+    nargs=1,
+)
+def analyze(player, stake, base_bet_amount, max_rounds, table_limit):
+    """Compute the exact distributions of the maximum stake and rounds
+    played of a deterministic player, without playing any games.
 
-    click.echo("maximum_stake, rounds_played")
-    for i in zip(sim.maxima, sim.durations):
-        click.echo(f"{i[0]}, {i[1]}")
+    """
+    from .roulette import analysis
+
+    player_args = {
+        "stake": stake,
+        "base_bet_amount": base_bet_amount,
+        "rounds": max_rounds,
+    }
+    try:
+        result = analysis.analyze(
+            player_factory(player_name=player, **player_args), table_limit
+        )
+    except TypeError as exc:
+        raise click.BadParameter(str(exc), param_hint="PLAYER")
+
+    click.echo("statistic, value, probability")
+    for played, p in result.durations().items():
+        click.echo(f"rounds_played, {played}, {p!r}")
+    for maximum, p in result.maxima().items():
+        click.echo(f"maximum_stake, {maximum}, {p!r}")
 
     return 0
 
 
+@main.group()
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Where cached results are kept, defaults to ~/.cache/pycasino.",
+)
+@click.pass_context
+def cache(ctx, cache_dir):
+    """List or remove the results cached by roulette --cache."""
+    from .roulette import cache as caches
+
+    ctx.obj = caches.ResultCache(cache_dir)
+
+
+@cache.command("list")
+@click.pass_obj
+def list_cache(result_cache):
+    """Print the cached results, most recently used first."""
+    click.echo(
+        "key, player, stake, base_bet_amount, rounds, table_limit, seed, "
+        "samples, bytes"
+    )
+    for entry in result_cache.entries():
+        meta = entry.meta
+        click.echo(
+            f"{entry.key}, {meta['player']}, {meta['stake']}, "
+            f"{meta['base_bet_amount']}, {meta['rounds']}, {meta['table_limit']}, "
+            f"{meta['seed']}, {entry.samples}, {entry.size}"
+        )
+
+
+@cache.command("clear")
+@click.argument("keys", nargs=-1)
+@click.pass_obj
+def clear_cache(result_cache, keys):
+    """Remove the cached results of KEYS, or all of them."""
+    if not keys:
+        result_cache.clear()
+    for key in keys:
+        result_cache.remove(key)
+
+
 if __name__ == "__main__":
     sys.exit(main())
-
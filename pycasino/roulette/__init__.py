@@ -1,3 +1,34 @@
-from . import model
-from . import wheel_builder
-from . import player
+"""Roulette games, players and the simulations of their sessions.
+
+The submodules are imported when first used, e.g. ``roulette.model``, so
+importing the package alone, as the CLI does before parsing its arguments,
+costs next to nothing.
+
+"""
+import importlib
+
+__all__ = [
+    "analysis",
+    "cache",
+    "checkpoint",
+    "comparison",
+    "layout",
+    "model",
+    "parallel",
+    "player",
+    "profiling",
+    "rare",
+    "registry",
+    "rng",
+    "stats",
+    "strategy",
+    "sweep",
+    "variance",
+    "wheel_builder",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Exact distributions of session results for deterministic players.
+
+Players like Martingale only ever bet on Black and their next bet depends
+only on whether their past bets won.  A session of such a player is a
+Markov chain over (stake, strategy state, highest stake), where every spin
+lands on Black, Red or a green zero with probabilities known from the
+wheel.  Pushing the probability mass through this chain round by round
+gives the exact distributions of the rounds played and the maximum stake
+that :class:`model.Simulator` estimates by sampling.
+
+The highest stake would multiply the states many times over, so it is
+only kept while it can still rise.  Once a session has stopped, or even a
+run of wins in the rounds left can't take its stake past its highest, its
+maximum is settled and recorded, and the session goes on without it.
+Sessions too unlikely to matter are settled at their highest stake so far
+as well, see ``tolerance`` in :func:`analyze`.
+
+The rounds a player may play only decide when the chain is cut off, so a
+single pass up to ``max_rounds`` gives the distributions for every shorter
+horizon as well, see :meth:`Analysis.durations` and :meth:`Analysis.maxima`.
+
+"""
+import abc
+import collections
+import math
+from . import player as plr
+from . import wheel_builder
+
+
+# Chains keyed by the exact player class they describe.
+CHAINS = {}
+
+
+def register_chain(player_cls):
+    """Registers the wrapped chain as the description of ``player_cls``."""
+
+    def wrapper(cls):
+        CHAINS[player_cls] = cls
+        return cls
+
+    return wrapper
+
+
+class _Chain(abc.ABC):
+    """Base class for the Markov chain of a betting strategy.
+
+    States must be hashable, equal states are merged.  Chains with many
+    states set ``bounded`` to false, the highest their stakes can rise is
+    then bounded by winning the table limit every round instead of by
+    trying every run of spins.
+
+    :param player: The player whose initial state starts the chain.
+    :type player: Player
+
+    """
+
+    bounded = True
+
+    def __init__(self, player):
+        self.base_bet_amount = player.base_bet_amount
+
+    @abc.abstractmethod
+    def initial(self, player):
+        """Return the strategy state of the player."""
+        pass
+
+    @abc.abstractmethod
+    def threshold(self, state):
+        """The amount the stake must exceed for a player to keep playing."""
+        pass
+
+    def playing(self, state):
+        """Any strategy specific reasons to stop, besides stake and rounds."""
+        return True
+
+    def place(self, state):
+        """Return the bet before the table limit and the state after betting."""
+        return self.threshold(state), state
+
+    @abc.abstractmethod
+    def update(self, state, spin):
+        """Return the state after a spin of "Black", "Red" or "Green"."""
+        pass
+
+
+@register_chain(plr.PlayerMartingale)
+@register_chain(plr.PlayerFibonacci)
+@register_chain(plr.Player1326)
+class _StrategyChain(_Chain):
+    """The chain of a :class:`player.StrategyPlayer` that only bets on Black.
+
+    Runs the player's compiled :class:`strategy.Tables`.
+
+    """
+
+    def __init__(self, player):
+        super().__init__(player)
+        self.tables = player.tables
+        black = wheel_builder.get_outcome("Black")
+        if any(outcome is not black for outcome in self.tables.outcomes):
+            raise TypeError("Only strategies that bet on Black have a Markov chain.")
+
+    def initial(self, player):
+        return player.state
+
+    def threshold(self, state):
+        return self.base_bet_amount * self.tables.multipliers[state]
+
+    def update(self, state, spin):
+        if spin == "Black":
+            return self.tables.on_win[state]
+        return self.tables.on_loss[state]
+
+
+@register_chain(plr.PlayerSevenReds)
+class _SevenRedsChain(_StrategyChain):
+    def initial(self, player):
+        seen_red = player.history.totals[player._red] > 0
+        return player.state, player._red_count, seen_red
+
+    def threshold(self, state):
+        return super().threshold(state[0])
+
+    def place(self, state):
+        table_state, red_count, seen_red = state
+        if red_count == 0:
+            return self.threshold(state), state
+        red_count = red_count - 1 if seen_red else 7
+        return 0.0, (table_state, red_count, seen_red)
+
+    def update(self, state, spin):
+        table_state, red_count, seen_red = state
+        if red_count != 0:
+            table_state = self.tables.initial
+        else:
+            table_state = super().update(table_state, spin)
+        return table_state, red_count, seen_red or spin == "Red"
+
+
+@register_chain(plr.PlayerCancellation)
+class _CancellationChain(_Chain):
+    # Every loss lengthens the sequence.
+    bounded = False
+
+    def initial(self, player):
+        return tuple(player.sequence)
+
+    def threshold(self, state):
+        return state[0] + state[-1]
+
+    def playing(self, state):
+        return len(state) > 1
+
+    def update(self, state, spin):
+        if spin == "Black":
+            return state[1:-1]
+        return state + (self.threshold(state),)
+
+
+class Analysis:
+    """The exact results of every horizon up to ``max_rounds``.
+
+    Made by :func:`analyze`.  Holds, for every round, the probability of
+    the sessions that stopped in that round and of the sessions still
+    playing after it.  The maxima of the sessions are held by the round
+    they were settled in, and for the sessions whose maximum can still
+    rise, by the round.  ``pruned`` is the probability of the sessions
+    settled early for being too unlikely, see :func:`analyze`.
+
+    """
+
+    def __init__(self, max_rounds):
+        self.max_rounds = max_rounds
+        self.stopped = [0.0] * (max_rounds + 1)
+        self.live = [0.0] * (max_rounds + 1)
+        # settled[r] and rising[r]: {maximum stake: probability} after r rounds.
+        self.settled = [dict() for _ in range(max_rounds + 1)]
+        self.rising = [dict() for _ in range(max_rounds + 1)]
+        self.pruned = 0.0
+
+    def _check(self, rounds):
+        rounds = self.max_rounds if rounds is None else rounds
+        if not 0 <= rounds <= self.max_rounds:
+            raise ValueError(f"The horizon must be between 0 and {self.max_rounds}.")
+        return rounds
+
+    def durations(self, rounds=None):
+        """Return {rounds played: probability} for sessions of ``rounds``."""
+        rounds = self._check(rounds)
+        distribution = dict(enumerate(self.stopped[:rounds]))
+        distribution[rounds] = self.stopped[rounds] + self.live[rounds]
+        return {played: p for played, p in distribution.items() if p > 0}
+
+    def maxima(self, rounds=None):
+        """Return {maximum stake: probability} for sessions of ``rounds``."""
+        rounds = self._check(rounds)
+        distribution = collections.defaultdict(float)
+        for masses in self.settled[: rounds + 1] + [self.rising[rounds]]:
+            for maximum, p in masses.items():
+                distribution[maximum] += p
+        return dict(sorted(distribution.items()))
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.max_rounds!r})"
+
+
+def _merge(masses, more):
+    """Add the probabilities of one {maximum stake: probability} to another."""
+    for maximum, p in more.items():
+        masses[maximum] = masses.get(maximum, 0.0) + p
+
+
+def _spin_probabilities(wheel):
+    """Return the probabilities of a spin landing on Black, Red or Green."""
+    black = wheel.all_outcomes["Black"]
+    red = wheel.all_outcomes["Red"]
+    counts = collections.Counter(
+        "Black" if black in bin_ else "Red" if red in bin_ else "Green"
+        for bin_ in wheel.bins
+    )
+    return {spin: count / len(wheel.bins) for spin, count in counts.items()}
+
+
+def _moves(chain, state, table_limit, spins):
+    """Return the stake a state needs to play and its moves.
+
+    The moves are (bet, payout, next state, probability) for every spin,
+    and there are none if the strategy stops in the state.
+    """
+    if not chain.playing(state):
+        return math.inf, ()
+    amount, placed = chain.place(state)
+    bet = min(amount, table_limit)
+    # A bet on Black pays even money.
+    return chain.threshold(state), [
+        (bet, bet + bet if spin == "Black" else 0.0, chain.update(placed, spin), q)
+        for spin, q in spins.items()
+    ]
+
+
+def _gains(moves):
+    """Return a function of the most the stake can rise from a state.
+
+    ``gain(state, rounds)`` is the highest the stake can get above where
+    it is in ``rounds`` more rounds, however large it is.
+
+    :param moves: The moves of a state, see :func:`_moves`.
+    :type moves: callable
+    """
+    memo = dict()
+
+    def gain(state, rounds):
+        try:
+            return memo[state, rounds]
+        except KeyError:
+            pass
+        # Depth first without recursion, rounds can be many.
+        stack = [(state, rounds)]
+        while stack:
+            key = stack[-1]
+            if key in memo:
+                stack.pop()
+                continue
+            if key[1] == 0:
+                memo[key] = 0.0
+                stack.pop()
+                continue
+            nexts = [
+                (bet, paid, (new, key[1] - 1)) for bet, paid, new, _ in moves(key[0])
+            ]
+            missing = [after for _, _, after in nexts if after not in memo]
+            if missing:
+                stack.extend(missing)
+                continue
+            memo[key] = max(
+                [0.0] + [paid - bet + memo[after] for bet, paid, after in nexts]
+            )
+            stack.pop()
+        return memo[state, rounds]
+
+    return gain
+
+
+def analyze(player, table_limit, max_rounds=None, wheel=None, tolerance=1e-12):
+    """Compute the exact session results of a deterministic player.
+
+    :param player: A player with a registered chain, or a
+        :class:`player.StrategyPlayer` betting on Black, in its initial state.
+    :type player: Player
+    :param table_limit: The table limit, bets above it are capped.
+    :type table_limit: float
+    :param max_rounds: The longest horizon, defaults to ``player.rounds``.
+    :type max_rounds: int
+    :param wheel: The wheel to play on, defaults to a standard wheel.
+    :param tolerance: Sessions less likely than this whose maximum could
+        still rise are settled at their highest stake so far, the maxima
+        are then off by at most :attr:`Analysis.pruned`.  Zero keeps every
+        maximum exact.
+    :type tolerance: float
+    :returns: The distributions for every horizon up to ``max_rounds``.
+    :rtype: Analysis
+    """
+    chain_cls = CHAINS.get(type(player))
+    if chain_cls is None and isinstance(player, plr.StrategyPlayer):
+        chain_cls = _StrategyChain
+    if chain_cls is None:
+        raise TypeError(f"{type(player).__qualname__} has no Markov chain.")
+    chain = chain_cls(player)
+    max_rounds = player.rounds if max_rounds is None else max_rounds
+    spins = _spin_probabilities(wheel or wheel_builder.create_wheel())
+    steps = dict()
+
+    def moves(state):
+        try:
+            return steps[state]
+        except KeyError:
+            return steps.setdefault(state, _moves(chain, state, table_limit, spins))
+
+    if chain.bounded:
+        gain = _gains(lambda state: moves(state)[1])
+    else:
+
+        def gain(state, rounds):
+            return rounds * table_limit
+
+    analysis = Analysis(max_rounds)
+    # {(stake, strategy state): [probability of the sessions whose maximum
+    # is settled, {maximum stake: probability} of the others]}
+    live = {(player.stake, chain.initial(player)): [0.0, {player.stake: 1.0}]}
+    for played in range(max_rounds + 1):
+        after = dict()
+        for (stake, state), (mass, peaks) in live.items():
+            threshold, state_moves = moves(state)
+            total = mass + sum(peaks.values())
+            if stake <= threshold:
+                analysis.stopped[played] += total
+                _merge(analysis.settled[played], peaks)
+                continue
+            analysis.live[played] += total
+            _merge(analysis.rising[played], peaks)
+            if played == max_rounds:
+                continue
+            settled = analysis.settled[played + 1]
+            for bet, paid, new_state, q in state_moves:
+                new_stake = stake - bet + paid
+                reach = new_stake + gain(new_state, max_rounds - played - 1)
+                target = after.get((new_stake, new_state))
+                if target is None:
+                    target = after[new_stake, new_state] = [0.0, dict()]
+                new_peaks = target[1]
+                moved = mass * q
+                for peak, p in peaks.items():
+                    if peak < new_stake:
+                        peak = new_stake
+                    p *= q
+                    if peak < reach and p >= tolerance:
+                        new_peaks[peak] = new_peaks.get(peak, 0.0) + p
+                        continue
+                    if peak < reach:
+                        analysis.pruned += p
+                    settled[peak] = settled.get(peak, 0.0) + p
+                    moved += p
+                target[0] += moved
+        live = after
+    return analysis
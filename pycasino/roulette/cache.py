@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""An on-disk cache of the results of seeded simulations.
+
+Results are stored under a key hashed from everything that decides them:
+the player's class, the state of every attribute it was made with and its
+strategy tables, the wheel's bins, the table limit, the engine and its
+version, the chunk size, the random number generator backend and the
+seed.  Running the same configuration again reads the results back
+instead of playing them.
+
+Each entry is a JSON file of the description and the number of sessions,
+and a file of the raw columns of the results, one after another, as
+written by :meth:`array.array.tofile`.  Neither can run code when read.
+
+Since every chunk of sessions plays on its own random stream (see
+:mod:`parallel`), asking for more sessions than are cached only plays the
+missing chunks and appends them.  The sessions of an incomplete last
+chunk are played again, as the state of its stream isn't stored.
+
+The cache keeps its total size under a limit by removing the entries used
+least recently.
+
+"""
+import array
+import collections
+import hashlib
+import json
+import os
+import tempfile
+from . import model
+from . import parallel
+from . import rng
+
+# Bump whenever a change to the engines changes the results of a seed.
+ENGINE_VERSION = 1
+
+Entry = collections.namedtuple("Entry", ["key", "samples", "size", "used", "meta"])
+Entry.__doc__ = """A cached result: its key, number of sessions, size in bytes,
+time of last use and the description of the configuration.
+"""
+
+
+def default_directory():
+    """Return ``$PYCASINO_CACHE_DIR``, or ``~/.cache/pycasino``."""
+    return os.environ.get(
+        "PYCASINO_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "pycasino"),
+    )
+
+
+def _attributes(value):
+    """Return the attributes of an object by name, slots included."""
+    names = [
+        name
+        for cls in type(value).__mro__
+        for name in cls.__dict__.get("__slots__", ())
+        if hasattr(value, name)
+    ]
+    attributes = {name: getattr(value, name) for name in names}
+    attributes.update(getattr(value, "__dict__", {}))
+    # A snapshot is a copy of other attributes.
+    attributes.pop("_snapshot", None)
+    return dict(sorted(attributes.items()))
+
+
+def _fingerprint(value):
+    """Return a JSON value of the state of a value, equal for equal states."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (model.Outcome, rng.BufferedRandom)):
+        # Outcome ids depend on the process, and the generators of the
+        # players are seeded for every chunk.
+        return repr(value)
+    if isinstance(value, dict):
+        return [[_fingerprint(key), _fingerprint(item)] for key, item in value.items()]
+    if isinstance(value, (list, tuple, collections.deque)):
+        return [_fingerprint(item) for item in value]
+    return {
+        "class": f"{type(value).__module__}.{type(value).__qualname__}",
+        "attributes": _fingerprint(_attributes(value)),
+    }
+
+
+def _digest(value):
+    return hashlib.sha256(json.dumps(_fingerprint(value)).encode()).hexdigest()
+
+
+def describe(simulator, seed):
+    """Return the description of a seeded run that its results depend on."""
+    player = simulator._original_player
+    tables = getattr(player, "tables", None)
+    bins = [
+        sorted(outcome.name for outcome in bin_.outcomes)
+        for bin_ in simulator.game.wheel.bins
+    ]
+    return {
+        "player": f"{type(player).__module__}.{type(player).__qualname__}",
+        "stake": player.stake,
+        "base_bet_amount": player.base_bet_amount,
+        "rounds": player.rounds,
+        "attributes": _fingerprint(_attributes(player)),
+        "tables": _digest(tables) if tables is not None else None,
+        "bins": _digest(bins),
+        "table_limit": simulator.game.table.limit,
+        "engine": f"{type(simulator).__module__}.{type(simulator).__qualname__}",
+        "engine_version": ENGINE_VERSION,
+        "chunk_size": simulator.chunk_size,
+        "rng": simulator.game.wheel.random_num_gen.backend,
+        "seed": seed,
+    }
+
+
+def key(description):
+    """Return the key of the results of a description from :func:`describe`."""
+    encoded = json.dumps(description, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """A directory of cached :class:`model.SessionResult` columns.
+
+    :param directory: Where to keep the results, see
+        :func:`default_directory`.
+    :type directory: str
+    :param max_bytes: The size the cache is kept under.
+    :type max_bytes: int
+
+    """
+
+    # The array type of each field of a SessionResult.
+    typecodes = parallel.SharedResults.typecodes
+
+    def __init__(self, directory=None, max_bytes=2**30):
+        self.directory = default_directory() if directory is None else directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, key + suffix)
+
+    def load(self, key):
+        """Return the cached columns of a key, or None.
+
+        An entry that is incomplete, or removed while being read, is a miss.
+
+        """
+        try:
+            with open(self._path(key, ".json")) as data:
+                samples = json.load(data)["samples"]
+            columns = tuple(array.array(typecode) for typecode in self.typecodes)
+            with open(self._path(key, ".data"), "rb") as data:
+                for column in columns:
+                    column.fromfile(data, samples)
+            # Mark the entry used for eviction.
+            os.utime(self._path(key, ".json"))
+        except (FileNotFoundError, EOFError, KeyError, ValueError):
+            return None
+        return model.SessionResult(*(column.tolist() for column in columns))
+
+    def _write(self, key, suffix, write):
+        """Write a file of an entry through a temporary file."""
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as output:
+                write(output)
+            os.replace(temporary, self._path(key, suffix))
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    def store(self, key, columns, description):
+        """Cache the columns of a key, then evict entries over the size limit."""
+        os.makedirs(self.directory, exist_ok=True)
+        arrays = tuple(
+            array.array(typecode, column)
+            for typecode, column in zip(self.typecodes, columns)
+        )
+        meta = dict(description, samples=len(columns.maximum))
+
+        def write_columns(output):
+            for column in arrays:
+                column.tofile(output)
+
+        # Readers never see half a file, and the columns are written first
+        # so the number of sessions is never ahead of them.
+        self._write(key, ".data", write_columns)
+        self._write(
+            key,
+            ".json",
+            lambda output: output.write(json.dumps(meta, sort_keys=True).encode()),
+        )
+        self.evict()
+
+    def entries(self):
+        """Return an :class:`Entry` for every cached result, latest used first."""
+        if not os.path.isdir(self.directory):
+            return []
+        entries = list()
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            key = name[: -len(".json")]
+            try:
+                with open(self._path(key, ".json")) as data:
+                    meta = json.load(data)
+                used = os.path.getmtime(self._path(key, ".json"))
+                size = os.path.getsize(self._path(key, ".data"))
+            except FileNotFoundError:
+                continue
+            entries.append(Entry(key, meta["samples"], size, used, meta))
+        return sorted(entries, key=lambda entry: entry.used, reverse=True)
+
+    def remove(self, key):
+        """Remove the entry of a key, if it is cached."""
+        for suffix in (".json", ".data"):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """Remove every entry."""
+        for entry in self.entries():
+            self.remove(entry.key)
+
+    def evict(self):
+        """Remove the least recently used entries until under ``max_bytes``."""
+        entries = self.entries()
+        total = sum(entry.size for entry in entries)
+        while entries and total > self.max_bytes:
+            entry = entries.pop()
+            self.remove(entry.key)
+            total -= entry.size
+
+    def gather(self, simulator, samples, seed, executor=None):
+        """Return the results of ``samples`` seeded sessions of a simulator.
+
+        Cached sessions are read back and only the missing ones are
+        played.  The results are the same as those of
+        :func:`parallel.gather` with the same seed.
+
+        :returns: A :class:`model.SessionResult` of lists.
+        :rtype: SessionResult
+        """
+        description = describe(simulator, seed)
+        entry_key = key(description)
+        cached = self.load(entry_key)
+        if cached is not None and len(cached.maximum) >= samples:
+            return model.SessionResult(*(column[:samples] for column in cached))
+
+        start = 0
+        if cached is not None:
+            start = len(cached.maximum) // simulator.chunk_size * simulator.chunk_size
+        played = parallel.gather(simulator, samples, executor, seed, start=start)
+        if cached is None:
+            columns = played
+        else:
+            columns = model.SessionResult(
+                *(old[:start] + new for old, new in zip(cached, played))
+            )
+        self.store(entry_key, columns, description)
+        return columns
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.directory!r}, {self.max_bytes!r})"
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Checkpoint long runs so they can be resumed after an interruption.
+
+Every chunk of sessions plays on its own random stream derived from the
+master seed and the chunk's index (see :mod:`parallel`), so the state of
+every stream, in this process or in any worker, once a number of whole
+chunks are played is just the seed and that number.  A checkpoint stores
+the description of the run (see :func:`cache.describe`), including the
+seed, and the number of sessions played so far in a small JSON file.
+The results of those sessions are appended, a chunk at a time, to a file
+of raw values for each column, written by :meth:`array.array.tofile`, so
+saving never rewrites them and loading can't run code.  Resuming plays the
+chunks after those, which gives the same results, bit for bit, as a run
+that was never interrupted.  Sessions of chunks that were still playing
+when the run stopped are played again, and values appended after the
+last checkpoint are dropped.
+
+Checkpoints are written every ``interval`` seconds and once the run ends.
+Ctrl-C, SIGINT or SIGTERM write a last checkpoint and raise
+:class:`Interrupted`.
+
+"""
+import array
+import contextlib
+import json
+import os
+import random
+import signal
+import tempfile
+import threading
+import time
+from . import cache
+from . import model
+from . import parallel
+
+
+class Interrupted(KeyboardInterrupt):
+    """A checkpointed run was stopped by Ctrl-C, SIGINT or SIGTERM.
+
+    :param path: Where the checkpoint was written.
+    :type path: str
+    :param played: The number of sessions in the checkpoint.
+    :type played: int
+
+    """
+
+    def __init__(self, path, played):
+        super().__init__(path)
+        self.path = path
+        self.played = played
+
+
+class DifferentRun(ValueError):
+    """A checkpoint being resumed is of a run with another configuration."""
+
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt(signal.Signals(signum).name)
+
+
+@contextlib.contextmanager
+def _terminate_interrupts():
+    """Make SIGTERM interrupt like SIGINT, in the main thread."""
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    previous = signal.signal(signal.SIGTERM, _raise_interrupt)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+
+class Checkpoint:
+    """Where and how often a run is checkpointed.
+
+    The columns of the results are kept next to the checkpoint, in files
+    named after it and the fields of :class:`model.SessionResult`.
+
+    :param path: The checkpoint file.
+    :type path: str
+    :param interval: The seconds between checkpoints.
+    :type interval: float
+    :param resume: Continue from the checkpoint at ``path``, if there is one.
+    :type resume: bool
+
+    """
+
+    # The array type of each field of a SessionResult.
+    typecodes = parallel.SharedResults.typecodes
+
+    def __init__(self, path, interval=60.0, resume=False):
+        self.path = path
+        self.interval = interval
+        self.resume = resume
+
+    def column_path(self, field):
+        """Return the file of the values of a field of the results."""
+        return f"{self.path}.{field}"
+
+    def load(self):
+        """Return the description and number of sessions saved, or None."""
+        try:
+            with open(self.path) as header:
+                saved = json.load(header)
+        except FileNotFoundError:
+            return None
+        return saved["description"], saved["played"]
+
+    def save(self, description, played):
+        """Write the description of a run and the number of sessions saved.
+
+        The values of those sessions must already be in the column files.
+
+        """
+        content = json.dumps({"description": description, "played": played})
+        # Write to a temporary file first so the last checkpoint is never
+        # lost to a half written one.
+        directory = os.path.dirname(os.path.abspath(self.path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(descriptor, "w") as output:
+                output.write(content)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+
+    def _saved(self, played, chunk_size):
+        """Yield the results of the first sessions saved, a chunk at a time."""
+        if not played:
+            return
+        with contextlib.ExitStack() as stack:
+            files = [
+                stack.enter_context(open(self.column_path(field), "rb"))
+                for field in model.SessionResult._fields
+            ]
+            for first in range(0, played, chunk_size):
+                chunk = list()
+                for data, typecode in zip(files, self.typecodes):
+                    column = array.array(typecode)
+                    column.fromfile(data, min(chunk_size, played - first))
+                    chunk.append(column.tolist())
+                yield model.SessionResult(*chunk)
+
+    def iter_chunks(self, simulator, samples, executor=None, seed=None):
+        """Yield the results of each chunk of ``samples`` sessions, in order.
+
+        The results are the same as those of :func:`parallel.iter_chunks`
+        with the seed, which is drawn at random, or read from the checkpoint
+        when resuming, if not given.  Each chunk played is appended to the
+        column files before it is yielded, and a last checkpoint is written
+        when the iterator ends or is closed.
+
+        :returns: An iterator of :class:`model.SessionResult` of lists.
+        :rtype: iterator
+        :raises DifferentRun: If resuming a checkpoint of a different run.
+        :raises Interrupted: If stopped by Ctrl-C, SIGINT or SIGTERM.
+        """
+        saved = self.load() if self.resume else None
+        if saved is not None:
+            description, played = saved
+            if seed is None:
+                seed = description["seed"]
+            if cache.key(description) != cache.key(cache.describe(simulator, seed)):
+                raise DifferentRun(f"{self.path} is the checkpoint of a different run.")
+        else:
+            if seed is None:
+                seed = random.SystemRandom().getrandbits(64)
+            description = cache.describe(simulator, seed)
+            played = 0
+
+        if played >= samples:
+            yield from self._saved(samples, simulator.chunk_size)
+            return
+        # The sessions of an incomplete last chunk are played again.
+        played = played // simulator.chunk_size * simulator.chunk_size
+        yield from self._saved(played, simulator.chunk_size)
+        with contextlib.ExitStack() as stack:
+            files = list()
+            for field, typecode in zip(model.SessionResult._fields, self.typecodes):
+                data = stack.enter_context(open(self.column_path(field), "ab"))
+                data.truncate(played * array.array(typecode).itemsize)
+                files.append(data)
+            self.save(description, played)
+            saved_at = time.monotonic()
+            stack.enter_context(_terminate_interrupts())
+            try:
+                for chunk in parallel.iter_chunks(
+                    simulator, samples, executor, seed, start=played
+                ):
+                    for data, typecode, values in zip(files, self.typecodes, chunk):
+                        array.array(typecode, values).tofile(data)
+                    played += len(chunk[0])
+                    if time.monotonic() - saved_at >= self.interval:
+                        for data in files:
+                            data.flush()
+                        self.save(description, played)
+                        saved_at = time.monotonic()
+                    yield chunk
+            except KeyboardInterrupt:
+                raise Interrupted(self.path, played) from None
+            finally:
+                for data in files:
+                    data.flush()
+                self.save(description, played)
+
+    def __repr__(self):
+        return (
+            self.__class__.__qualname__
+            + f"({self.path!r}, {self.interval!r}, resume={self.resume!r})"
+        )
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Compare players on common random numbers.
+
+Every player plays each session on the same sequence of winning bins.
+The spins of a session are drawn once, as far as the longest session
+needs them, and replayed to every other player.  Players that bet on
+random outcomes also draw them from the same seed.
+
+Since the players see the same luck, the difference of their results in a
+session is much less variable than the difference of two independent
+sessions, so far fewer sessions separate them.  :class:`Comparison` keeps
+the moments of every player's results and of their paired differences
+from the first player, the baseline, and reports how much smaller the
+variance of the differences is than it would be with independent spins.
+
+Sessions are played in chunks, each on its own random stream derived from
+the seed, like :func:`parallel.gather`, so the results of a seed don't
+depend on the executor.
+
+"""
+import math
+import random
+from . import model
+from . import parallel
+from . import rng
+from . import stats
+from . import wheel_builder
+
+
+class SharedSpins:
+    """The winning bin numbers of a session, replayed to every player.
+
+    Takes the place of the random number generator of a wheel.  The first
+    player to need a spin draws it, the players after it replay it.
+
+    :param seed: The seed of the spins.
+    :type seed: int
+
+    """
+
+    def __init__(self, seed=None):
+        self.random_num_gen = rng.BufferedRandom(seed)
+        self.numbers = list()
+        self.position = 0
+
+    def seed(self, seed=None):
+        self.random_num_gen.seed(seed)
+
+    def new_session(self):
+        """Forget the spins of the last session."""
+        self.numbers.clear()
+        self.position = 0
+
+    def rewind(self):
+        """Replay the spins of this session from the first."""
+        self.position = 0
+
+    def choice(self, seq):
+        """Return the item of a sequence at the next spin."""
+        if self.position == len(self.numbers):
+            self.numbers.append(self.random_num_gen.randrange(len(seq)))
+        number = self.numbers[self.position]
+        self.position += 1
+        return seq[number]
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({len(self.numbers)} spins)"
+
+
+class Comparison:
+    """The results of players on common random numbers.
+
+    Holds :class:`stats.Moments` of every field of
+    :class:`model.SessionResult` for each player in ``moments``, and of
+    the difference from the baseline, the first player, in ``differences``.
+
+    :param names: The names of the players, the baseline first.
+    :type names: list
+
+    """
+
+    fields = model.SessionResult._fields
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.moments = {
+            name: {field: stats.Moments() for field in self.fields}
+            for name in self.names
+        }
+        self.differences = {
+            name: {field: stats.Moments() for field in self.fields}
+            for name in self.names[1:]
+        }
+
+    def add(self, records):
+        """Add the results of a session, one per player in order."""
+        baseline = records[0]
+        for name, record in zip(self.names, records):
+            for field, value in zip(self.fields, record):
+                self.moments[name][field].add(value)
+        for name, record in zip(self.names[1:], records[1:]):
+            for field, value, base in zip(self.fields, record, baseline):
+                self.differences[name][field].add(value - base)
+
+    def merge(self, other):
+        """Add the sessions of another comparison of the same players."""
+        for name in self.names:
+            for field in self.fields:
+                self.moments[name][field].merge(other.moments[name][field])
+                if name in self.differences:
+                    self.differences[name][field].merge(other.differences[name][field])
+        return self
+
+    def variance_reduction(self, name, field):
+        """How many times smaller the variance of the difference is.
+
+        Compared with the variance of the difference of independent
+        sessions, the sum of the two players' variances.  It is also how
+        many times fewer sessions reach the same confidence.
+
+        """
+        independent = (
+            self.moments[name][field].variance
+            + self.moments[self.names[0]][field].variance
+        )
+        paired = self.differences[name][field].variance
+        if paired == 0:
+            return math.inf if independent > 0 else math.nan
+        return independent / paired
+
+    def rows(self):
+        """Return a row per player other than the baseline and field.
+
+        (player, field, sessions, mean, mean difference, variance of the
+        difference, standard error of the mean difference, variance
+        reduction), where the standard error is nan with fewer than two
+        sessions.
+        """
+        rows = list()
+        for name, differences in self.differences.items():
+            for field, difference in differences.items():
+                if difference.count < 2:
+                    std_error = math.nan
+                else:
+                    std_error = math.sqrt(difference.variance / difference.count)
+                rows.append(
+                    (
+                        name,
+                        field,
+                        difference.count,
+                        self.moments[name][field].mean,
+                        difference.mean,
+                        difference.variance,
+                        std_error,
+                        self.variance_reduction(name, field),
+                    )
+                )
+        return rows
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.names!r})"
+
+
+def _compare_chunk(players, table_limit, count, seed):
+    """Play ``count`` sessions of every player on common random numbers."""
+    streams = random.Random(seed)
+    spins = SharedSpins(streams.getrandbits(64))
+    player_seed = streams.getrandbits(64)
+    simulators = list()
+    for player in players.values():
+        wheel = wheel_builder.create_wheel()
+        wheel.random_num_gen = spins
+        simulator = model.Simulator(model.Game(model.Table(table_limit), wheel), player)
+        simulator._original_player.seed(player_seed)
+        simulators.append(simulator)
+
+    comparison = Comparison(players)
+    for _ in range(count):
+        spins.new_session()
+        records = list()
+        for simulator in simulators:
+            spins.rewind()
+            records.extend(simulator._sessions(1))
+        comparison.add(records)
+    return comparison
+
+
+def compare(players, samples, table_limit, executor=None, seed=None, chunk_size=1_000):
+    """Play ``samples`` sessions of every player on common random numbers.
+
+    :param players: The players by name, the baseline first.
+    :type players: dict
+    :param samples: The number of sessions per player.
+    :type samples: int
+    :param table_limit: The table limit.
+    :type table_limit: float
+    :param executor: Where to play the chunks of sessions, defaults to
+        this process.
+    :type executor: concurrent.futures.Executor
+    :param seed: The master seed.
+    :type seed: int
+    :param chunk_size: The number of sessions played on one random stream.
+    :type chunk_size: int
+    :returns: The results of the players and their differences.
+    :rtype: Comparison
+    """
+    if executor is None:
+        executor = parallel.SerialExecutor()
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    futures = [
+        executor.submit(
+            _compare_chunk,
+            players,
+            table_limit,
+            min(chunk_size, samples - start),
+            parallel.stream_seed(seed, index),
+        )
+        for index, start in enumerate(range(0, samples, chunk_size))
+    ]
+    comparison = Comparison(players)
+    for future in futures:
+        comparison.merge(future.result())
+    return comparison
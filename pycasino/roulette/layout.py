@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The layout of the standard wheel as static tables.
+
+Generated by :func:`wheel_builder.write_layout`, do not edit.
+
+"""
+# (name, odds) of every outcome.
+OUTCOMES = (
+    ("Straight 0", 35),
+    ("Straight 1", 35),
+    ("Straight 2", 35),
+    ("Straight 3", 35),
+    ("Straight 4", 35),
+    ("Straight 5", 35),
+    ("Straight 6", 35),
+    ("Straight 7", 35),
+    ("Straight 8", 35),
+    ("Straight 9", 35),
+    ("Straight 10", 35),
+    ("Straight 11", 35),
+    ("Straight 12", 35),
+    ("Straight 13", 35),
+    ("Straight 14", 35),
+    ("Straight 15", 35),
+    ("Straight 16", 35),
+    ("Straight 17", 35),
+    ("Straight 18", 35),
+    ("Straight 19", 35),
+    ("Straight 20", 35),
+    ("Straight 21", 35),
+    ("Straight 22", 35),
+    ("Straight 23", 35),
+    ("Straight 24", 35),
+    ("Straight 25", 35),
+    ("Straight 26", 35),
+    ("Straight 27", 35),
+    ("Straight 28", 35),
+    ("Straight 29", 35),
+    ("Straight 30", 35),
+    ("Straight 31", 35),
+    ("Straight 32", 35),
+    ("Straight 33", 35),
+    ("Straight 34", 35),
+    ("Straight 35", 35),
+    ("Straight 00", 35),
+    ("Split 1, 2", 17),
+    ("Split 2, 3", 17),
+    ("Split 4, 5", 17),
+    ("Split 5, 6", 17),
+    ("Split 7, 8", 17),
+    ("Split 8, 9", 17),
+    ("Split 10, 11", 17),
+    ("Split 11, 12", 17),
+    ("Split 13, 14", 17),
+    ("Split 14, 15", 17),
+    ("Split 16, 17", 17),
+    ("Split 17, 18", 17),
+    ("Split 19, 20", 17),
+    ("Split 20, 21", 17),
+    ("Split 22, 23", 17),
+    ("Split 23, 24", 17),
+    ("Split 25, 26", 17),
+    ("Split 26, 27", 17),
+    ("Split 28, 29", 17),
+    ("Split 29, 30", 17),
+    ("Split 31, 32", 17),
+    ("Split 32, 33", 17),
+    ("Split 1, 4", 17),
+    ("Split 4, 7", 17),
+    ("Split 7, 10", 17),
+    ("Split 10, 13", 17),
+    ("Split 13, 16", 17),
+    ("Split 16, 19", 17),
+    ("Split 19, 22", 17),
+    ("Split 22, 25", 17),
+    ("Split 25, 28", 17),
+    ("Split 28, 31", 17),
+    ("Split 31, 34", 17),
+    ("Split 2, 5", 17),
+    ("Split 5, 8", 17),
+    ("Split 8, 11", 17),
+    ("Split 11, 14", 17),
+    ("Split 14, 17", 17),
+    ("Split 17, 20", 17),
+    ("Split 20, 23", 17),
+    ("Split 23, 26", 17),
+    ("Split 26, 29", 17),
+    ("Split 29, 32", 17),
+    ("Split 32, 35", 17),
+    ("Split 3, 6", 17),
+    ("Split 6, 9", 17),
+    ("Split 9, 12", 17),
+    ("Split 12, 15", 17),
+    ("Split 15, 18", 17),
+    ("Split 18, 21", 17),
+    ("Split 21, 24", 17),
+    ("Split 24, 27", 17),
+    ("Split 27, 30", 17),
+    ("Split 30, 33", 17),
+    ("Split 33, 36", 17),
+    ("Column 1", 2),
+    ("Column 2", 2),
+    ("Column 3", 2),
+    ("Corner 1, 2, 4, 5", 8),
+    ("Corner 2, 3, 5, 6", 8),
+    ("Corner 4, 5, 7, 8", 8),
+    ("Corner 5, 6, 8, 9", 8),
+    ("Corner 7, 8, 10, 11", 8),
+    ("Corner 8, 9, 11, 12", 8),
+    ("Corner 10, 11, 13, 14", 8),
+    ("Corner 11, 12, 14, 15", 8),
+    ("Corner 13, 14, 16, 17", 8),
+    ("Corner 14, 15, 17, 18", 8),
+    ("Corner 16, 17, 19, 20", 8),
+    ("Corner 17, 18, 20, 21", 8),
+    ("Corner 19, 20, 22, 23", 8),
+    ("Corner 20, 21, 23, 24", 8),
+    ("Corner 22, 23, 25, 26", 8),
+    ("Corner 23, 24, 26, 27", 8),
+    ("Corner 25, 26, 28, 29", 8),
+    ("Corner 26, 27, 29, 30", 8),
+    ("Corner 28, 29, 31, 32", 8),
+    ("Corner 29, 30, 32, 33", 8),
+    ("Corner 31, 32, 34, 35", 8),
+    ("Corner 32, 33, 35, 36", 8),
+    ("First 12", 2),
+    ("Second 12", 2),
+    ("Third 12", 2),
+    ("Line 1, 2, 3, 4, 5, 6", 5),
+    ("Line 4, 5, 6, 7, 8, 9", 5),
+    ("Line 7, 8, 9, 10, 11, 12", 5),
+    ("Line 10, 11, 12, 13, 14, 15", 5),
+    ("Line 13, 14, 15, 16, 17, 18", 5),
+    ("Line 16, 17, 18, 19, 20, 21", 5),
+    ("Line 19, 20, 21, 22, 23, 24", 5),
+    ("Line 22, 23, 24, 25, 26, 27", 5),
+    ("Line 25, 26, 27, 28, 29, 30", 5),
+    ("Line 28, 29, 30, 31, 32, 33", 5),
+    ("Line 31, 32, 33, 34, 35, 36", 5),
+    ("Street 1, 2, 3", 11),
+    ("Street 4, 5, 6", 11),
+    ("Street 7, 8, 9", 11),
+    ("Street 10, 11, 12", 11),
+    ("Street 13, 14, 15", 11),
+    ("Street 16, 17, 18", 11),
+    ("Street 19, 20, 21", 11),
+    ("Street 22, 23, 24", 11),
+    ("Street 25, 26, 27", 11),
+    ("Street 28, 29, 30", 11),
+    ("Street 31, 32, 33", 11),
+    ("Street 34, 35, 36", 11),
+    ("Low", 1),
+    ("Odd", 1),
+    ("Red", 1),
+    ("Even", 1),
+    ("Black", 1),
+    ("High", 1),
+    ("Five 00-0-1-2-3", 6),
+)
+# The indices in OUTCOMES of the outcomes in each bin.
+BINS = (
+    (0, 149),
+    (1, 37, 59, 92, 95, 117, 120, 131, 143, 144, 145),
+    (2, 37, 38, 70, 93, 95, 96, 117, 120, 131, 143, 146, 147),
+    (3, 38, 81, 94, 96, 117, 120, 131, 143, 144, 145),
+    (4, 39, 59, 60, 92, 95, 97, 117, 120, 121, 132, 143, 146, 147),
+    (5, 39, 40, 70, 71, 93, 95, 96, 97, 98, 117, 120, 121, 132, 143, 144, 145),
+    (6, 40, 81, 82, 94, 96, 98, 117, 120, 121, 132, 143, 146, 147),
+    (7, 41, 60, 61, 92, 97, 99, 117, 121, 122, 133, 143, 144, 145),
+    (8, 41, 42, 71, 72, 93, 97, 98, 99, 100, 117, 121, 122, 133, 143, 146, 147),
+    (9, 42, 82, 83, 94, 98, 100, 117, 121, 122, 133, 143, 144, 145),
+    (10, 43, 61, 62, 92, 99, 101, 117, 122, 123, 134, 143, 146, 147),
+    (11, 43, 44, 72, 73, 93, 99, 100, 101, 102, 117, 122, 123, 134, 143, 144, 147),
+    (12, 44, 83, 84, 94, 100, 102, 117, 122, 123, 134, 143, 145, 146),
+    (13, 45, 62, 63, 92, 101, 103, 118, 123, 124, 135, 143, 144, 147),
+    (14, 45, 46, 73, 74, 93, 101, 102, 103, 104, 118, 123, 124, 135, 143, 145, 146),
+    (15, 46, 84, 85, 94, 102, 104, 118, 123, 124, 135, 143, 144, 147),
+    (16, 47, 63, 64, 92, 103, 105, 118, 124, 125, 136, 143, 145, 146),
+    (17, 47, 48, 74, 75, 93, 103, 104, 105, 106, 118, 124, 125, 136, 143, 144, 147),
+    (18, 48, 85, 86, 94, 104, 106, 118, 124, 125, 136, 143, 145, 146),
+    (19, 49, 64, 65, 92, 105, 107, 118, 125, 126, 137, 144, 145, 148),
+    (20, 49, 50, 75, 76, 93, 105, 106, 107, 108, 118, 125, 126, 137, 146, 147, 148),
+    (21, 50, 86, 87, 94, 106, 108, 118, 125, 126, 137, 144, 145, 148),
+    (22, 51, 65, 66, 92, 107, 109, 118, 126, 127, 138, 146, 147, 148),
+    (23, 51, 52, 76, 77, 93, 107, 108, 109, 110, 118, 126, 127, 138, 144, 145, 148),
+    (24, 52, 87, 88, 94, 108, 110, 118, 126, 127, 138, 146, 147, 148),
+    (25, 53, 66, 67, 92, 109, 111, 119, 127, 128, 139, 144, 145, 148),
+    (26, 53, 54, 77, 78, 93, 109, 110, 111, 112, 119, 127, 128, 139, 146, 147, 148),
+    (27, 54, 88, 89, 94, 110, 112, 119, 127, 128, 139, 144, 145, 148),
+    (28, 55, 67, 68, 92, 111, 113, 119, 128, 129, 140, 146, 147, 148),
+    (29, 55, 56, 78, 79, 93, 111, 112, 113, 114, 119, 128, 129, 140, 144, 147, 148),
+    (30, 56, 89, 90, 94, 112, 114, 119, 128, 129, 140, 145, 146, 148),
+    (31, 57, 68, 69, 92, 113, 115, 119, 129, 130, 141, 144, 147, 148),
+    (32, 57, 58, 79, 80, 93, 113, 114, 115, 116, 119, 129, 130, 141, 145, 146, 148),
+    (33, 58, 90, 91, 94, 114, 116, 119, 129, 130, 141, 144, 147, 148),
+    (34, 69, 92, 115, 119, 130, 142, 145, 146, 148),
+    (35, 80, 93, 115, 116, 119, 130, 142, 144, 147, 148),
+    (91, 94, 116, 119, 130, 142, 145, 146, 148),
+    (36, 149),
+)
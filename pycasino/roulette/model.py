@@ -6,22 +6,52 @@ This code was inspired by the book Building Skills in Object-Oriented Design
 by Steven Lott.
 
 """
+import collections
+import itertools
 import random
 import copy
+from . import layout
+from . import parallel
+from . import profiling
+from . import rng
+from . import stats
 
 
-# TODO: consider using a dataclass instead (python 3.7 only)
 class Outcome:
     """Represents an outcome of a spin of a wheel in roulette.
 
+    Outcomes are interned, creating an outcome with the name and odds of an
+    existing one returns the existing object.  Two equal outcomes are
+    therefore always the same object and equality is identity.  Each
+    outcome gets a dense integer ``id`` in the order it was first created,
+    which is its bit in :attr:`Bin.mask`.  Outcomes are immutable and
+    slotted, one takes 56 bytes on 64-bit CPython.
+
     :param name: The name of the outcome, e.g. "Red", "1".
     :param odds: The odds of the outcome.
 
     """
 
-    def __init__(self, name, odds):
-        self.name = name
-        self.odds = odds
+    __slots__ = ("name", "odds", "id")
+
+    _interned = dict()
+
+    def __new__(cls, name, odds):
+        key = (cls, name, odds)
+        try:
+            return cls._interned[key]
+        except KeyError:
+            outcome = super().__new__(cls)
+            object.__setattr__(outcome, "name", name)
+            object.__setattr__(outcome, "odds", odds)
+            object.__setattr__(outcome, "id", len(cls._interned))
+            return cls._interned.setdefault(key, outcome)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__qualname__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__qualname__} is immutable.")
 
     def win_amount(self, amount):
         """Calculate the amount of money won.
@@ -33,17 +63,19 @@ class Outcome:
         """
         return amount * self.odds
 
-    def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
-        else:
-            return False
-
     def __hash__(self):
-        """Make hash of name default for placing object in sets and dicts."""
-        # TODO: Hashable objects are supposed to be immutable!
+        """Make hash of name default for placing object in sets and dicts.
+
+        Outcomes are immutable and equal only to themselves, so the hash
+        never changes and agrees with equality.
+
+        """
         return hash(self.name)
 
+    def __reduce__(self):
+        """Intern copies and unpickled outcomes too."""
+        return self.__class__, (self.name, self.odds)
+
     def __str__(self):
         return f"{self.name} ({self.odds}:1)"
 
@@ -51,40 +83,239 @@ class Outcome:
         return self.__class__.__qualname__ + f"({self.name!r}, {self.odds!r})"
 
 
+class OutcomeRegistry:
+    """An immutable collection of all the outcomes of a wheel.
+
+    Outcomes can be looked up by name or by their integer :attr:`Outcome.id`.
+
+    :param outcomes: The outcomes.
+    :type outcomes: iterable
+
+    """
+
+    def __init__(self, outcomes):
+        self._outcomes = tuple(outcomes)
+        self._by_name = {outcome.name: outcome for outcome in self._outcomes}
+        self._by_id = {outcome.id: outcome for outcome in self._outcomes}
+
+    def get(self, name, default=None):
+        """Return the outcome with the name."""
+        return self._by_name.get(name, default)
+
+    def from_id(self, id_):
+        """Return the outcome with the integer id."""
+        return self._by_id[id_]
+
+    def id_of(self, outcome):
+        """Return the integer id of an outcome."""
+        return self._by_name[outcome.name].id
+
+    def values(self):
+        """Return the outcomes in the order they were given."""
+        return self._outcomes
+
+    def __getitem__(self, name):
+        return self._by_name[name]
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self._by_name)
+
+    def __len__(self):
+        return len(self._outcomes)
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self._outcomes!r})"
+
+
 class Bin:
-    """Represents a bin on a roulette wheel. A collection of :class:`Outcome`."""
+    """Represents a bin on a roulette wheel. A collection of :class:`Outcome`.
+
+    Next to the outcomes the bin keeps an integer ``mask`` with the bit
+    :attr:`Outcome.id` set for each of its outcomes, so checking whether an
+    outcome won is a single bit test.  Bins are slotted, one takes 56
+    bytes on 64-bit CPython besides its set of outcomes.
+
+    """
 
-    def __init__(self):
-        self.outcomes = frozenset()
+    __slots__ = ("_members", "_outcomes", "mask")
+
+    def __init__(self, outcomes=()):
+        self._members = set(outcomes)
+        self._outcomes = None
+        self.mask = 0
+        for outcome in self._members:
+            self.mask |= 1 << outcome.id
+
+    @property
+    def outcomes(self):
+        """The outcomes of the bin, as a frozenset."""
+        if self._outcomes is None:
+            self._outcomes = frozenset(self._members)
+        return self._outcomes
 
     def add(self, outcome):
         """Add an outcome to the outcomes."""
-        self.outcomes = self.outcomes.union({outcome})
+        self._members.add(outcome)
+        self._outcomes = None
+        self.mask |= 1 << outcome.id
         return self
 
+    def __contains__(self, outcome):
+        return bool(self.mask >> outcome.id & 1)
+
     def __repr__(self):
         return self.__class__.__qualname__ + f"({self.outcomes!r})"
 
 
+class SpinHistory:
+    """The winning outcomes of recent spins, with counters kept up to date.
+
+    The outcomes of the last ``size`` spins are kept in a ring buffer.  For
+    each tracked outcome the history counts the spins in a row it has won
+    (``streaks``), how often it won in the buffered spins (``recent``) and
+    in all spins (``totals``).  Adding a spin takes constant time.
+
+    :param size: The number of spins to remember.
+    :type size: int
+    :param tracked: The outcomes to keep counters for.
+    :type tracked: iterable
+
+    """
+
+    def __init__(self, size=0, tracked=()):
+        self.spins = collections.deque(maxlen=size)
+        self.streaks = dict.fromkeys(tracked, 0)
+        self.recent = dict.fromkeys(tracked, 0)
+        self.totals = dict.fromkeys(tracked, 0)
+        self.count = 0
+
+    def add(self, outcomes):
+        """Add the winning outcomes of a spin."""
+        spins = self.spins
+        if spins.maxlen and len(spins) == spins.maxlen:
+            for outcome in spins[0]:
+                if outcome in self.recent:
+                    self.recent[outcome] -= 1
+        if spins.maxlen:
+            spins.append(outcomes)
+        for outcome in self.streaks:
+            if outcome in outcomes:
+                self.streaks[outcome] += 1
+                self.totals[outcome] += 1
+                if spins.maxlen:
+                    self.recent[outcome] += 1
+            else:
+                self.streaks[outcome] = 0
+        self.count += 1
+
+    def snapshot(self):
+        """Remember the current state, :meth:`reset` returns to it."""
+        self._snapshot = (
+            list(self.spins),
+            dict(self.streaks),
+            dict(self.recent),
+            dict(self.totals),
+            self.count,
+        )
+
+    def reset(self):
+        """Return to the state remembered by :meth:`snapshot`, in place."""
+        spins, streaks, recent, totals, self.count = self._snapshot
+        self.spins.clear()
+        self.spins.extend(spins)
+        self.streaks.update(streaks)
+        self.recent.update(recent)
+        self.totals.update(totals)
+
+    def __len__(self):
+        return len(self.spins)
+
+    def __repr__(self):
+        return (
+            self.__class__.__qualname__
+            + f"({self.spins.maxlen!r}, {tuple(self.streaks)!r})"
+        )
+
+
+def _standard_layout():
+    """Return the bins and outcomes of the standard wheel, built once.
+
+    They are built from the static tables in :mod:`layout` the first time
+    they are needed and then shared by every standard wheel.  Processes
+    forked afterwards inherit them instead of building their own.
+
+    """
+    global _standard
+    if _standard is None:
+        outcomes = [Outcome(name, odds) for name, odds in layout.OUTCOMES]
+        bins = tuple(Bin(outcomes[i] for i in members) for members in layout.BINS)
+        for bin_ in bins:
+            bin_.outcomes  # Freeze the outcomes before the bins are shared.
+        _standard = bins, {outcome.name: outcome for outcome in outcomes}
+    return _standard
+
+
+_standard = None
+
+
 class _Wheel:
-    """Represents a roulette wheel.  Contains :class:`Bin`s."""
+    """Represents a roulette wheel.  Contains :class:`Bin`s.
+
+    A wheel made by :meth:`standard` shares its bins and outcomes with
+    every other standard wheel and only has a random number generator of
+    its own.  Adding an outcome to it first gives it private copies of
+    the bins.  Copies and unpickled standard wheels share them too.
+
+    :param bins: The bins, 38 empty ones by default.
+    :type bins: tuple
+    :param all_outcomes: The outcomes in the bins by name.
+    :type all_outcomes: dict
 
-    def __init__(self):
-        self.bins = tuple(Bin() for i in range(38))
-        self.random_num_gen = random.Random()
+    """
+
+    def __init__(self, bins=None, all_outcomes=None):
+        self._shared = False
+        self.bins = tuple(Bin() for i in range(38)) if bins is None else bins
+        self.random_num_gen = rng.BufferedRandom()
         # TODO: The books says this is where all_outcomes should be.
         # But we need a populated instance of Wheel to use the attribute
         # Which is clumsy.
-        self.all_outcomes = dict()
+        self.all_outcomes = dict() if all_outcomes is None else all_outcomes
+
+    @classmethod
+    def standard(cls):
+        """Return a wheel with the shared bins of the standard layout."""
+        wheel = cls(*_standard_layout())
+        wheel._shared = True
+        return wheel
 
     def __getitem__(self, index):
         return self.bins[index]
 
     def add_outcome(self, bin_number, outcome):
         """Add an outcome to the bin with the bin_number index."""
+        if self._shared:
+            self.bins = tuple(Bin(bin_.outcomes) for bin_ in self.bins)
+            self.all_outcomes = dict(self.all_outcomes)
+            self._shared = False
         self.bins[bin_number].add(outcome)
         self.all_outcomes[outcome.name] = outcome
 
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        if self._shared:
+            # Copies attach to the shared bins rather than carry their own.
+            del state["bins"], state["all_outcomes"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._shared:
+            self.bins, self.all_outcomes = _standard_layout()
+
     def spin(self):
         """Return a randomly selected Bin."""
         # Note: Steven Lott named this 'next' but that is for another purpose.
@@ -102,8 +333,12 @@ class Bet:
     :param outcome: The outcome to bet upon.
     :type outcome: Outcome.
 
+    Bets are slotted, one takes 48 bytes on 64-bit CPython.
+
     """
 
+    __slots__ = ("amount_bet", "outcome")
+
     def __init__(self, amount, outcome):
         self.amount_bet = float(amount)
         self.outcome = outcome
@@ -130,28 +365,81 @@ class Bet:
 class Table:
     """Contains all the bets created by the player.
 
+    The bets are kept in a buffer of slots that is reused from cycle to
+    cycle: clearing the table only resets the number of bets, and the
+    total of the bets is kept up to date as they are placed, so checking
+    the table limit never sums the bets.
+
     :param limit: The maximum permitted total bet on the table.
     :type limit: float
     :param bets: Bets to place on the table.
     :type bets: list
+    :raises TypeError: If the bets aren't iterable, like a single bet.
 
     """
 
     def __init__(self, limit, bets=None):
         self.limit = limit
-        if bets:
+        self._slots = list()
+        self._count = 0
+        self.total = 0.0
+        if bets is not None:
             self.bets = bets
-        else:
-            self.bets = list()
+
+    @property
+    def bets(self):
+        """A list of the bets on the table.
+
+        Assigning bets replaces those on the table, unless they are
+        invalid.
+
+        """
+        return self._slots[: self._count]
+
+    @bets.setter
+    def bets(self, bets):
+        bets = list(bets)
+        count, total = self._count, self.total
+        self.clear_bets()
+        try:
+            self.place_bets(bets)
+        except InvalidBet:
+            self._count, self.total = count, total
+            raise
 
     def place_bet(self, bet):
         """Add this bet to the list of working bets.
 
         :param bet: A bet to place.
         :type bet: Bet
+        :raises InvalidBet: If the bet takes the total above the table limit.
+
+        """
+        total = self.total + bet.amount_bet
+        if total > self.limit:
+            raise InvalidBet("The sum of the bets is above the table maximum.")
+        if self._count < len(self._slots):
+            self._slots[self._count] = bet
+        else:
+            self._slots.append(bet)
+        self._count += 1
+        self.total = total
+
+    def place_bets(self, bets):
+        """Add several bets, either all of them or none.
+
+        :param bets: The bets to place.
+        :type bets: list
+        :raises InvalidBet: If the bets take the total above the table limit.
 
         """
-        self.bets.append(bet)
+        total = self.total
+        for bet in bets:
+            total += bet.amount_bet
+        if total > self.limit:
+            raise InvalidBet("The sum of the bets is above the table maximum.")
+        for bet in bets:
+            self.place_bet(bet)
 
     def is_valid(self):
         """Check the bets on the table.
@@ -160,17 +448,24 @@ class Table:
         The total off all bets on the table must not surpass the table limit.
 
         """
-        if sum([bet.amount_bet for bet in self.bets]) > self.limit:
+        if self.total > self.limit:
             raise InvalidBet("The sum of the bets is above the table maximum.")
 
     def clear_bets(self):
         """Clear bets off of the table."""
-        self.bets = list()
+        self._count = 0
+        self.total = 0.0
 
     def __iter__(self):
-        """Provide iterator functionality."""
-        for bet in self.bets[:]:
-            yield bet
+        """Provide iterator functionality.
+
+        Bets placed while iterating are not included.
+
+        """
+        return itertools.islice(self._slots, self._count)
+
+    def __len__(self):
+        return self._count
 
     def __str__(self):
         return str(self.bets)
@@ -188,6 +483,9 @@ class Game:
 
     """
 
+    # A profiling.PhaseTimes that times the phases of each cycle, if set.
+    profiler = None
+
     def __init__(self, table, wheel):
         self.table = table
         self.wheel = wheel
@@ -195,67 +493,300 @@ class Game:
     def cycle(self, player):
         """Execute a single cycle of play with a given :class:`Player`."""
         if player.playing:
+            timer = profiling.timer(self.profiler, player)
             player.place_bets(self.table)
+            timer.lap("place_bets")
             self.table.is_valid()  # TODO: Won't this raise an unhandled exception?
+            timer.lap("is_valid")
             winning_bin = self.wheel.spin()
+            timer.lap("spin")
+            winners = winning_bin.mask
             for bet in self.table:
-                if bet.outcome in winning_bin.outcomes:
+                if winners >> bet.outcome.id & 1:
                     player.win(bet)
                 else:
                     player.lose()
-            self.table.clear_bets()
+            timer.lap("settle")
             player.track_last_winning_outcomes(
                 winning_bin.outcomes
             )  # TODO: Is there a better way?
+            timer.lap("track")
         self.table.clear_bets()
 
     def __repr__(self):
         return self.__class__.__qualname__ + f"({self.table!r}, {self.wheel!r})"
 
 
+SessionResult = collections.namedtuple(
+    "SessionResult", ["maximum", "duration", "final", "drawdown", "ruined"]
+)
+SessionResult.__doc__ = """The results of a session.
+
+The maximum stake, the rounds played, the final stake, the largest drop of
+the stake from a previous high and whether the player went broke.
+
+"""
+
+
 class Simulator:
     """Collects roulette simulation statistics.
 
+    The maximum stake and rounds played of every session are kept in
+    ``maxima`` and ``durations``, while ``stats`` summarizes the results of
+    the latest run in constant memory, see :class:`stats.SessionStats`.
+
     :param game: An instance of :class:`Game`.
     :type game: Game
     :param player: An instance of :class:`Player`.
     :type player: Player
+    :param rng_backend: The backend of the random numbers of the wheel and
+        the player, see :mod:`rng`, ``None`` keeps theirs.
+    :type rng_backend: str
 
     """
 
+    # The number of sessions played on one random stream by gather.
+    chunk_size = 1_000
+
+    # A profiling.PhaseTimes, set by profile.
+    profiler = None
+
     # TODO: Maybe we need a player factory.  Then maybe we wouldn't need to pass in a fully initialized player.
     # We could instead pass in the class of the player or it's name and a configuration and the player would be created.
-    def __init__(self, game, player):
+    def __init__(self, game, player, rng_backend=None):
 
+        if rng_backend is not None:
+            game.wheel.random_num_gen = rng.BufferedRandom(backend=rng_backend)
+            player.use_rng_backend(rng_backend)
         self.game = game
         # This player will be used to produce fresh players
         self._original_player = copy.deepcopy(player)
+        self._fresh_player = None
         self.player = player
         self.durations = list()
         self.maxima = list()
+        self.stats = self._new_stats()
+
+    def _new_stats(self):
+        """Return empty statistics for a new run."""
+        return stats.SessionStats(rounds=self._original_player.rounds)
 
     def _recreate_player(self):
-        """Create a duplicate of the original player."""
-        plr_copy = copy.deepcopy(self._original_player)
-        return plr_copy
+        """Return a player in the state of the original player.
+
+        A player supporting the reset protocol is copied once and reset in
+        place for every later session, other players are deep copied.
+
+        """
+        if not getattr(self._original_player, "resettable", False):
+            return copy.deepcopy(self._original_player)
+        if self._fresh_player is None:
+            self._fresh_player = copy.deepcopy(self._original_player)
+            self._fresh_player.snapshot()
+        else:
+            self._fresh_player.reset()
+        return self._fresh_player
 
     def _session(self):
         """Execute a single game session."""
+        timer = profiling.timer(self.profiler, self._original_player)
         self.player = self._recreate_player()
+        timer.lap("reset_player")
         stake_vals = [self.player.stake]
         while self.player.playing:
             self.game.cycle(self.player)
             stake_vals.append(self.player.stake)
+        timer.total("session")
         return stake_vals
 
-    def gather(self, samples):
-        """Execute n samples of game sessions."""
+    def _sessions(self, samples):
+        """Execute n samples of game sessions, yielding their results."""
         for _ in range(samples):
             stakes = self._session()
-            self.maxima.append(max(stakes))
-            self.durations.append(
-                len(stakes) - 1
-            )  # -1 because stakes includes starting stake
+            peak, drawdown = stakes[0], 0.0
+            for stake in stakes:
+                peak = max(peak, stake)
+                drawdown = max(drawdown, peak - stake)
+            # -1 because stakes includes starting stake
+            yield SessionResult(
+                peak, len(stakes) - 1, stakes[-1], drawdown, self.player.ruined
+            )
+
+    def _play(self, samples):
+        """Execute n samples of game sessions.
+
+        :returns: A :class:`SessionResult` of lists, one item per session.
+        :rtype: SessionResult
+        """
+        columns = SessionResult(*(list() for _ in SessionResult._fields))
+        for record in self._sessions(samples):
+            for column, value in zip(columns, record):
+                column.append(value)
+        return columns
+
+    def _spawn(self):
+        """Create a simulator like this one, with no results of its own.
+
+        If this simulator is profiled, so is the new one, with its own
+        empty :class:`profiling.PhaseTimes`.
+
+        """
+        spawned = self.__class__(copy.deepcopy(self.game), self._original_player)
+        if self.profiler is not None:
+            spawned.profile(profiling.PhaseTimes())
+        return spawned
+
+    def profile(self, profiler):
+        """Time the phases of every session and cycle played from now on.
+
+        :param profiler: Where to record the times, ``None`` stops profiling.
+        :type profiler: profiling.PhaseTimes
+        """
+        self.profiler = profiler
+        self.game.profiler = profiler
+
+    def seed(self, seed):
+        """Seed the wheel and the player so sessions can be reproduced."""
+        streams = random.Random(seed)
+        self.game.wheel.random_num_gen.seed(streams.getrandbits(64))
+        self._original_player.seed(streams.getrandbits(64))
+
+    def gather(
+        self, samples, executor=None, seed=None, cache=None, stop=None, checkpoint=None
+    ):
+        """Execute n samples of game sessions.
+
+        Passing an executor or a seed plays the sessions in chunks, each
+        on its own random stream derived from the seed, see
+        :mod:`parallel`.  The results for a seed do not depend on the
+        executor.
+
+        :param samples: The number of sessions, at most if stopping early.
+        :type samples: int
+        :param executor: Where to play the chunks of sessions.
+        :type executor: concurrent.futures.Executor
+        :param seed: The master seed.
+        :type seed: int
+        :param cache: Where to read and keep the results of seeded runs.
+        :type cache: cache.ResultCache
+        :param stop: Stop early, see :meth:`iter_sessions`.
+        :type stop: stats.StoppingRule
+        :param checkpoint: Where and how often to save the results so far,
+            see :mod:`checkpoint`.
+        :type checkpoint: checkpoint.Checkpoint
+        :raises ValueError: If a cache is given without a seed.
+        :raises checkpoint.Interrupted: If a checkpointed run is stopped,
+            after adding the sessions played.
+        """
+        if stop is not None or checkpoint is not None:
+            sessions = self.iter_sessions(
+                samples, executor, seed, cache, stop, checkpoint
+            )
+            for record in sessions:
+                self.maxima.append(record.maximum)
+                self.durations.append(record.duration)
+            return
+        self.stats = self._new_stats()
+        if cache is not None:
+            if seed is None:
+                raise ValueError("Only seeded runs can be cached.")
+            columns = cache.gather(self, samples, seed, executor)
+        elif executor is None and seed is None:
+            columns = self._play(samples)
+        else:
+            columns = parallel.gather(self, samples, executor, seed)
+        self.maxima.extend(columns.maximum)
+        self.durations.extend(columns.duration)
+        for record in zip(*columns):
+            self.stats.add(SessionResult(*record))
+
+    def iter_sessions(
+        self, samples, executor=None, seed=None, cache=None, stop=None, checkpoint=None
+    ):
+        """Execute n samples of game sessions, yielding each result.
+
+        Unlike :meth:`gather` only :attr:`stats` is updated, afresh for
+        every run, the results are yielded as :class:`SessionResult`
+        records as soon as their sessions finish.  The executor and seed
+        work as they do in :meth:`gather` and give the same results.
+
+        Passing a stopping rule plays the sessions in batches of
+        :attr:`chunk_size` and asks the rule after each batch whether
+        :attr:`stats` are precise enough, so a seeded run that stops early
+        plays the first sessions of a run that doesn't.
+
+        :param samples: The number of sessions, at most if stopping early,
+            where ``None`` plays until the rule says to stop.
+        :type samples: int
+        :param executor: Where to play the chunks of sessions.
+        :type executor: concurrent.futures.Executor
+        :param seed: The master seed.
+        :type seed: int
+        :param cache: Where to read and keep the results of seeded runs.
+        :type cache: cache.ResultCache
+        :param stop: When to stop playing early.
+        :type stop: stats.StoppingRule
+        :param checkpoint: Where and how often to save the results so far,
+            see :mod:`checkpoint`.
+        :type checkpoint: checkpoint.Checkpoint
+        :raises ValueError: If a cache is given without a seed or with a
+            stopping rule or checkpoint, a checkpoint with a stopping rule,
+            or neither a number of sessions nor a rule.
+        :raises checkpoint.Interrupted: If a checkpointed run is stopped,
+            after yielding the sessions played.
+        """
+        if stop is not None:
+            if cache is not None:
+                raise ValueError("Runs that stop early can't be cached.")
+            if checkpoint is not None:
+                raise ValueError("Runs that stop early can't be checkpointed.")
+            stop.start()
+        elif samples is None:
+            raise ValueError("Playing without a number of sessions needs a rule.")
+        self.stats = self._new_stats()
+        if checkpoint is not None:
+            if cache is not None:
+                raise ValueError("Checkpointed runs can't be cached.")
+            records = (
+                SessionResult(*record)
+                for columns in checkpoint.iter_chunks(self, samples, executor, seed)
+                for record in zip(*columns)
+            )
+        elif cache is not None:
+            if seed is None:
+                raise ValueError("Only seeded runs can be cached.")
+            records = (
+                SessionResult(*record)
+                for record in zip(*cache.gather(self, samples, seed, executor))
+            )
+        elif executor is None and seed is None and samples is None:
+            records = (
+                record
+                for _ in itertools.count()
+                for record in self._sessions(self.chunk_size)
+            )
+        elif executor is None and seed is None:
+            records = self._sessions(samples)
+        else:
+            records = (
+                SessionResult(*record)
+                for columns in parallel.iter_chunks(self, samples, executor, seed)
+                for record in zip(*columns)
+            )
+        played = 0
+        try:
+            for record in records:
+                self.stats.add(record)
+                yield record
+                played += 1
+                if (
+                    stop is not None
+                    and not played % self.chunk_size
+                    and stop(self.stats)
+                ):
+                    return
+        finally:
+            records.close()
 
     def __repr__(self):
         return self.__class__.__qualname__ + f"({self.game!r}, {self.player!r})"
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Play the sessions of a simulator in parallel.
+
+The samples are split into chunks of ``simulator.chunk_size`` sessions.
+Each chunk is played by a fresh copy of the simulator seeded with its own
+random stream, derived from a master seed and the chunk's index.  Since
+neither the chunks nor their streams depend on the executor, a seed gives
+the same results with any number of workers.
+
+Workers write their results straight into shared memory arrays rather
+than sending them back to the parent.
+
+"""
+import array
+import collections
+import concurrent.futures
+import hashlib
+import itertools
+import random
+import signal
+import sys
+from . import model
+
+
+def stream_seed(seed, index):
+    """Return the seed of the independent random stream number ``index``."""
+    digest = hashlib.sha256(f"{seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class SerialExecutor(concurrent.futures.Executor):
+    """An executor that runs each call as soon as it is submitted."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _ignore_interrupts():
+    """Leave Ctrl-C to the parent process, which stops the workers."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def default_executor(workers):
+    """Return an executor for a number of workers.
+
+    Threads are only used on free-threaded builds of CPython, where they
+    actually run in parallel.  Everywhere else processes are used.
+
+    """
+    if workers <= 1:
+        return SerialExecutor()
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    if gil_enabled:
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_ignore_interrupts
+        )
+    return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+
+class SharedResults:
+    """The results of ``samples`` sessions in shared memory.
+
+    Each field of :class:`model.SessionResult` is an array in a block of
+    shared memory.
+
+    :param samples: The number of sessions.
+    :type samples: int
+    :param names: The names of existing blocks to attach to.
+    :type names: tuple
+
+    """
+
+    # The array type of each field of a SessionResult.
+    typecodes = ("d", "q", "d", "d", "b")
+
+    def __init__(self, samples, names=None):
+        # Imported here as it is slow to import and only gather needs it.
+        from multiprocessing import shared_memory
+
+        self.samples = samples
+        self._owner = names is None
+        self._blocks = list()
+        self.columns = list()
+        try:
+            for index, typecode in enumerate(self.typecodes):
+                if self._owner:
+                    # Every type is at most 8 bytes, and an empty block
+                    # can't be cast, so there is always room for one.
+                    size = 8 * max(samples, 1)
+                    block = shared_memory.SharedMemory(create=True, size=size)
+                else:
+                    block = shared_memory.SharedMemory(names[index])
+                self._blocks.append(block)
+                self.columns.append(block.buf.cast(typecode))
+        except BaseException:
+            # Don't leak the blocks made before the failure.
+            self.close()
+            raise
+
+    @property
+    def names(self):
+        return tuple(block.name for block in self._blocks)
+
+    def write(self, start, columns):
+        """Write the results of consecutive sessions beginning at ``start``."""
+        for column, values, typecode in zip(self.columns, columns, self.typecodes):
+            end = start + len(values)
+            column[start:end] = array.array(typecode, values)
+
+    def read(self):
+        """Return the results as lists, one per field."""
+        return tuple(column[: self.samples].tolist() for column in self.columns)
+
+    def close(self):
+        """Release the arrays, and free the memory if this process made it."""
+        for column in self.columns:
+            column.release()
+        for block in self._blocks:
+            block.close()
+            if self._owner:
+                block.unlink()
+
+
+def _play_spawned(simulator, count, seed):
+    """Play one chunk with a fresh simulator.
+
+    :returns: The results and the phase times of the chunk, if profiled.
+    :rtype: tuple
+    """
+    simulator.seed(seed)
+    return simulator._play(count), simulator.profiler
+
+
+def _play_chunk(simulator, names, samples, start, count, seed):
+    """Play one chunk with a fresh simulator and store its results.
+
+    :returns: The phase times of the chunk, if profiled.
+    :rtype: profiling.PhaseTimes
+    """
+    columns, profiler = _play_spawned(simulator, count, seed)
+    results = SharedResults(samples, names)
+    try:
+        results.write(start, columns)
+    finally:
+        results.close()
+    return profiler
+
+
+def _merge_profile(simulator, profiler):
+    """Add the phase times of a chunk to those of the simulator."""
+    if simulator.profiler is not None and profiler is not None:
+        simulator.profiler.merge(profiler)
+
+
+def gather(simulator, samples, executor=None, seed=None, start=0):
+    """Play ``samples`` sessions of a simulator in chunks.
+
+    Passing ``start`` plays only the sessions from ``start`` on, exactly
+    as they would be played in a run from the first session, which
+    extends an earlier run of ``start`` sessions.
+
+    :param simulator: The simulator whose sessions to play.
+    :param samples: The number of sessions.
+    :type samples: int
+    :param executor: Where to play the chunks, defaults to this process.
+    :type executor: concurrent.futures.Executor
+    :param seed: The master seed, defaults to a random one.
+    :type seed: int
+    :param start: The first session to play, a multiple of the chunk size.
+    :type start: int
+    :returns: A :class:`model.SessionResult` of lists of the sessions
+        from ``start`` on.
+    :rtype: SessionResult
+    """
+    if executor is None:
+        executor = SerialExecutor()
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if start % simulator.chunk_size:
+        raise ValueError("Runs can only be extended from a whole chunk.")
+
+    if samples <= start:
+        return model.SessionResult(*(list() for _ in SharedResults.typecodes))
+
+    results = SharedResults(samples - start)
+    futures = list()
+    try:
+        for first in range(start, samples, simulator.chunk_size):
+            futures.append(
+                executor.submit(
+                    _play_chunk,
+                    simulator._spawn(),
+                    results.names,
+                    samples - start,
+                    first - start,
+                    min(simulator.chunk_size, samples - first),
+                    stream_seed(seed, first // simulator.chunk_size),
+                )
+            )
+        for future in futures:
+            _merge_profile(simulator, future.result())
+        return model.SessionResult(*results.read())
+    except BaseException:
+        # Don't leave the executor playing chunks nobody will read.
+        for future in futures:
+            future.cancel()
+        raise
+    finally:
+        results.close()
+
+
+def iter_chunks(simulator, samples, executor=None, seed=None, window=8, start=0):
+    """Yield the results of each chunk, in order, as soon as they are ready.
+
+    The chunks and their random streams are the same as in :func:`gather`,
+    and so is ``start``.
+    At most ``window`` chunks are in flight at once so memory stays bounded
+    however many samples are played, and the chunks still in flight are
+    cancelled if the iterator is closed early.  Each chunk in flight is
+    written into its own block of shared memory, which is read and reused
+    once the chunk is yielded.  A serial executor plays each chunk only
+    once it is asked for.
+
+    :param samples: The number of sessions, ``None`` for no end.
+    :type samples: int
+    :returns: An iterator of :class:`model.SessionResult` of lists.
+    :rtype: iterator
+    """
+    if executor is None:
+        executor = SerialExecutor()
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if start % simulator.chunk_size:
+        raise ValueError("Runs can only be extended from a whole chunk.")
+    if isinstance(executor, SerialExecutor):
+        window = 1
+    if samples is None:
+        firsts = itertools.count(start, simulator.chunk_size)
+    else:
+        firsts = range(start, samples, simulator.chunk_size)
+
+    blocks, free = list(), list()
+    pending = collections.deque()
+    try:
+        for first in firsts:
+            count = simulator.chunk_size
+            if samples is not None:
+                count = min(count, samples - first)
+            if not free:
+                blocks.append(SharedResults(simulator.chunk_size))
+                free.append(blocks[-1])
+            results = free.pop()
+            future = executor.submit(
+                _play_chunk,
+                simulator._spawn(),
+                results.names,
+                results.samples,
+                0,
+                count,
+                stream_seed(seed, first // simulator.chunk_size),
+            )
+            pending.append((future, results, count))
+            if len(pending) >= window:
+                yield _collect(simulator, *pending.popleft(), free)
+        while pending:
+            yield _collect(simulator, *pending.popleft(), free)
+    finally:
+        for future, _, _ in pending:
+            future.cancel()
+        for results in blocks:
+            results.close()
+
+
+def _collect(simulator, future, results, count, free):
+    """Return the results of a chunk, keeping its phase times.
+
+    The block of the chunk is then free for another.
+
+    """
+    _merge_profile(simulator, future.result())
+    columns = model.SessionResult(
+        *(column[:count].tolist() for column in results.columns)
+    )
+    free.append(results)
+    return columns
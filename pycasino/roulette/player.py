@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import abc
-import random
 import inspect
 from . import model
+from . import registry
+from . import rng
+from . import strategy
 from . import wheel_builder
 
 
-# Players accessible via the CLI
-REGISTERED_PLAYERS = {}
+# Players accessible via the CLI, see registry.  The built-in players are
+# registered by their import paths in registry.BUILTIN_PLAYERS so they can
+# be named without importing this module, register_player adds others.
+REGISTERED_PLAYERS = registry.PLAYERS
 
 
 def register_player(cli_name):
@@ -70,13 +74,38 @@ class Player(abc.ABC):
     :param rounds: Number of spins of the wheel to stay at the table.
     :type rounds: int
 
+    The winning outcomes of past spins are kept in ``history``, a
+    :class:`model.SpinHistory` that remembers the last ``history_size``
+    spins and keeps streak and hit counters for the ``tracked_outcomes``.
+    Subclasses raise ``history_size`` when they need to look further back.
+
+    Players support a reset protocol: :meth:`snapshot` remembers the
+    player's state and :meth:`reset` returns to it in place, which is much
+    cheaper than a deep copy.  The state is the attributes named in the
+    ``_reset_fields`` of the class and all its bases.  A class opts in by
+    setting ``_reset_fields`` in its own body, even when it adds no state,
+    so subclasses that don't are never reset with missing state.
+
+    Players are slotted and the registered ones have no ``__dict__``, a
+    Martingale player takes 80 bytes on 64-bit CPython besides its
+    history.  Subclasses declare ``__slots__`` for their own attributes to
+    stay that way.
+
     """
 
+    __slots__ = ("stake", "base_bet_amount", "rounds", "history", "_snapshot")
+    _reset_fields = ("stake", "rounds", "history")
+    history_size = 0
+    tracked_outcomes = ("Red", "Black", "Even", "Odd", "High", "Low")
+
     def __init__(self, stake=100.0, base_bet_amount=10.0, rounds=250):
         self.stake = float(stake)
         self.base_bet_amount = float(base_bet_amount)
         self.rounds = rounds
-        self._winners = list()
+        self.history = model.SpinHistory(
+            self.history_size,
+            [wheel_builder.get_outcome(name) for name in self.tracked_outcomes],
+        )
 
     def _post_init(self, **kwargs):
         """This is a hook into the superclass init method.
@@ -89,6 +118,39 @@ class Player(abc.ABC):
         """
         pass
 
+    @property
+    def resettable(self):
+        """Returns True if the class of the player supports the reset protocol."""
+        return "_reset_fields" in type(self).__dict__
+
+    def _state_fields(self):
+        return [
+            name
+            for cls in reversed(type(self).__mro__)
+            for name in cls.__dict__.get("_reset_fields", ())
+        ]
+
+    def snapshot(self):
+        """Remember the current state, :meth:`reset` returns to it."""
+        self._snapshot = list()
+        for name in self._state_fields():
+            value = getattr(self, name)
+            if isinstance(value, list):
+                value = list(value)
+            elif hasattr(value, "reset"):
+                value.snapshot()
+            self._snapshot.append((name, value))
+
+    def reset(self):
+        """Return to the state remembered by :meth:`snapshot`, in place."""
+        for name, value in self._snapshot:
+            if isinstance(value, list):
+                getattr(self, name)[:] = value
+            elif hasattr(value, "reset"):
+                value.reset()
+            else:
+                setattr(self, name, value)
+
     @property
     def bet_amount(self):
         return self.base_bet_amount
@@ -103,6 +165,11 @@ class Player(abc.ABC):
         else:
             return True
 
+    @property
+    def ruined(self):
+        """Returns True when the stake can no longer cover the next bet."""
+        return self.stake <= self.bet_amount
+
     @abc.abstractmethod
     def _determine_bets(self):
         """Return the next bets.
@@ -113,15 +180,31 @@ class Player(abc.ABC):
         pass
 
     def place_bets(self, table):
-        """Update the table with bets."""
-        bets = list(self._determine_bets())
+        """Update the table with bets.
+
+        The stake only pays for the bets once the table took all of them.
+
+        :raises InvalidBet: If the bets are above the table limit, leaving
+            the stake and the table as they were.
+        """
+        bets = self._determine_bets()
         for bet in bets:
             bet.amount_bet = min(bet.amount_bet, table.limit)
-            table.place_bet(bet)
+        table.place_bets(bets)
+        for bet in bets:
             self.stake -= bet.lose_amount
 
+    def seed(self, seed):
+        """Seed the random number generators of the player, if any."""
+        pass
+
+    def use_rng_backend(self, backend):
+        """Draw any random numbers of the player with a backend of :mod:`rng`."""
+        pass
+
     def track_last_winning_outcomes(self, outcomes):
-        [self._winners.append(outcome) for outcome in outcomes]
+        """Add the winning outcomes of a spin to the history."""
+        self.history.add(outcomes)
 
     def win_hook(self):
         pass
@@ -141,6 +224,98 @@ class Player(abc.ABC):
         self.lose_hook()
 
 
+@delegates()
+class StrategyPlayer(Player):
+    """A player that follows the compiled tables of a :class:`strategy.Strategy`.
+
+    Subclasses set ``tables`` and the name of their ``strategy``, see
+    :func:`strategy_player`.  The player's ``state`` is the number of its
+    current state in the tables.
+
+    """
+
+    __slots__ = ("state",)
+    _reset_fields = ("state",)
+    strategy = None
+    tables = None
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.state = self.tables.initial
+
+    @property
+    def bet_amount(self):
+        return self.base_bet_amount * self.tables.multipliers[self.state]
+
+    def _determine_bets(self):
+        return [model.Bet(self.bet_amount, self.tables.outcomes[self.state])]
+
+    def win_hook(self):
+        self.state = self.tables.on_win[self.state]
+
+    def lose_hook(self):
+        self.state = self.tables.on_loss[self.state]
+
+    def __reduce_ex__(self, protocol):
+        # Classes are pickled by reference, so players of a class made by
+        # strategy_player are pickled with its name and tables instead.
+        reduced = super().__reduce_ex__(protocol)
+        cls = type(self)
+        if protocol < 2 or _STRATEGY_PLAYERS.get((cls.strategy, cls.tables)) is not cls:
+            return reduced
+        return (_new_strategy_player, (cls.strategy, cls.tables)) + reduced[2:]
+
+
+# The classes made by strategy_player, by their name and tables, so the
+# copies of a player, pickled or not, share its class.
+_STRATEGY_PLAYERS = dict()
+
+
+def strategy_player(name, tables):
+    """Make a :class:`StrategyPlayer` class that follows compiled tables.
+
+    :param name: The name of the strategy.
+    :type name: str
+    :param tables: The tables to follow.
+    :type tables: strategy.Tables
+    :returns: The new player class.
+    """
+    try:
+        return _STRATEGY_PLAYERS[name, tables]
+    except KeyError:
+        pass
+    player_cls = type(
+        f"StrategyPlayer[{name}]",
+        (StrategyPlayer,),
+        {
+            "__module__": __name__,
+            "__slots__": (),
+            "_reset_fields": (),
+            "strategy": name,
+            "tables": tables,
+        },
+    )
+    return _STRATEGY_PLAYERS.setdefault((name, tables), player_cls)
+
+
+def _new_strategy_player(name, tables):
+    """Return an uninitialized player of a strategy, for unpickling."""
+    player_cls = strategy_player(name, tables)
+    return player_cls.__new__(player_cls)
+
+
+def register_strategy(cli_name, definition):
+    """Make and register a :class:`StrategyPlayer` of a strategy.
+
+    :param cli_name: The name of the player in the CLI.
+    :type cli_name: str
+    :param definition: The strategy to follow.
+    :type definition: strategy.Strategy
+    :returns: The new player class.
+    """
+    return register_player(cli_name)(strategy_player(cli_name, definition.compile()))
+
+
 # TODO: should this be a fixture in a testing module?
 @delegates()
 class PlayerDouble(Player):
@@ -157,6 +332,9 @@ class PlayerDouble(Player):
 
     """
 
+    __slots__ = ("black",)
+    _reset_fields = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.black = wheel_builder.get_outcome("Black")
@@ -165,9 +343,7 @@ class PlayerDouble(Player):
         return [model.Bet(self.base_bet_amount, self.black)]
 
 
-@register_player(cli_name="martingale")
-@delegates()
-class PlayerMartingale(Player):
+class PlayerMartingale(StrategyPlayer):
     """A player class using the Martingale betting strategy.
 
     The player doubles their bet on every loss
@@ -175,30 +351,22 @@ class PlayerMartingale(Player):
 
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.loss_count = 0
-
     # TODO: should we bet the remaining stake if the stake is under the strategy bet amount?
-    @property
-    def bet_amount(self):
-        return self.base_bet_amount * (
-            2.0 ** self.loss_count
-        )  # TODO: make sure bet_amount is less than table maximum?
-
-    def _determine_bets(self):
-        outcome = wheel_builder.get_outcome("Black")
-        bet = [model.Bet(self.bet_amount, outcome)]
-        return bet
+    # TODO: make sure bet_amount is less than table maximum?
+    __slots__ = ()
+    _reset_fields = ()
+    tables = strategy.LazyTables(strategy.martingale)
 
-    def win_hook(self):
-        self.loss_count = 0
+    @property
+    def loss_count(self):
+        """The number of losses in a row, which is the number of the state."""
+        return self.state
 
-    def lose_hook(self):
-        self.loss_count += 1
+    @loss_count.setter
+    def loss_count(self, value):
+        self.state = value
 
 
-@register_player(cli_name="seven-reds")
 @delegates()
 class PlayerSevenReds(PlayerMartingale):
     """SevenReds is a Martingale player who places bets in Roulette.
@@ -219,6 +387,9 @@ class PlayerSevenReds(PlayerMartingale):
 
     """
 
+    __slots__ = ("_red_count", "_red", "_black")
+    _reset_fields = ("_red_count",)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._red_count = 7
@@ -231,7 +402,7 @@ class PlayerSevenReds(PlayerMartingale):
 
     def _determine_bets(self):
         if self._waiting:
-            if self._red in self._winners:
+            if self.history.totals[self._red]:
                 self._red_count -= 1
             else:
                 self._red_count = 7
@@ -244,12 +415,11 @@ class PlayerSevenReds(PlayerMartingale):
 
     def lose_hook(self):
         if self._waiting:
-            self.loss_count = 0  # Keeps bets from inflating during wait.
+            self.state = self.tables.initial  # Keeps bets from inflating during wait.
         else:
-            self.loss_count += 1
+            super().lose_hook()
 
 
-@register_player(cli_name="random")
 @delegates()
 class PlayerRandom(Player):
     """A player who bets on random outcomes.
@@ -261,11 +431,21 @@ class PlayerRandom(Player):
 
     """
 
+    # The random number generator is left alone so sessions differ.
+    __slots__ = ("_random_number_generator", "_outcomes")
+    _reset_fields = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self._random_number_generator = random.Random()
-        self._outcomes = list(wheel_builder.create_wheel().all_outcomes.values())
+        self._random_number_generator = rng.BufferedRandom()
+        self._outcomes = wheel_builder.OUTCOMES.values()
+
+    def seed(self, seed):
+        self._random_number_generator.seed(seed)
+
+    def use_rng_backend(self, backend):
+        self._random_number_generator = rng.BufferedRandom(backend=backend)
 
     def _determine_bets(self):
         outcome_index = self._random_number_generator.randrange(0, len(self._outcomes))
@@ -273,147 +453,29 @@ class PlayerRandom(Player):
         return bet
 
 
-class Player1326StateAlternate:
-    """Alternative player 1326 state class.
-
-    This class provides alternative constructors for itself
-    each representing a betting state.  The class
-    instances keep track of which instance to
-    instantiate next for the state change. This solution
-    might be overly elaborate.
+class Player1326(StrategyPlayer):
+    """Player that uses the 1-3-2-6 betting system.
 
-    """
-
-    def __init__(self, player, bet_multiplier, next_win):
-        self.player = player
-        self.bet_multiplier = bet_multiplier
-        self.next_win = next_win
-
-    @property
-    def current_bet(self):
-        return model.Bet(
-            self.player.base_bet_amount * self.bet_multiplier, self.player.outcome
-        )
-
-    def next_won(self):
-        return self.next_win(self.player)
-
-    def next_lost(self):
-        return self._no_wins(self.player)
-
-    @classmethod
-    def _no_wins(cls, player):
-        """Returns a class instance for the one win state."""
-        return cls(player, 1, cls._one_wins)
-
-    @classmethod
-    def _one_wins(cls, player):
-        """Returns a class instance for the two win state."""
-        return cls(player, 3, cls._two_wins)
-
-    @classmethod
-    def _two_wins(cls, player):
-        """Returns a class instance for the three win state."""
-        return cls(player, 2, cls._three_wins)
-
-    @classmethod
-    def _three_wins(cls, player):
-        """Returns a class instance for the no win state."""
-        return cls(player, 6, cls._no_wins)
-
-
-class Player1326State(abc.ABC):
-    """Abstract base class for the player 1326 states.
-
-    This is overengineered but demonstrates the state design pattern.
+    The player bets 1, 3, 2 and then 6 times the base bet on consecutive
+    wins and goes back to the base bet after a loss or the fourth win.
 
     """
 
-    def __init__(self, player):
-        self.player = player
-
-    @abc.abstractproperty
-    def current_bet(self):
-        """Constructs a new Bet from the player’s preferred Outcome."""
-
-    @abc.abstractmethod
-    def next_won(self):
-        """Constructs the new Player1326State instance when bet was a winner."""
-
-    # This remains constant for all state subclasses.
-    def next_lost(self):
-        """Constructs the new Player1326State instance when bet was a loser."""
-        return Player1326NoWins(self.player)
-
-
-class Player1326NoWins(Player1326State):
-    @property
-    def current_bet(self):
-        return model.Bet(self.player.base_bet_amount * 1, self.player.outcome)
-
-    def next_won(self):
-        return Player1326OneWins(self.player)
-
-
-class Player1326OneWins(Player1326State):
-    @property
-    def current_bet(self):
-        return model.Bet(self.player.base_bet_amount * 3, self.player.outcome)
-
-    def next_won(self):
-        return Player1326TwoWins(self.player)
-
-
-class Player1326TwoWins(Player1326State):
-    @property
-    def current_bet(self):
-        return model.Bet(self.player.base_bet_amount * 2, self.player.outcome)
-
-    def next_won(self):
-        return Player1326ThreeWins(self.player)
-
-
-class Player1326ThreeWins(Player1326State):
-    @property
-    def current_bet(self):
-        return model.Bet(self.player.base_bet_amount * 6, self.player.outcome)
-
-    def next_won(self):
-        return Player1326NoWins(self.player)
-
-
-@register_player(cli_name="1326")
-@delegates()
-class Player1326(Player):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.outcome = wheel_builder.get_outcome("Black")
-        self.state = Player1326StateAlternate._no_wins(self)
+    __slots__ = ()
+    _reset_fields = ()
+    tables = strategy.LazyTables(strategy.one_three_two_six)
 
     @property
-    def playing(self):
-        """Returns True while player is still playing."""
-        if self.stake <= self.state.current_bet.amount_bet:
-            return False
-        elif self.rounds <= 0:
-            return False
-        else:
-            return True
-
-    def _determine_bets(self):
-        return [self.state.current_bet]
-
-    def win_hook(self):
-        self.state = self.state.next_won()
-
-    def lose_hook(self):
-        self.state = self.state.next_lost()
+    def outcome(self):
+        return self.tables.outcomes[self.state]
 
 
-@register_player(cli_name="cancellation")
 class PlayerCancellation(Player):
     """Player that uses the cancellation betting strategy."""
 
+    __slots__ = ("sequence", "outcome")
+    _reset_fields = ("sequence",)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.sequence = list(range(1, 7))
@@ -433,6 +495,10 @@ class PlayerCancellation(Player):
         else:
             return True
 
+    @property
+    def ruined(self):
+        return len(self.sequence) > 1 and self.stake <= self.bet_amount
+
     def _determine_bets(self):
         return [model.Bet(self.bet_amount, self.outcome)]
 
@@ -448,9 +514,7 @@ class PlayerCancellation(Player):
         return self.sequence[-1] + self.sequence[0]
 
 
-@register_player(cli_name="fibonacci")
-@delegates()
-class PlayerFibonacci(PlayerMartingale):
+class PlayerFibonacci(StrategyPlayer):
     """Player that uses the Fibonacci betting system.
 
     After a loss, the player adds the current bet multiplier
@@ -461,18 +525,18 @@ class PlayerFibonacci(PlayerMartingale):
 
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.current = 1
-        self.previous = 0
+    __slots__ = ()
+    _reset_fields = ()
+    tables = strategy.LazyTables(strategy.fibonacci)
 
     @property
-    def bet_amount(self):
-        return self.current * self.base_bet_amount
+    def current(self):
+        """The current bet multiplier."""
+        return int(self.tables.multipliers[self.state])
 
-    def win_hook(self):
-        self.current = 1
-        self.previous = 0
-
-    def lose_hook(self):
-        self.current, self.previous = (self.current + self.previous), self.current
+    @property
+    def previous(self):
+        """The previous bet multiplier, 0 after a win."""
+        if self.state == self.tables.initial:
+            return 0
+        return int(self.tables.multipliers[self.state - 1])
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Timing of the phases of a simulation.
+
+:meth:`model.Game.cycle` and :meth:`model.Simulator._session` time their
+phases with a :func:`timer` when a :class:`PhaseTimes` is attached with
+:meth:`model.Simulator.profile`.  Without one the timer does nothing, so
+leaving profiling off costs next to nothing.
+
+The phases of a cycle are ``place_bets``, ``is_valid``, ``spin``,
+``settle`` and ``track``.  A session adds ``reset_player``, for getting a
+fresh player, and ``session``, for the whole session.
+
+"""
+import collections
+import time
+
+
+class PhaseTimes:
+    """Call counts and wall-clock seconds per player strategy and phase."""
+
+    def __init__(self):
+        # Keyed by (strategy, phase).
+        self.calls = collections.defaultdict(int)
+        self.seconds = collections.defaultdict(float)
+
+    def add(self, strategy, phase, seconds):
+        """Record one call of a phase that took ``seconds``."""
+        self.calls[strategy, phase] += 1
+        self.seconds[strategy, phase] += seconds
+
+    def merge(self, other):
+        """Add the calls and times recorded by another :class:`PhaseTimes`."""
+        for key, calls in other.calls.items():
+            self.calls[key] += calls
+            self.seconds[key] += other.seconds[key]
+        return self
+
+    def rows(self):
+        """Return (strategy, phase, calls, seconds) for every phase timed."""
+        return [
+            (strategy, phase, self.calls[strategy, phase], seconds)
+            for (strategy, phase), seconds in sorted(self.seconds.items())
+        ]
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({len(self.calls)} phases)"
+
+
+class Timer:
+    """Times the phases of one call for the strategy of ``player``.
+
+    :param times: Where to record the times.
+    :type times: PhaseTimes
+    :param player: The player whose strategy the times are recorded for.
+    :type player: Player
+
+    """
+
+    def __init__(self, times, player):
+        self.times = times
+        self.strategy = type(player).__qualname__
+        self.started = self.last = time.perf_counter()
+
+    def lap(self, phase):
+        """Record the time since the last lap, or the start, as ``phase``."""
+        now = time.perf_counter()
+        self.times.add(self.strategy, phase, now - self.last)
+        self.last = now
+
+    def total(self, phase):
+        """Record the time since the timer was started as ``phase``."""
+        self.times.add(self.strategy, phase, time.perf_counter() - self.started)
+
+
+class _NoTimer:
+    """A :class:`Timer` that records nothing, used when not profiling."""
+
+    def lap(self, phase):
+        pass
+
+    def total(self, phase):
+        pass
+
+
+_NO_TIMER = _NoTimer()
+
+
+def timer(times, player):
+    """Return a started :class:`Timer`, or one doing nothing if ``times`` is None.
+
+    :param times: Where to record the times, if anywhere.
+    :type times: PhaseTimes
+    :param player: The player whose strategy the times are recorded for.
+    :type player: Player
+    :rtype: Timer
+    """
+    if times is None:
+        return _NO_TIMER
+    return Timer(times, player)
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Estimate the probabilities of rare session outcomes.
+
+Plain sessions rarely see an event like a player doubling their stake, so
+estimating its probability to a useful relative error takes very many of
+them.  :func:`estimate` has two ways around that, for any player:
+
+* ``"importance"`` sampling tilts every spin towards the bins that pay the
+  bets on the table, or away from them, see :class:`TiltedSpins`.  Each
+  session is weighted by the likelihood ratio of its spins, the product of
+  their plain over their tilted probabilities, so the mean of the weights
+  of the sessions with the event is an unbiased estimate of its
+  probability.  Only the bets already placed decide the tilt of a spin,
+  so every player can be tilted.
+* ``"splitting"`` plays sessions until their stake crosses the first of a
+  list of levels between the initial stake and the event, copies the
+  sessions that crossed it to replace those that didn't, plays those to
+  the next level, and so on.  The product of the fractions that crossed
+  each level is an unbiased estimate of the probability.
+
+The sessions are played in chunks like :func:`parallel.gather`, so the
+estimates of a seed don't depend on the executor.  The standard errors of
+splitting come from the spread of the estimates of the chunks.
+
+"""
+import bisect
+import copy
+import math
+import random
+from . import parallel
+from . import stats
+from . import variance
+
+
+class Reach:
+    """The event that the stake reaches a target during the session.
+
+    :param target: The stake to reach.
+    :type target: float
+
+    """
+
+    # Tilt spins towards the bins that pay the bets.
+    direction = 1
+
+    def __init__(self, target):
+        self.target = target
+
+    def occurred(self, result):
+        """Whether the event occurred in a :class:`model.SessionResult`."""
+        return result.maximum >= self.target
+
+    def decided(self, player, peak):
+        """Whether the event occurred, or ``None`` while still undecided."""
+        if peak >= self.target:
+            return True
+        return None if player.playing else False
+
+    def levels(self, stake, count):
+        """Return ``count`` evenly spaced stakes on the way to the event."""
+        step = (self.target - stake) / (count + 1)
+        return [stake + step * n for n in range(1, count + 1)]
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.target!r})"
+
+
+class Ruin:
+    """The event that the player goes broke."""
+
+    direction = -1
+
+    def occurred(self, result):
+        return result.ruined
+
+    def decided(self, player, peak):
+        return None if player.playing else player.ruined
+
+    def levels(self, stake, count):
+        step = stake / (count + 1)
+        return [stake - step * n for n in range(1, count + 1)]
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + "()"
+
+
+def _crossed(event, stake, level):
+    """Whether a stake is at or past a level on the way to an event."""
+    return (stake - level) * event.direction >= 0
+
+
+def siegmund_tilt(nets):
+    """Return the tilt that makes a losing game as likely to be won.
+
+    The positive root of ``mean(exp(tilt * net)) == 1`` over the equally
+    likely nets, which is the tilt of Siegmund's algorithm: it makes the
+    expected net positive by as much as it was negative, and is the most
+    efficient tilt for reaching a distant stake.  Zero if the nets aren't
+    losing on average or can't win.
+
+    :param nets: The nets of the bins.
+    :type nets: list
+    """
+    if sum(nets) >= 0 or max(nets) <= 0:
+        return 0.0
+
+    def excess(tilt):
+        return sum(math.exp(tilt * net) for net in nets) / len(nets) - 1
+
+    low, high = 0.0, 1.0 / max(nets)
+    while excess(high) < 0:
+        low, high = high, 2 * high
+    for _ in range(60):
+        middle = (low + high) / 2
+        if excess(middle) < 0:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+class TiltedSpins:
+    """Spins tilted towards the bins that pay the bets on a table.
+
+    Takes the place of the random number generator of a wheel.  A bin is
+    drawn with a probability proportional to ``exp(tilt * net)``, where
+    ``net`` is what the bets on the table win per unit bet if it comes up,
+    and ``tilt`` is ``scale`` times the :func:`siegmund_tilt` of the nets.
+    ``log_weight`` adds up the log likelihood ratios of the spins since
+    :meth:`new_session`.
+
+    :param random_num_gen: Draws the spins.
+    :param table: The table whose bets tilt the spins.
+    :type table: model.Table
+    :param scale: How strongly to tilt, negative towards losing bins.
+    :type scale: float
+
+    """
+
+    # The resolution of the uniform numbers the spins are drawn from.
+    resolution = 2**53
+
+    def __init__(self, random_num_gen, table, scale):
+        self.random_num_gen = random_num_gen
+        self.table = table
+        self.scale = scale
+        self.log_weight = 0.0
+        # The cumulative probabilities and log likelihood ratios of the
+        # bins, by the outcomes and fractions of the bets.
+        self._distributions = dict()
+
+    def new_session(self):
+        """Start adding up the likelihood ratio of a new session."""
+        self.log_weight = 0.0
+
+    def _distribution(self, bins):
+        total = self.table.total
+        key = tuple((bet.outcome.id, bet.amount_bet / total) for bet in self.table)
+        try:
+            return self._distributions[key]
+        except KeyError:
+            pass
+        nets = [
+            sum(
+                fraction * (bet.outcome.odds if bin_.mask >> bet.outcome.id & 1 else -1)
+                for bet, (_, fraction) in zip(self.table, key)
+            )
+            for bin_ in bins
+        ]
+        tilt = self.scale * siegmund_tilt(nets)
+        exponents = [tilt * net for net in nets]
+        largest = max(exponents)
+        weights = [math.exp(exponent - largest) for exponent in exponents]
+        norm = sum(weights)
+        cumulative, running = list(), 0.0
+        for weight in weights:
+            running += weight / norm
+            cumulative.append(running)
+        log_ratios = [math.log(norm / weight / len(bins)) for weight in weights]
+        return self._distributions.setdefault(key, (cumulative, log_ratios))
+
+    def choice(self, seq):
+        if not self.table.total or not self.scale:
+            return seq[self.random_num_gen.randrange(len(seq))]
+        cumulative, log_ratios = self._distribution(seq)
+        uniform = self.random_num_gen.randrange(self.resolution) / self.resolution
+        number = min(bisect.bisect_right(cumulative, uniform), len(seq) - 1)
+        self.log_weight += log_ratios[number]
+        return seq[number]
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"(scale={self.scale!r})"
+
+
+def _importance_chunk(simulator, event, scale, count, seed):
+    """Return the moments of the weighted events of ``count`` sessions."""
+    simulator.seed(seed)
+    wheel = simulator.game.wheel
+    spins = TiltedSpins(wheel.random_num_gen, simulator.game.table, scale)
+    wheel.random_num_gen = spins
+    moments = stats.Moments()
+    for _ in range(count):
+        spins.new_session()
+        (record,) = simulator._sessions(1)
+        moments.add(math.exp(spins.log_weight) if event.occurred(record) else 0.0)
+    return moments
+
+
+def _play_to(game, event, player, peak, level):
+    """Play until the stake crosses a level or the event is decided.
+
+    :returns: Whether the level was crossed or the event occurred, the
+        player and the peak stake.
+    :rtype: tuple
+    """
+    while True:
+        if level is not None and _crossed(event, player.stake, level):
+            return True, player, peak
+        decided = event.decided(player, peak)
+        if decided is not None:
+            return decided, player, peak
+        game.cycle(player)
+        peak = max(peak, player.stake)
+
+
+def _splitting_chunk(simulator, event, levels, count, seed):
+    """Return the moments of one splitting estimate with ``count`` sessions.
+
+    The sessions that crossed a level are drawn with replacement to play
+    on from it, and a session drawn more than once is copied before any
+    of them play.
+
+    """
+    simulator.seed(seed)
+    streams = random.Random(seed)
+    # Copies share the immutable outcomes.
+    memo = {
+        id(outcome): outcome for outcome in simulator.game.wheel.all_outcomes.values()
+    }
+    player = copy.deepcopy(simulator._original_player, dict(memo))
+    crossed = [(player, player.stake)]
+    drawn = [0] * count
+    probability = 1.0
+    for level in [*levels, None]:
+        states, seen = list(), set()
+        for index in drawn:
+            player, peak = crossed[index]
+            if index in seen:
+                player = copy.deepcopy(player, dict(memo))
+            seen.add(index)
+            states.append((player, peak))
+        crossed = list()
+        for player, peak in states:
+            hit, player, peak = _play_to(simulator.game, event, player, peak, level)
+            if hit:
+                crossed.append((player, peak))
+        probability *= len(crossed) / count
+        if not crossed:
+            break
+        drawn = [streams.randrange(len(crossed)) for _ in range(count)]
+    moments = stats.Moments()
+    moments.add(probability)
+    return moments
+
+
+def estimate(
+    simulator,
+    event,
+    samples,
+    method="importance",
+    scale=1.0,
+    levels=4,
+    executor=None,
+    seed=None,
+):
+    """Estimate the probability of an event in a simulator's sessions.
+
+    :param simulator: The simulator whose sessions to play.
+    :type simulator: model.Simulator
+    :param event: The event, like :class:`Reach` or :class:`Ruin`.
+    :param samples: The number of sessions, of every level for splitting.
+    :type samples: int
+    :param method: ``"importance"``, ``"splitting"`` or ``"plain"``.
+    :type method: str
+    :param scale: How strongly importance sampling tilts the spins towards
+        the event, as a multiple of :func:`siegmund_tilt`.
+    :type scale: float
+    :param levels: The stakes splitting copies sessions at, or the number
+        of evenly spaced ones.
+    :type levels: list or int
+    :param executor: Where to play the chunks, defaults to this process.
+    :type executor: concurrent.futures.Executor
+    :param seed: The master seed.
+    :type seed: int
+    :returns: The estimate, whose effective samples are the plain
+        sessions that would give the same standard error.
+    :rtype: variance.Estimate
+    :raises ValueError: If there are too few sessions for a standard error.
+    """
+    chunk_size = simulator.chunk_size
+    if method == "splitting":
+        if samples < 2 * chunk_size:
+            raise ValueError(
+                f"Splitting needs at least {2 * chunk_size} sessions, "
+                "two chunks, for a standard error."
+            )
+        if isinstance(levels, int):
+            levels = event.levels(simulator._original_player.stake, levels)
+        play, arguments = _splitting_chunk, (event, list(levels))
+    elif method in ("importance", "plain"):
+        if samples < 2:
+            raise ValueError("Estimating a variance needs at least two sessions.")
+        scale = scale * event.direction if method == "importance" else 0.0
+        play, arguments = _importance_chunk, (event, scale)
+    else:
+        raise ValueError(f"Unknown method {method!r}.")
+    if executor is None:
+        executor = parallel.SerialExecutor()
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    futures = [
+        executor.submit(
+            play,
+            simulator._spawn(),
+            *arguments,
+            min(chunk_size, samples - start),
+            parallel.stream_seed(seed, index),
+        )
+        for index, start in enumerate(range(0, samples, chunk_size))
+    ]
+    moments = stats.Moments()
+    for future in futures:
+        moments.merge(future.result())
+    probability = moments.mean
+    estimator_variance = moments.variance / moments.count
+    return variance.Estimate(
+        probability,
+        math.sqrt(estimator_variance),
+        samples,
+        variance._effective(
+            samples, probability * (1 - probability), estimator_variance
+        ),
+    )
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The players that can be chosen by name, imported only when needed.
+
+Built-in players are listed by the import path of their class, so checking
+a name or listing the built-in names imports nothing.  Other packages can
+add players with entry points in the ``pycasino.players`` group, e.g. in
+their ``setup.py``::
+
+    entry_points={"pycasino.players": ["oscar = mypackage.players:PlayerOscar"]}
+
+Looking up the installed entry points is slow, so it is only done once a
+name isn't built in or registered, or when every name is listed.
+
+"""
+import collections.abc
+import importlib
+
+
+# The entry point group of third-party players.
+ENTRY_POINT_GROUP = "pycasino.players"
+
+# The import paths of the built-in players by name, in the order they are
+# listed.
+BUILTIN_PLAYERS = {
+    "martingale": "pycasino.roulette.player:PlayerMartingale",
+    "seven-reds": "pycasino.roulette.player:PlayerSevenReds",
+    "random": "pycasino.roulette.player:PlayerRandom",
+    "1326": "pycasino.roulette.player:Player1326",
+    "cancellation": "pycasino.roulette.player:PlayerCancellation",
+    "fibonacci": "pycasino.roulette.player:PlayerFibonacci",
+}
+
+
+def _entry_points():
+    """Return the import paths of the players of entry points by name."""
+    from importlib import metadata
+
+    found = metadata.entry_points()
+    if hasattr(found, "select"):
+        found = found.select(group=ENTRY_POINT_GROUP)
+    else:
+        found = found.get(ENTRY_POINT_GROUP, ())
+    return {entry_point.name: entry_point.value for entry_point in found}
+
+
+def import_path(path):
+    """Return the object at an import path ``"module:qualified.name"``."""
+    module_name, _, qualname = path.partition(":")
+    found = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        found = getattr(found, name)
+    return found
+
+
+class PlayerRegistry(collections.abc.MutableMapping):
+    """Player classes by name, imported from their path when first used.
+
+    Assigning a class registers it directly, see
+    :func:`player.register_player`.
+
+    :param paths: Import paths of player classes by name.
+    :type paths: dict
+
+    """
+
+    def __init__(self, paths=()):
+        self._paths = dict(paths)
+        self._classes = dict()
+        self._entry_points = None
+
+    def entry_points(self):
+        """Return the import paths of the entry point players by name."""
+        if self._entry_points is None:
+            self._entry_points = _entry_points()
+        return self._entry_points
+
+    def known(self, name):
+        """Whether a name is built in or registered, without entry points."""
+        return name in self._classes or name in self._paths
+
+    def local_names(self):
+        """Return the built in and registered names, without entry points."""
+        return list(dict.fromkeys([*self._paths, *self._classes]))
+
+    def __getitem__(self, name):
+        try:
+            return self._classes[name]
+        except KeyError:
+            pass
+        path = self._paths.get(name)
+        if path is None:
+            path = self.entry_points()[name]
+        return self._classes.setdefault(name, import_path(path))
+
+    def __setitem__(self, name, cls):
+        self._classes[name] = cls
+
+    def __delitem__(self, name):
+        if not self.known(name):
+            raise KeyError(name)
+        self._classes.pop(name, None)
+        self._paths.pop(name, None)
+
+    def __contains__(self, name):
+        return self.known(name) or name in self.entry_points()
+
+    def __iter__(self):
+        return iter(dict.fromkeys([*self.local_names(), *self.entry_points()]))
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({len(self.local_names())} local)"
+
+
+# Players accessible via the CLI
+PLAYERS = PlayerRegistry(BUILTIN_PLAYERS)
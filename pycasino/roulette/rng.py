@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Random number generators that draw their numbers in blocks.
+
+Spinning a wheel or picking a random outcome needs one random integer at a
+time.  :class:`BufferedRandom` draws these integers in large blocks from a
+bit generator and hands them out one by one, so most calls are just a pop
+from a list.
+
+The bit generator is a pluggable backend.  ``"mt"``, the standard library's
+Mersenne Twister, draws the same numbers as :class:`random.Random` with the
+same seed and is the default.  ``"pcg64"`` and ``"philox"`` use NumPy and
+are much faster at filling blocks.
+
+"""
+import array
+import copy
+import random
+import sys
+
+
+def _numpy_generator(bit_generator_name):
+    def backend(seed):
+        import numpy as np
+
+        return np.random.Generator(getattr(np.random, bit_generator_name)(seed))
+
+    return backend
+
+
+# Functions that return a seeded generator, either a random.Random or a
+# numpy.random.Generator.
+BACKENDS = {
+    "mt": random.Random,
+    "pcg64": _numpy_generator("PCG64"),
+    "philox": _numpy_generator("Philox"),
+}
+
+# The backend used when none is given.
+DEFAULT_BACKEND = "mt"
+
+
+def _mt_block(generator, stop, size):
+    """Return at least ``size`` random integers below ``stop``.
+
+    Draws the numbers :meth:`random.Random.randrange` would, in order, but
+    takes the 32 bit words of the Mersenne Twister a block at a time: a
+    ``getrandbits(k)`` of ``k <= 32`` bits is the top ``k`` bits of the
+    next word, and a ``getrandbits(32 * n)`` holds the next ``n`` words
+    from its least significant end.
+
+    """
+    bits = stop.bit_length()
+    if bits > 32:
+        values = list()
+        for _ in range(size):
+            value = generator.getrandbits(bits)
+            while value >= stop:
+                value = generator.getrandbits(bits)
+            values.append(value)
+        return values
+    shift = 32 - bits
+    values = list()
+    while len(values) < size:
+        words = array.array("I")
+        words.frombytes(generator.getrandbits(32 * size).to_bytes(4 * size, "little"))
+        if sys.byteorder == "big":
+            words.byteswap()
+        values.extend(
+            value for value in (word >> shift for word in words) if value < stop
+        )
+    return values
+
+
+class BufferedRandom:
+    """Hands out random integers that are drawn in blocks.
+
+    Has the parts of the :class:`random.Random` interface used by the
+    wheel and the players: :meth:`seed`, :meth:`randrange` and
+    :meth:`choice`.
+
+    :param seed: A seed for the bit generator.
+    :type seed: int
+    :param backend: The name of a backend in :data:`BACKENDS`.
+    :type backend: str
+    :param block_size: The number of integers drawn at once.
+    :type block_size: int
+
+    """
+
+    def __init__(self, seed=None, backend=DEFAULT_BACKEND, block_size=4096):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown random number generator backend {backend!r}.")
+        self.backend = backend
+        self.block_size = block_size
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Restart the generator from a seed and drop any buffered numbers."""
+        self._generator = BACKENDS[self.backend](seed)
+        # Buffers of integers below a stop, in reverse so they pop in order.
+        self._buffers = dict()
+
+    def _draw(self, stop):
+        """Return a block of random integers below ``stop``."""
+        if isinstance(self._generator, random.Random):
+            return _mt_block(self._generator, stop, self.block_size)
+        return self._generator.integers(0, stop, size=self.block_size).tolist()
+
+    def randrange(self, start, stop=None):
+        """Return a random integer from ``range(start, stop)``."""
+        if stop is None:
+            start, stop = 0, start
+        buffer = self._buffers.get(stop - start)
+        if not buffer:
+            buffer = self._draw(stop - start)
+            buffer.reverse()
+            self._buffers[stop - start] = buffer
+        return start + buffer.pop()
+
+    def choice(self, seq):
+        """Return a random item of a sequence."""
+        return seq[self.randrange(len(seq))]
+
+    def __deepcopy__(self, memo):
+        # The buffers only hold integers, so shallow copies of them will do.
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        copied.__dict__.update(self.__dict__)
+        if isinstance(self._generator, random.Random):
+            copied._generator = random.Random()
+            copied._generator.setstate(self._generator.getstate())
+        else:
+            copied._generator = copy.deepcopy(self._generator, memo)
+        copied._buffers = {stop: list(buffer) for stop, buffer in self._buffers.items()}
+        return copied
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"(backend={self.backend!r})"
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Online statistics that summarize session results in constant memory.
+
+Every accumulator takes values one at a time, never stores them and can be
+merged with another accumulator of the same kind, e.g. one filled by a
+parallel worker or a separate run.
+
+"""
+import math
+import statistics
+import time
+
+
+class Moments:
+    """Count, mean, variance, minimum and maximum of a stream of values.
+
+    Uses Welford's algorithm, and Chan's formula to merge.
+
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        """Add a value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """Add the values seen by another :class:`Moments`."""
+        count = self.count + other.count
+        if count == 0:
+            return self
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        """The sample variance."""
+        if self.count < 2:
+            return math.nan
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std(self):
+        """The sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    def __repr__(self):
+        return (
+            self.__class__.__qualname__
+            + f"(count={self.count}, mean={self.mean!r}, variance={self.variance!r})"
+        )
+
+
+class Covariance:
+    """Moments of two streams of paired values and their covariance.
+
+    Updated like :class:`Moments`, with the co-moment merged by Chan's
+    formula.
+
+    """
+
+    def __init__(self):
+        self.x = Moments()
+        self.y = Moments()
+        self._c = 0.0
+
+    @property
+    def count(self):
+        return self.x.count
+
+    def add(self, x, y):
+        """Add a pair of values."""
+        delta_x = x - self.x.mean
+        self.x.add(x)
+        self.y.add(y)
+        self._c += delta_x * (y - self.y.mean)
+
+    def merge(self, other):
+        """Add the pairs seen by another :class:`Covariance`."""
+        count = self.count + other.count
+        if count:
+            self._c += (
+                other._c
+                + (other.x.mean - self.x.mean)
+                * (other.y.mean - self.y.mean)
+                * self.count
+                * other.count
+                / count
+            )
+        self.x.merge(other.x)
+        self.y.merge(other.y)
+        return self
+
+    @property
+    def covariance(self):
+        """The sample covariance."""
+        if self.count < 2:
+            return math.nan
+        return self._c / (self.count - 1)
+
+    @property
+    def correlation(self):
+        """Pearson's correlation coefficient."""
+        return self.covariance / math.sqrt(self.x.variance * self.y.variance)
+
+    def __repr__(self):
+        return (
+            self.__class__.__qualname__
+            + f"(count={self.count}, covariance={self.covariance!r})"
+        )
+
+
+class Histogram:
+    """Counts of values in equal width bins between ``low`` and ``high``.
+
+    Values outside the range are counted in ``underflow`` and ``overflow``.
+
+    :param low: The lower edge of the first bin.
+    :type low: float
+    :param high: The upper edge of the last bin.
+    :type high: float
+    :param bins: The number of bins.
+    :type bins: int
+
+    """
+
+    def __init__(self, low, high, bins):
+        if not high > low:
+            raise ValueError("The histogram's high edge must be above its low edge.")
+        self.low = low
+        self.high = high
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+
+    @property
+    def edges(self):
+        """The edges of the bins, one more than there are bins."""
+        width = (self.high - self.low) / len(self.counts)
+        return [self.low + width * i for i in range(len(self.counts) + 1)]
+
+    def add(self, value):
+        """Add a value."""
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            index = int((value - self.low) / (self.high - self.low) * len(self.counts))
+            self.counts[min(index, len(self.counts) - 1)] += 1
+
+    def merge(self, other):
+        """Add the counts of another histogram with the same bins."""
+        if (self.low, self.high, len(self.counts)) != (
+            other.low,
+            other.high,
+            len(other.counts),
+        ):
+            raise ValueError("Only histograms with the same bins can be merged.")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def __repr__(self):
+        return (
+            self.__class__.__qualname__
+            + f"({self.low!r}, {self.high!r}, {len(self.counts)!r})"
+        )
+
+
+class QuantileSketch:
+    """Estimates quantiles of non-negative values with a relative accuracy.
+
+    Values are counted in logarithmically sized buckets (a DDSketch), so a
+    quantile is off by at most ``relative_accuracy`` times its value.
+    The number of buckets only grows with the logarithm of the range of
+    the values, and two sketches merge exactly by adding their counts.
+
+    :param relative_accuracy: The relative error of the quantiles.
+    :type relative_accuracy: float
+
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        self._zeros = 0
+        self._buckets = dict()
+
+    def add(self, value):
+        """Add a value."""
+        if value < 0:
+            raise ValueError("The quantile sketch only takes non-negative values.")
+        self.count += 1
+        if value == 0:
+            self._zeros += 1
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[key] = self._buckets.get(key, 0) + 1
+
+    def merge(self, other):
+        """Add the values seen by another sketch with the same accuracy."""
+        if self.relative_accuracy != other.relative_accuracy:
+            raise ValueError("Only sketches with the same accuracy can be merged.")
+        self.count += other.count
+        self._zeros += other._zeros
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        return self
+
+    def quantile(self, q):
+        """Return an estimate of the q-th quantile, q between 0 and 1."""
+        if not 0 <= q <= 1:
+            raise ValueError("The quantile must be between 0 and 1.")
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                return 2 * self._gamma**key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.relative_accuracy!r})"
+
+
+class Summary:
+    """The moments and quantiles of one statistic."""
+
+    def __init__(self):
+        self.moments = Moments()
+        self.sketch = QuantileSketch()
+
+    def add(self, value):
+        self.moments.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.moments!r})"
+
+
+class SessionStats:
+    """Summarizes :class:`model.SessionResult` records in constant memory.
+
+    Keeps a :class:`Summary` of the maximum stake, the rounds played and
+    the maximum drawdown of the sessions, the number of ruined sessions and
+    a histogram of the rounds played.
+
+    :param rounds: The rounds each session may last, sets the histogram bins.
+    :type rounds: int
+
+    """
+
+    # The statistics summarized, by their SessionResult field.
+    fields = ("maximum", "duration", "drawdown")
+
+    def __init__(self, rounds=100):
+        self.summaries = {field: Summary() for field in self.fields}
+        self.durations = Histogram(0, rounds + 1, bins=min(rounds + 1, 100))
+        self.ruined = 0
+
+    @property
+    def count(self):
+        return self.summaries["duration"].moments.count
+
+    @property
+    def ruin_rate(self):
+        """The fraction of the sessions where the player went broke."""
+        return self.ruined / self.count if self.count else math.nan
+
+    def interval(self, statistic, confidence=0.95):
+        """Return a confidence interval of a mean or of the ruin rate.
+
+        A normal interval for the mean of a field in :attr:`fields`, and a
+        Wilson score interval for ``"ruined"``, which stays wide while no
+        or every session was ruined.
+
+        :param statistic: A field in :attr:`fields` or ``"ruined"``.
+        :type statistic: str
+        :param confidence: The probability the interval covers the value.
+        :type confidence: float
+        :returns: The lower and upper bounds, infinite without sessions.
+        :rtype: tuple
+        """
+        z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+        count = self.count
+        if count < 2:
+            return -math.inf, math.inf
+        if statistic == "ruined":
+            rate = self.ruin_rate
+            centre = (rate + z**2 / (2 * count)) / (1 + z**2 / count)
+            half = (
+                z
+                / (1 + z**2 / count)
+                * math.sqrt(rate * (1 - rate) / count + z**2 / (4 * count**2))
+            )
+        else:
+            moments = self.summaries[statistic].moments
+            centre = moments.mean
+            half = z * math.sqrt(moments.variance / count)
+        return centre - half, centre + half
+
+    def add(self, record):
+        """Add a :class:`model.SessionResult`."""
+        for field in self.fields:
+            self.summaries[field].add(getattr(record, field))
+        self.durations.add(record.duration)
+        self.ruined += bool(record.ruined)
+
+    def merge(self, other):
+        """Add the sessions summarized by another :class:`SessionStats`."""
+        for field in self.fields:
+            self.summaries[field].merge(other.summaries[field])
+        self.durations.merge(other.durations)
+        self.ruined += other.ruined
+        return self
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"(count={self.count})"
+
+
+class StoppingRule:
+    """When to stop playing sessions: once the confidence interval of a
+    statistic is narrow enough, or a time budget is spent.
+
+    :param statistic: A statistic of :meth:`SessionStats.interval`.
+    :type statistic: str
+    :param width: Stop once the confidence interval is at most this wide.
+    :type width: float
+    :param time_budget: Stop once this many seconds have passed since
+        :meth:`start`.
+    :type time_budget: float
+    :param confidence: The confidence of the interval.
+    :type confidence: float
+    :raises ValueError: Without a width or a time budget.
+
+    """
+
+    def __init__(
+        self, statistic="maximum", width=None, time_budget=None, confidence=0.95
+    ):
+        if width is None and time_budget is None:
+            raise ValueError("A stopping rule needs a width or a time budget.")
+        self.statistic = statistic
+        self.width = width
+        self.time_budget = time_budget
+        self.confidence = confidence
+        # Why the rule last said to stop, "width" or "time".
+        self.reason = None
+        self._started = time.monotonic()
+
+    def start(self):
+        """Start the time budget from now."""
+        self._started = time.monotonic()
+        self.reason = None
+
+    def __call__(self, session_stats):
+        """Whether to stop playing, given the sessions played so far.
+
+        :param session_stats: The sessions played so far.
+        :type session_stats: SessionStats
+        :rtype: bool
+        """
+        if self.width is not None:
+            low, high = session_stats.interval(self.statistic, self.confidence)
+            if high - low <= self.width:
+                self.reason = "width"
+                return True
+        if self.time_budget is not None:
+            if time.monotonic() - self._started >= self.time_budget:
+                self.reason = "time"
+                return True
+        return False
+
+    def __repr__(self):
+        return (
+            self.__class__.__qualname__
+            + f"({self.statistic!r}, width={self.width!r}, "
+            + f"time_budget={self.time_budget!r})"
+        )
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Betting strategies defined as finite-state machines.
+
+A :class:`Strategy` is a set of named states.  Each state has the bet
+multiplier and outcome of the bet placed in it, and the states to go to
+after the bet is won or lost.  :meth:`Strategy.compile` turns it into
+:class:`Tables`: tuples indexed by the state number, which
+:class:`player.StrategyPlayer` and the batch kernels run without any
+computation or allocation per spin beyond the bet.
+
+Strategies can be written in Python::
+
+    Strategy(
+        {
+            "base": {"multiplier": 1, "won": "base", "lost": "double"},
+            "double": {"multiplier": 2, "won": "base", "lost": "double"},
+        }
+    )
+
+or in YAML, as a mapping of names to the same arguments, see
+:func:`from_config`::
+
+    strategies:
+      doubler:
+        outcome: Black
+        states:
+          base: {multiplier: 1, won: base, lost: double}
+          double: {multiplier: 2, won: base, lost: double}
+
+Strategies with an unbounded state, like Martingale's loss count, are
+unrolled until the bet multiplier overflows to infinity.  No stake covers
+an infinite bet, so a player stops before reaching the last state however
+many base bets their stake holds, exactly as if the states never ended.
+
+"""
+import collections
+import itertools
+import math
+import operator
+from . import wheel_builder
+
+
+Tables = collections.namedtuple(
+    "Tables", ["multipliers", "on_win", "on_loss", "outcomes", "initial", "names"]
+)
+Tables.__doc__ = """The compiled transition tables of a :class:`Strategy`.
+
+Indexed by state number: the bet multiplier, the next state after a win,
+the next state after a loss and the :class:`model.Outcome` bet upon.
+``initial`` is the number of the initial state and ``names`` the names of
+the states.
+
+"""
+
+
+class Strategy:
+    """A betting strategy as a finite-state machine.
+
+    :param states: The states by name, each a mapping with a ``multiplier``
+        of the base bet, the ``won`` and ``lost`` next states and optionally
+        the name of the ``outcome`` to bet on.
+    :type states: dict
+    :param initial: The name of the initial state, defaults to the first.
+    :param outcome: The name of the outcome of states that don't name one.
+    :type outcome: str
+
+    """
+
+    def __init__(self, states, initial=None, outcome="Black"):
+        if not states:
+            raise ValueError("A strategy needs at least one state.")
+        self.states = dict(states)
+        self.initial = next(iter(self.states)) if initial is None else initial
+        self.outcome = outcome
+
+    def compile(self):
+        """Return the :class:`Tables` of the strategy.
+
+        :raises ValueError: If a state or an outcome is unknown.
+        """
+        names = tuple(self.states)
+        numbers = {name: number for number, name in enumerate(names)}
+
+        def number(name):
+            try:
+                return numbers[name]
+            except KeyError:
+                raise ValueError(f"Unknown state {name!r}.") from None
+
+        def outcome(name):
+            found = wheel_builder.get_outcome(name)
+            if found is None:
+                raise ValueError(f"Unknown outcome {name!r}.")
+            return found
+
+        states = self.states.values()
+        return Tables(
+            multipliers=tuple(float(state["multiplier"]) for state in states),
+            on_win=tuple(number(state["won"]) for state in states),
+            on_loss=tuple(number(state["lost"]) for state in states),
+            outcomes=tuple(
+                outcome(state.get("outcome", self.outcome)) for state in states
+            ),
+            initial=number(self.initial),
+            names=names,
+        )
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({len(self.states)} states)"
+
+
+class LazyTables:
+    """A class attribute of the :class:`Tables` of a strategy, compiled on use.
+
+    Compiling looks up the outcomes of the wheel, so the player classes
+    using this can be imported without building one.  The first access
+    replaces it with the tables on the class it was defined on.
+
+    :param make: A function returning the :class:`Strategy`.
+
+    """
+
+    def __init__(self, make):
+        self.make = make
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        tables = self.make().compile()
+        for cls in owner.__mro__:
+            if cls.__dict__.get(self.name) is self:
+                setattr(cls, self.name, tables)
+        return tables
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.make.__qualname__})"
+
+
+def _escalating(multipliers, states):
+    """Return the strategy of betting the next multiplier after every loss.
+
+    A win goes back to the first multiplier.  The multipliers are taken
+    up to the first infinite one, or only the first ``states`` of them,
+    and the last state is kept after more losses.
+
+    """
+    taken = list()
+    for multiplier in multipliers:
+        if len(taken) == states:
+            break
+        taken.append(multiplier)
+        if multiplier == math.inf:
+            break
+    last = len(taken) - 1
+    return Strategy(
+        {
+            n: {"multiplier": multiplier, "won": 0, "lost": min(n + 1, last)}
+            for n, multiplier in enumerate(taken)
+        }
+    )
+
+
+def martingale(states=None):
+    """Double the bet after every loss, state ``n`` is ``n`` losses in a row.
+
+    :param states: The number of states, by default up to the first
+        infinite multiplier.
+    :type states: int
+    """
+    doubles = itertools.accumulate(itertools.repeat(2.0), operator.mul, initial=1.0)
+    return _escalating(doubles, states)
+
+
+def _fibonacci_numbers():
+    previous, current = 1.0, 1.0
+    while True:
+        yield previous
+        previous, current = current, previous + current
+
+
+def fibonacci(states=None):
+    """Bet the next Fibonacci number after every loss, go back to 1 on a win.
+
+    :param states: The number of states, by default up to the first
+        infinite multiplier.
+    :type states: int
+    """
+    return _escalating(_fibonacci_numbers(), states)
+
+
+def one_three_two_six():
+    """Bet 1, 3, 2 then 6 units on consecutive wins, go back to 1 on a loss."""
+    multipliers = (1, 3, 2, 6)
+    return Strategy(
+        {
+            n: {"multiplier": multiplier, "won": (n + 1) % 4, "lost": 0}
+            for n, multiplier in enumerate(multipliers)
+        }
+    )
+
+
+def from_config(config):
+    """Return the strategies of a mapping loaded from YAML.
+
+    :param config: Strategy names mapped to the arguments of
+        :class:`Strategy`: ``states`` and optionally ``initial`` and
+        ``outcome``.
+    :type config: dict
+    :returns: The strategies by name.
+    :rtype: dict
+    """
+    return {name: Strategy(**definition) for name, definition in config.items()}
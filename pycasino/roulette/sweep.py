@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Play a grid of configurations of players, stakes, bets and limits.
+
+:func:`grid` makes a :class:`Config` for every combination of the values
+of each parameter and :func:`sweep` plays a number of sessions of each
+configuration, in this process or spread over an executor.  Every
+configuration gets its own random stream derived from the master seed and
+its position in the grid, so the results of a seed don't depend on the
+executor or the order the jobs finish in.
+
+All the jobs of a process share the wheel layout and the compiled
+strategy tables, which are built once when the package is imported.
+Workers get the player classes rather than their registered names, and
+the tables of strategies that only exist in the parent, like those loaded
+from YAML, so they need no registry of their own.
+
+"""
+import collections
+import itertools
+import random
+import sys
+from . import model
+from . import parallel
+from . import player as plr
+from . import strategy
+from . import wheel_builder
+
+
+Config = collections.namedtuple(
+    "Config", ["player", "stake", "base_bet_amount", "max_rounds", "table_limit"]
+)
+Config.__doc__ = """One configuration of a sweep.
+
+The name of a registered player, its stake, base bet and maximum rounds,
+and the table limit.
+
+"""
+
+
+def parse_values(values, convert=float):
+    """Return the values of a parameter, with ranges expanded.
+
+    A value is either a number or a range ``"start:stop:step"``, which
+    includes ``stop`` when the steps land on it.
+
+    :param values: The values and ranges.
+    :type values: iterable
+    :param convert: The type of the values, e.g. ``float`` or ``int``.
+    :returns: The values in order.
+    :rtype: list
+    :raises ValueError: If a range is malformed.
+    """
+    parsed = list()
+    for value in values:
+        if not isinstance(value, str) or ":" not in value:
+            parsed.append(convert(value))
+            continue
+        try:
+            start, stop, step = (convert(part) for part in value.split(":"))
+        except ValueError:
+            raise ValueError(f"Ranges are start:stop:step, not {value!r}.") from None
+        if step <= 0:
+            raise ValueError(f"The step of {value!r} must be positive.")
+        count = int((stop - start) / step + 1e-9) + 1
+        parsed.extend(convert(start + i * step) for i in range(max(count, 0)))
+    return parsed
+
+
+def grid(players, stakes, base_bet_amounts, max_rounds, table_limits):
+    """Return a :class:`Config` for every combination of the values."""
+    return [
+        Config(*values)
+        for values in itertools.product(
+            players, stakes, base_bet_amounts, max_rounds, table_limits
+        )
+    ]
+
+
+def _cost(config):
+    """An estimate of the spins a configuration plays per session."""
+    return config.max_rounds, config.stake / config.base_bet_amount
+
+
+def _portable(player_cls):
+    """Return the player class, or its tables if it can't be pickled.
+
+    Classes are pickled by reference, so a class made at run time, like a
+    strategy loaded from YAML, is sent as its compiled tables.
+
+    """
+    module = sys.modules.get(player_cls.__module__)
+    if getattr(module, player_cls.__qualname__, None) is player_cls:
+        return player_cls
+    if issubclass(player_cls, plr.StrategyPlayer):
+        return player_cls.tables
+    return player_cls
+
+
+def play(config, samples, seed=None, engine="scalar", player_cls=None):
+    """Play ``samples`` sessions of a configuration.
+
+    :param config: The configuration.
+    :type config: Config
+    :param samples: The number of sessions.
+    :type samples: int
+    :param seed: The seed of the sessions.
+    :type seed: int
+    :param engine: ``"scalar"`` or ``"vectorized"``.
+    :type engine: str
+    :param player_cls: The class of the player, or the tables of its
+        strategy, defaults to the player registered as ``config.player``.
+    :type player_cls: type
+    :returns: The summary of the sessions.
+    :rtype: stats.SessionStats
+    """
+    if player_cls is None:
+        player_cls = plr.REGISTERED_PLAYERS[config.player]
+    elif isinstance(player_cls, strategy.Tables):
+        player_cls = plr.strategy_player(config.player, player_cls)
+    game = model.Game(model.Table(config.table_limit), wheel_builder.create_wheel())
+    player = player_cls(
+        stake=config.stake,
+        base_bet_amount=config.base_bet_amount,
+        rounds=config.max_rounds,
+    )
+    simulator_cls = model.Simulator
+    if engine == "vectorized":
+        from . import vectorized
+
+        simulator_cls = vectorized.VectorizedSimulator
+    simulator = simulator_cls(game, player)
+    collections.deque(simulator.iter_sessions(samples, seed=seed), maxlen=0)
+    return simulator.stats
+
+
+def sweep(configs, samples, executor=None, seed=None, engine="scalar"):
+    """Play ``samples`` sessions of every configuration.
+
+    The configurations with the most rounds are submitted first so the
+    longest jobs don't hold up the end of the sweep.
+
+    :param configs: The configurations, e.g. from :func:`grid`.
+    :type configs: list
+    :param samples: The number of sessions per configuration.
+    :type samples: int
+    :param executor: Where to play the configurations, defaults to this
+        process.
+    :type executor: concurrent.futures.Executor
+    :param seed: The master seed.
+    :type seed: int
+    :param engine: ``"scalar"`` or ``"vectorized"``.
+    :type engine: str
+    :returns: A :class:`stats.SessionStats` per configuration, in order.
+    :rtype: list
+    """
+    if executor is None:
+        executor = parallel.SerialExecutor()
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    order = sorted(
+        range(len(configs)), key=lambda index: _cost(configs[index]), reverse=True
+    )
+    players = {
+        config.player: _portable(plr.REGISTERED_PLAYERS[config.player])
+        for config in configs
+    }
+    futures = {
+        index: executor.submit(
+            play,
+            configs[index],
+            samples,
+            parallel.stream_seed(seed, index),
+            engine,
+            players[configs[index].player],
+        )
+        for index in order
+    }
+    return [futures[index].result() for index in range(len(configs))]
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Estimate the means of session results with less variance.
+
+:func:`estimate` plays the sessions of a simulator with one of these
+methods, and returns an :class:`Estimate` of the mean of every field of
+:class:`model.SessionResult`, e.g. the ruin probability for ``ruined``:
+
+* :class:`Plain`: independent sessions, as :meth:`model.Simulator.gather`.
+* :class:`Antithetic`: pairs of sessions, the second spinning the mirror
+  image of every spin of the first, which swaps the Red and Black bins
+  and the two zeros.  Bets on colors or parity then go opposite ways in
+  the two sessions.
+* :class:`Stratified`: the first spins of the sessions run through every
+  combination of bins equally often, rather than at random.
+* :class:`ControlVariate`: each session's net winnings are compared with
+  their expected value, known from the odds of the outcomes bet on and
+  the number of bins containing them.  Their difference, the session's
+  luck, has a mean of zero, and regressing the results on it removes the
+  variance it explains.
+
+Every estimate reports its effective number of sessions: how many
+independent sessions would give the same standard error.
+
+Sessions are played in chunks like :func:`parallel.gather`, so the
+estimates of a seed don't depend on the executor.
+
+"""
+import collections
+import math
+import random
+from . import model
+from . import parallel
+from . import stats
+
+Estimate = collections.namedtuple(
+    "Estimate", ["mean", "std_error", "samples", "effective_samples"]
+)
+Estimate.__doc__ = """The estimate of the mean of a statistic.
+
+Its standard error, the number of sessions played and the number of
+independent sessions that would give the same standard error.
+
+"""
+
+
+def mirror_bins(wheel):
+    """Return the bin number each bin mirrors to in antithetic spins.
+
+    The n-th Black bin and the n-th Red bin swap, as do the bins of
+    neither color.
+
+    """
+    black = wheel.all_outcomes["Black"]
+    red = wheel.all_outcomes["Red"]
+    blacks = [n for n, bin_ in enumerate(wheel.bins) if black in bin_]
+    reds = [n for n, bin_ in enumerate(wheel.bins) if red in bin_]
+    others = [n for n in range(len(wheel.bins)) if n not in blacks + reds]
+    mirror = list(range(len(wheel.bins)))
+    for a, b in zip(blacks + reds + others, reds + blacks + others[::-1]):
+        mirror[a] = b
+    return mirror
+
+
+class AntitheticSpins:
+    """Spins of pairs of sessions, the second mirroring the first.
+
+    Takes the place of the random number generator of a wheel.  Spins
+    past the end of the first session of a pair are drawn afresh.
+
+    :param random_num_gen: Draws the spins of the first sessions.
+    :param mirror: The bin number each bin mirrors to.
+    :type mirror: list
+
+    """
+
+    def __init__(self, random_num_gen, mirror):
+        self.random_num_gen = random_num_gen
+        self.mirror = mirror
+        self.numbers = list()
+        self.position = None
+
+    def first(self):
+        """Draw the spins of the first session of a new pair."""
+        self.numbers.clear()
+        self.position = None
+
+    def second(self):
+        """Mirror the spins of the first session of the pair."""
+        self.position = 0
+
+    def choice(self, seq):
+        if self.position is None:
+            number = self.random_num_gen.randrange(len(seq))
+            self.numbers.append(number)
+        elif self.position < len(self.numbers):
+            number = self.mirror[self.numbers[self.position]]
+            self.position += 1
+        else:
+            number = self.random_num_gen.randrange(len(seq))
+        return seq[number]
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({len(self.numbers)} spins)"
+
+
+class StratifiedSpins:
+    """Spins whose first few are fixed, the rest random.
+
+    Takes the place of the random number generator of a wheel.
+
+    :param random_num_gen: Draws the spins that aren't fixed.
+
+    """
+
+    def __init__(self, random_num_gen):
+        self.random_num_gen = random_num_gen
+        self.fixed = list()
+
+    def start(self, fixed):
+        """Start a session whose first spins are the bin numbers ``fixed``."""
+        self.fixed = list(reversed(fixed))
+
+    def choice(self, seq):
+        if self.fixed:
+            return seq[self.fixed.pop()]
+        return seq[self.random_num_gen.randrange(len(seq))]
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({len(self.fixed)} fixed)"
+
+
+class ExpectationTable(model.Table):
+    """A table that adds up the expected net winnings of its bets.
+
+    :param limit: The table limit.
+    :type limit: float
+    :param edges: The expected net winnings of a unit bet, by outcome id.
+    :type edges: dict
+
+    """
+
+    def __init__(self, limit, edges):
+        self.edges = edges
+        self.expected = 0.0
+        super().__init__(limit)
+
+    def place_bet(self, bet):
+        super().place_bet(bet)
+        self.expected += bet.amount_bet * self.edges[bet.outcome.id]
+
+
+def bet_edges(wheel):
+    """Return the expected net winnings of a unit bet on every outcome.
+
+    A bet on an outcome with odds ``r`` in ``k`` of ``n`` bins returns
+    ``r + 1`` times the bet with probability ``k / n``.
+
+    """
+    counts = collections.Counter(
+        outcome for bin_ in wheel.bins for outcome in bin_.outcomes
+    )
+    return {
+        outcome.id: counts[outcome] / len(wheel.bins) * (outcome.odds + 1) - 1
+        for outcome in wheel.all_outcomes.values()
+    }
+
+
+def _effective(samples, variance, estimator_variance):
+    """The sessions of plain sampling with the variance of an estimator."""
+    if estimator_variance > 0:
+        return variance / estimator_variance
+    return math.inf if variance > 0 else samples
+
+
+class Plain:
+    """Independent sessions, the reference of the other methods."""
+
+    fields = model.SessionResult._fields
+
+    # Sessions a chunk of work must be a multiple of.
+    granularity = 1
+
+    def __init__(self):
+        self.moments = {field: stats.Moments() for field in self.fields}
+
+    @classmethod
+    def for_simulator(cls, simulator):
+        """Return an estimator of the sessions of a simulator."""
+        return cls()
+
+    def _empty(self):
+        """Return an estimator like this one, with no sessions."""
+        return self.__class__()
+
+    def check(self, samples):
+        """Raise ValueError if the method can't estimate from ``samples``."""
+        if samples < 2:
+            raise ValueError("Estimating a variance needs at least two sessions.")
+
+    def _session(self, simulator):
+        (record,) = simulator._sessions(1)
+        for field, value in zip(self.fields, record):
+            self.moments[field].add(value)
+        return record
+
+    def play(self, simulator, start, count):
+        """Play the sessions numbered ``start`` to ``start + count``."""
+        for _ in range(count):
+            self._session(simulator)
+
+    def merge(self, other):
+        """Add the sessions of another estimator of the same kind."""
+        for field in self.fields:
+            self.moments[field].merge(other.moments[field])
+        return self
+
+    def _estimate(self, field):
+        """Return the mean of a field and the variance of the estimate."""
+        moments = self.moments[field]
+        return moments.mean, moments.variance / moments.count
+
+    def estimates(self):
+        """Return an :class:`Estimate` of every field."""
+        estimates = dict()
+        for field in self.fields:
+            mean, variance = self._estimate(field)
+            moments = self.moments[field]
+            estimates[field] = Estimate(
+                mean,
+                math.sqrt(variance),
+                moments.count,
+                _effective(moments.count, moments.variance, variance),
+            )
+        return estimates
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + "()"
+
+
+class Antithetic(Plain):
+    """Pairs of sessions on mirrored spins, see :class:`AntitheticSpins`."""
+
+    granularity = 2
+
+    def __init__(self):
+        super().__init__()
+        self.pairs = {field: stats.Moments() for field in self.fields}
+
+    def check(self, samples):
+        if samples < 4 or samples % 2:
+            raise ValueError(
+                "Antithetic sampling needs an even number of at least four sessions."
+            )
+
+    def play(self, simulator, start, count):
+        wheel = simulator.game.wheel
+        spins = AntitheticSpins(wheel.random_num_gen, mirror_bins(wheel))
+        wheel.random_num_gen = spins
+        try:
+            for _ in range(count // 2):
+                spins.first()
+                first = self._session(simulator)
+                spins.second()
+                second = self._session(simulator)
+                for field, a, b in zip(self.fields, first, second):
+                    self.pairs[field].add((a + b) / 2)
+        finally:
+            wheel.random_num_gen = spins.random_num_gen
+
+    def merge(self, other):
+        super().merge(other)
+        for field in self.fields:
+            self.pairs[field].merge(other.pairs[field])
+        return self
+
+    def _estimate(self, field):
+        pairs = self.pairs[field]
+        return pairs.mean, pairs.variance / pairs.count
+
+
+class Stratified(Plain):
+    """Sessions whose first spins run through every combination of bins.
+
+    Session ``i`` is in stratum ``i`` modulo the number of combinations,
+    each stratum being equally likely.
+
+    :param bins: The number of bins of the wheel.
+    :type bins: int
+    :param spins: The number of spins stratified.
+    :type spins: int
+
+    """
+
+    def __init__(self, bins, spins=1):
+        super().__init__()
+        self.bins = bins
+        self.spins = spins
+        self.strata = [
+            {field: stats.Moments() for field in self.fields}
+            for _ in range(bins**spins)
+        ]
+
+    @classmethod
+    def for_simulator(cls, simulator):
+        return cls(len(simulator.game.wheel.bins))
+
+    def _empty(self):
+        return self.__class__(self.bins, self.spins)
+
+    def check(self, samples):
+        if samples < 2 * len(self.strata):
+            raise ValueError(
+                f"Stratifying {self.spins} spins needs at least "
+                f"{2 * len(self.strata)} sessions."
+            )
+
+    def _fixed(self, stratum):
+        fixed = list()
+        for _ in range(self.spins):
+            stratum, number = divmod(stratum, self.bins)
+            fixed.append(number)
+        return fixed
+
+    def play(self, simulator, start, count):
+        wheel = simulator.game.wheel
+        if len(wheel.bins) != self.bins:
+            raise ValueError(
+                f"Strata of {self.bins} bins don't fit a wheel of {len(wheel.bins)}."
+            )
+        spins = StratifiedSpins(wheel.random_num_gen)
+        wheel.random_num_gen = spins
+        try:
+            for index in range(start, start + count):
+                stratum = index % len(self.strata)
+                spins.start(self._fixed(stratum))
+                record = self._session(simulator)
+                for field, value in zip(self.fields, record):
+                    self.strata[stratum][field].add(value)
+        finally:
+            wheel.random_num_gen = spins.random_num_gen
+
+    def merge(self, other):
+        super().merge(other)
+        for mine, theirs in zip(self.strata, other.strata):
+            for field in self.fields:
+                mine[field].merge(theirs[field])
+        return self
+
+    def _estimate(self, field):
+        weight = 1 / len(self.strata)
+        mean = variance = 0.0
+        for stratum in self.strata:
+            moments = stratum[field]
+            mean += weight * moments.mean
+            variance += weight**2 * moments.variance / moments.count
+        return mean, variance
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.bins!r}, {self.spins!r})"
+
+
+class ControlVariate(Plain):
+    """Sessions regressed on their net winnings less the expected ones.
+
+    The control of a session is its final stake, less its initial stake
+    and the expected net winnings of every bet it placed, see
+    :class:`ExpectationTable`.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.covariances = {field: stats.Covariance() for field in self.fields}
+
+    def play(self, simulator, start, count):
+        game = simulator.game
+        table = game.table
+        game.table = ExpectationTable(table.limit, bet_edges(game.wheel))
+        stake = simulator._original_player.stake
+        try:
+            for _ in range(count):
+                game.table.expected = 0.0
+                record = self._session(simulator)
+                control = record.final - stake - game.table.expected
+                for field, value in zip(self.fields, record):
+                    self.covariances[field].add(value, control)
+        finally:
+            game.table = table
+
+    def merge(self, other):
+        super().merge(other)
+        for field in self.fields:
+            self.covariances[field].merge(other.covariances[field])
+        return self
+
+    def _estimate(self, field):
+        covariance = self.covariances[field]
+        if not covariance.y.variance > 0:
+            return super()._estimate(field)
+        beta = covariance.covariance / covariance.y.variance
+        mean = covariance.x.mean - beta * covariance.y.mean
+        residual = covariance.x.variance - beta * covariance.covariance
+        return mean, max(residual, 0.0) / covariance.count
+
+
+# The estimators by name.
+METHODS = {
+    "plain": Plain,
+    "antithetic": Antithetic,
+    "stratified": Stratified,
+    "control": ControlVariate,
+}
+
+
+def _play_chunk(simulator, estimator, start, count, seed):
+    """Play one chunk with a fresh simulator and estimator."""
+    simulator.seed(seed)
+    estimator.play(simulator, start, count)
+    return estimator
+
+
+def estimate(simulator, samples, method="plain", executor=None, seed=None):
+    """Estimate the mean results of a simulator's sessions.
+
+    :param simulator: The simulator whose sessions to play.
+    :type simulator: model.Simulator
+    :param samples: The number of sessions.
+    :type samples: int
+    :param method: A name in :data:`METHODS`, or an estimator like
+        ``Stratified(len(wheel.bins), spins=2)``.
+    :param executor: Where to play the chunks, defaults to this process.
+    :type executor: concurrent.futures.Executor
+    :param seed: The master seed.
+    :type seed: int
+    :returns: An :class:`Estimate` for every field of a session result.
+    :rtype: dict
+    :raises ValueError: If the method can't estimate from ``samples``.
+    """
+    if isinstance(method, str):
+        estimator = METHODS[method].for_simulator(simulator)
+    else:
+        estimator = method
+    estimator.check(samples)
+    if executor is None:
+        executor = parallel.SerialExecutor()
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    # Chunks must not split the pairs of antithetic sessions.
+    chunk_size = max(simulator.chunk_size // estimator.granularity, 1)
+    chunk_size *= estimator.granularity
+    futures = [
+        executor.submit(
+            _play_chunk,
+            simulator._spawn(),
+            estimator._empty(),
+            start,
+            min(chunk_size, samples - start),
+            parallel.stream_seed(seed, index),
+        )
+        for index, start in enumerate(range(0, samples, chunk_size))
+    ]
+    for future in futures:
+        estimator.merge(future.result())
+    return estimator.estimates()
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A NumPy engine that plays many roulette sessions at once.
+
+Every session is a lane in a set of arrays.  Stakes, rounds left and the
+betting strategy's state are all arrays, the wheel is spun once per step
+for all lanes, and lanes whose player has stopped are masked out and
+dropped.  Each registered player has a kernel that re-implements its
+strategy on arrays, so the results match :class:`model.Simulator`
+statistically.
+
+NumPy is an optional dependency, install it with ``pip install
+pycasino[vectorized]``.
+
+"""
+import copy
+import time
+import numpy as np
+from . import model
+from . import profiling
+from . import player as plr
+
+
+# Kernels keyed by the exact player class they re-implement.
+KERNELS = {}
+
+
+def register_kernel(player_cls):
+    """Registers the wrapped kernel as the batch version of ``player_cls``.
+
+    The lookup uses the exact class of the player, so a subclass with a
+    different strategy (e.g. :class:`player.PlayerSevenReds`) never falls
+    back to the kernel of its parent.
+
+    """
+
+    def wrapper(cls):
+        KERNELS[player_cls] = cls
+        return cls
+
+    return wrapper
+
+
+def _hit_mask(wheel, name):
+    """Return a boolean array, True for the bins containing the outcome."""
+    outcome = wheel.all_outcomes[name]
+    return np.array([outcome in bin_ for bin_ in wheel.bins])
+
+
+class _Kernel:
+    """Base class for the batch version of a betting strategy.
+
+    :param player: The player whose initial state is copied to every lane.
+    :type player: Player
+    :param wheel: The wheel the lanes play on.
+    :param lanes: The number of sessions to play at once.
+    :type lanes: int
+
+    """
+
+    # Names of the per-lane state arrays.
+    _fields = ()
+
+    def __init__(self, player, wheel, lanes):
+        self.base_bet_amount = player.base_bet_amount
+        self._black = _hit_mask(wheel, "Black")
+
+    def compress(self, keep):
+        """Drop the lanes where ``keep`` is False."""
+        for name in self._fields:
+            setattr(self, name, getattr(self, name)[keep])
+
+    def threshold(self):
+        """The amount the stake must exceed for a player to keep playing."""
+        return self.base_bet_amount
+
+    def playing(self):
+        """Any strategy specific reasons to stop, besides stake and rounds."""
+        return True
+
+    def place(self):
+        """Return the amount each lane bets, before the table limit."""
+        return self.threshold()
+
+    def settle(self, spins, random_num_gen):
+        """Return which lanes won and the odds they were paid."""
+        return self._black[spins], 1.0
+
+    def update(self, spins, won):
+        """Advance the strategy state after the bets were settled."""
+
+
+@register_kernel(plr.PlayerMartingale)
+@register_kernel(plr.PlayerFibonacci)
+@register_kernel(plr.Player1326)
+class _StrategyKernel(_Kernel):
+    """Runs the compiled :class:`strategy.Tables` of a strategy player."""
+
+    _fields = ("state",)
+
+    def __init__(self, player, wheel, lanes):
+        super().__init__(player, wheel, lanes)
+        tables = player.tables
+        self._initial = tables.initial
+        self._multipliers = np.array(tables.multipliers)
+        self._on_win = np.array(tables.on_win, dtype=np.int64)
+        self._on_loss = np.array(tables.on_loss, dtype=np.int64)
+        outcomes = list(dict.fromkeys(tables.outcomes))
+        self._outcome = np.array([outcomes.index(o) for o in tables.outcomes])
+        self._odds = np.array([outcome.odds for outcome in outcomes], dtype=float)
+        self._hits = np.array(
+            [[outcome in bin_ for outcome in outcomes] for bin_ in wheel.bins]
+        )
+        self.state = np.full(lanes, player.state, dtype=np.int64)
+
+    def threshold(self):
+        return self.base_bet_amount * self._multipliers[self.state]
+
+    def settle(self, spins, random_num_gen):
+        picks = self._outcome[self.state]
+        return self._hits[spins, picks], self._odds[picks]
+
+    def update(self, spins, won):
+        self.state = np.where(won, self._on_win[self.state], self._on_loss[self.state])
+
+
+@register_kernel(plr.PlayerSevenReds)
+class _SevenRedsKernel(_StrategyKernel):
+    _fields = ("state", "red_count", "seen_red")
+
+    def __init__(self, player, wheel, lanes):
+        super().__init__(player, wheel, lanes)
+        self._red = _hit_mask(wheel, "Red")
+        self.red_count = np.full(lanes, player._red_count, dtype=np.int64)
+        self.seen_red = np.full(lanes, player.history.totals[player._red] > 0)
+
+    def place(self):
+        # Mirrors PlayerSevenReds._determine_bets, the count only moves
+        # while waiting and a waiting player bets nothing.
+        waiting = self.red_count != 0
+        self.red_count = np.where(
+            waiting, np.where(self.seen_red, self.red_count - 1, 7), self.red_count
+        )
+        return np.where(waiting, 0.0, self.threshold())
+
+    def update(self, spins, won):
+        waiting = self.red_count != 0
+        super().update(spins, won)
+        self.state = np.where(
+            waiting, self._initial, self.state
+        )  # Keeps bets from inflating during wait.
+        self.seen_red = self.seen_red | self._red[spins]
+
+
+@register_kernel(plr.PlayerCancellation)
+class _CancellationKernel(_Kernel):
+    """Keeps each lane's sequence in a row of a 2D buffer.
+
+    The live part of a row lies between ``head`` and ``tail``, a win moves
+    both ends inward and a loss appends at ``tail``.  The buffer doubles in
+    width whenever a row runs out of room.
+
+    """
+
+    _fields = ("sequence", "head", "tail")
+
+    def __init__(self, player, wheel, lanes):
+        super().__init__(player, wheel, lanes)
+        initial = np.asarray(player.sequence, dtype=float)
+        self.sequence = np.zeros((lanes, 2 * len(initial)))
+        self.sequence[:, : len(initial)] = initial
+        self.head = np.zeros(lanes, dtype=np.int64)
+        self.tail = np.full(lanes, len(initial), dtype=np.int64)
+
+    def _ends(self):
+        rows = np.arange(len(self.head))
+        last = np.maximum(self.tail - 1, 0)
+        return self.sequence[rows, self.head], self.sequence[rows, last]
+
+    def threshold(self):
+        first, last = self._ends()
+        return first + last
+
+    def playing(self):
+        return (self.tail - self.head) > 1
+
+    def update(self, spins, won):
+        bet_amount = self.threshold()
+        lost = ~won
+        if np.any(lost & (self.tail == self.sequence.shape[1])):
+            self.sequence = np.concatenate(
+                [self.sequence, np.zeros_like(self.sequence)], axis=1
+            )
+        rows = np.flatnonzero(lost)
+        self.sequence[rows, self.tail[rows]] = bet_amount[rows]
+        self.head = np.where(won, self.head + 1, self.head)
+        self.tail = np.where(won, self.tail - 1, self.tail + 1)
+
+
+@register_kernel(plr.PlayerRandom)
+class _RandomKernel(_Kernel):
+    def __init__(self, player, wheel, lanes):
+        super().__init__(player, wheel, lanes)
+        outcomes = player._outcomes
+        self._odds = np.array([outcome.odds for outcome in outcomes], dtype=float)
+        self._hits = np.array(
+            [[outcome in bin_ for outcome in outcomes] for bin_ in wheel.bins]
+        )
+
+    def settle(self, spins, random_num_gen):
+        picks = random_num_gen.integers(0, len(self._odds), size=len(spins))
+        return self._hits[spins, picks], self._odds[picks]
+
+
+class VectorizedSimulator(model.Simulator):
+    """Collects roulette simulation statistics, many sessions at a time.
+
+    A drop-in replacement for :class:`model.Simulator` for the players
+    that have a registered kernel and for every
+    :class:`player.StrategyPlayer`.
+
+    :param game: An instance of :class:`Game`.
+    :type game: Game
+    :param player: An instance of :class:`Player`.
+    :type player: Player
+    :param seed: A seed for the random number generator.
+    :type seed: int
+    :param batch_size: The maximum number of sessions played at once.
+    :type batch_size: int
+
+    The batches are independent of :attr:`chunk_size`, the number of
+    sessions on one random stream, which stays that of
+    :class:`model.Simulator`.
+
+    """
+
+    def __init__(self, game, player, seed=None, batch_size=100_000):
+        self._kernel_cls = KERNELS.get(type(player))
+        if self._kernel_cls is None and isinstance(player, plr.StrategyPlayer):
+            self._kernel_cls = _StrategyKernel
+        if self._kernel_cls is None:
+            raise TypeError(f"{type(player).__qualname__} has no vectorized kernel.")
+        super().__init__(game, player)
+        self.batch_size = batch_size
+        self.random_num_gen = np.random.default_rng(seed)
+
+    def _batch(self, lanes):
+        """Play ``lanes`` sessions at once.
+
+        :returns: A :class:`model.SessionResult` of arrays.
+        :rtype: SessionResult
+        """
+        player = self._original_player
+        kernel = self._kernel_cls(player, self.game.wheel, lanes)
+        n_bins = len(self.game.wheel.bins)
+        limit = self.game.table.limit
+
+        ids = np.arange(lanes)
+        stake = np.full(lanes, player.stake)
+        rounds = np.full(lanes, player.rounds, dtype=np.int64)
+        peak = stake.copy()
+        drawdown = np.zeros(lanes)
+        played = np.zeros(lanes, dtype=np.int64)
+        results = model.SessionResult(
+            maximum=np.empty(lanes),
+            duration=np.empty(lanes, dtype=np.int64),
+            final=np.empty(lanes),
+            drawdown=np.empty(lanes),
+            ruined=np.empty(lanes, dtype=bool),
+        )
+
+        while ids.size:
+            threshold, strategy_playing = kernel.threshold(), kernel.playing()
+            playing = (stake > threshold) & (rounds > 0) & strategy_playing
+            if not playing.all():
+                stopped, done = ids[~playing], ~playing
+                results.maximum[stopped] = peak[done]
+                results.duration[stopped] = played[done]
+                results.final[stopped] = stake[done]
+                results.drawdown[stopped] = drawdown[done]
+                results.ruined[stopped] = ((stake <= threshold) & strategy_playing)[
+                    done
+                ]
+                ids, stake, rounds = ids[playing], stake[playing], rounds[playing]
+                peak, played = peak[playing], played[playing]
+                drawdown = drawdown[playing]
+                kernel.compress(playing)
+                if not ids.size:
+                    break
+
+            bet = np.minimum(kernel.place(), limit)
+            spins = self.random_num_gen.integers(0, n_bins, size=ids.size)
+            won, odds = kernel.settle(spins, self.random_num_gen)
+            stake = stake - bet
+            stake = np.where(won, stake + (bet + bet * odds), stake)
+            rounds -= 1
+            played += 1
+            kernel.update(spins, won)
+            peak = np.maximum(peak, stake)
+            drawdown = np.maximum(drawdown, peak - stake)
+
+        return results
+
+    def _batches(self, samples):
+        strategy = type(self._original_player).__qualname__
+        for start in range(0, samples, self.batch_size):
+            begin = time.perf_counter()
+            batch = self._batch(min(self.batch_size, samples - start))
+            if self.profiler is not None:
+                self.profiler.add(strategy, "batch", time.perf_counter() - begin)
+            yield model.SessionResult(*(column.tolist() for column in batch))
+
+    def _sessions(self, samples):
+        for columns in self._batches(samples):
+            yield from map(model.SessionResult, *columns)
+
+    def _play(self, samples):
+        columns = model.SessionResult(*(list() for _ in model.SessionResult._fields))
+        for batch in self._batches(samples):
+            for column, values in zip(columns, batch):
+                column.extend(values)
+        return columns
+
+    def _spawn(self):
+        spawned = self.__class__(
+            copy.deepcopy(self.game),
+            self._original_player,
+            batch_size=self.batch_size,
+        )
+        if self.profiler is not None:
+            spawned.profile(profiling.PhaseTimes())
+        return spawned
+
+    def seed(self, seed):
+        self.random_num_gen = np.random.default_rng(seed)
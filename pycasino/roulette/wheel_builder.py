@@ -1,17 +1,53 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-"""A set of functions used to add bins to the wheel."""
+"""A set of functions used to add bins to the wheel.
+
+The functions below describe the layout of the wheel.  Rather than running
+them for every wheel, their result is stored as static tables in
+:mod:`layout`, generated by :func:`write_layout`, and :func:`create_wheel`
+returns wheels that share the bins built from those tables.
+
+"""
+import json
+import os
 from . import model
 from .model import Outcome
 
 
 def get_outcome(name):
     """Return an outcome given a name."""
-    return create_wheel().all_outcomes.get(name)
+    return outcome_registry().get(name)
+
+
+def outcome_registry():
+    """Return the :class:`model.OutcomeRegistry` of every outcome.
+
+    It is built the first time it is needed, also as ``OUTCOMES``.
+    Outcomes are interned so these are the same objects found in the bins
+    of any wheel from :func:`create_wheel`.
+
+    """
+    global _outcomes
+    if _outcomes is None:
+        _outcomes = model.OutcomeRegistry(create_wheel().all_outcomes.values())
+    return _outcomes
+
+
+_outcomes = None
 
 
 def create_wheel():
-    """Populate the bins in wheel with outcomes."""
+    """Return a wheel sharing the bins of the standard layout.
+
+    The bins are built once per process, every wheel only gets its own
+    random number generator.
+
+    """
+    return model._Wheel.standard()
+
+
+def build_wheel():
+    """Populate the bins of a new wheel with outcomes."""
     wheel = model._Wheel()
     _add_straight_bets(wheel)
     _add_split_bets(wheel)
@@ -159,3 +195,49 @@ def _add_even_money_bets(wheel):
             wheel.add_outcome(num, red_outcome)
         else:
             wheel.add_outcome(num, black_outcome)
+
+
+def layout_tables(wheel):
+    """Return the static tables describing the layout of a wheel.
+
+    :returns: The (name, odds) of every outcome and, for every bin, the
+        indices of its outcomes in the first table.
+    :rtype: tuple
+    """
+    outcomes = list(wheel.all_outcomes.values())
+    index = {outcome: i for i, outcome in enumerate(outcomes)}
+    return (
+        tuple((outcome.name, outcome.odds) for outcome in outcomes),
+        tuple(tuple(sorted(index[o] for o in bin_.outcomes)) for bin_ in wheel.bins),
+    )
+
+
+def write_layout(path=None):
+    """Write the tables of the wheel from :func:`build_wheel` as a module."""
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), "layout.py")
+    outcomes, bins = layout_tables(build_wheel())
+    lines = [
+        "#!/usr/bin/env python3",
+        "# -*- coding: utf-8 -*-",
+        '"""The layout of the standard wheel as static tables.',
+        "",
+        "Generated by :func:`wheel_builder.write_layout`, do not edit.",
+        "",
+        '"""',
+        "# (name, odds) of every outcome.",
+        "OUTCOMES = (",
+    ]
+    lines += [f"    ({json.dumps(name)}, {odds})," for name, odds in outcomes]
+    lines += [")", "# The indices in OUTCOMES of the outcomes in each bin.", "BINS = ("]
+    lines += [f"    {members!r}," for members in bins]
+    lines += [")"]
+    with open(path, "w") as module:
+        module.write("\n".join(lines) + "\n")
+
+
+def __getattr__(name):
+    # OUTCOMES is built on first use rather than when the module is imported.
+    if name == "OUTCOMES":
+        return outcome_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
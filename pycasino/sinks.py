@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Sinks that write simulation results as they are produced.
+
+:class:`BufferedSink` writes lines of text and suits small runs printed
+to a terminal.  :class:`ColumnSink` and its subclasses collect records in
+typed arrays and write them to a file in large batches, as CSV, a NumPy
+``.npy`` file, an Arrow IPC file or Parquet, optionally compressed.  See
+:func:`open_sink`.
+
+"""
+import abc
+import array
+import importlib
+
+
+class BufferedSink:
+    """Writes records to a text stream in chunks of lines.
+
+    Records are formatted into a buffer that is written and flushed every
+    ``chunk_size`` records, so memory stays bounded and whatever reads the
+    stream sees results while the simulation is still running.
+
+    :param stream: A text stream to write to, e.g. ``sys.stdout``.
+    :param header: A line written before any records.
+    :type header: str
+    :param chunk_size: The number of records written at a time.
+    :type chunk_size: int
+
+    """
+
+    def __init__(self, stream, header=None, chunk_size=10_000):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._lines = list()
+        if header is not None:
+            self.stream.write(header + "\n")
+
+    def format(self, record):
+        """Return the line written for a record."""
+        return ", ".join(str(field) for field in record)
+
+    def write(self, record):
+        """Buffer a record, writing the buffer out once it is full."""
+        self._lines.append(self.format(record))
+        if len(self._lines) >= self.chunk_size:
+            self.flush()
+
+    def write_all(self, records):
+        """Write every record of an iterable."""
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Write out the buffered records."""
+        if self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.stream!r})"
+
+
+# The name and array type of each field of a model.SessionResult.
+COLUMNS = (
+    ("maximum_stake", "d"),
+    ("rounds_played", "q"),
+    ("final_stake", "d"),
+    ("max_drawdown", "d"),
+    ("ruined", "b"),
+)
+
+# The modules of the compressions of CSV and NPY files, by name.
+_COMPRESSION_MODULES = {"gzip": "gzip", "bz2": "bz2", "xz": "lzma"}
+
+
+def _open(path, mode, compression=None, **kwargs):
+    """Open a file, compressed with a compression in _COMPRESSION_MODULES."""
+    if compression is None:
+        return open(path, mode, **kwargs)
+    module = importlib.import_module(_COMPRESSION_MODULES[compression])
+    return module.open(path, mode, **kwargs)
+
+
+class ColumnSink(abc.ABC):
+    """Writes records to a file in batches of typed columns.
+
+    Records are appended to one array per field of :data:`COLUMNS`, which
+    are handed to :meth:`write_batch` every ``chunk_size`` records.
+
+    :param path: The file to write.
+    :type path: str
+    :param compression: The name of a compression in ``compressions``.
+    :type compression: str
+    :param chunk_size: The number of records written at a time.
+    :type chunk_size: int
+    :raises ValueError: If the compression isn't supported by the format.
+
+    """
+
+    # The compressions the format supports besides None.
+    compressions = ()
+
+    def __init__(self, path, compression=None, chunk_size=100_000):
+        if compression is not None and compression not in self.compressions:
+            raise ValueError(
+                f"{self.__class__.__qualname__} supports the compressions "
+                f"{', '.join(self.compressions) or 'none'}, not {compression!r}."
+            )
+        self.path = path
+        self.compression = compression
+        self.chunk_size = chunk_size
+        self.columns = tuple(array.array(typecode) for _, typecode in COLUMNS)
+
+    def write(self, record):
+        """Buffer a record, writing the buffer out once it is full."""
+        for column, value in zip(self.columns, record):
+            column.append(value)
+        if len(self.columns[0]) >= self.chunk_size:
+            self.flush()
+
+    def write_all(self, records):
+        """Write every record of an iterable."""
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Write out the buffered records."""
+        if self.columns[0]:
+            self.write_batch(self.columns)
+            # The batch may still use the buffers of the arrays it was given,
+            # so they are left as they are and replaced.
+            self.columns = tuple(array.array(typecode) for _, typecode in COLUMNS)
+
+    @abc.abstractmethod
+    def write_batch(self, columns):
+        """Write a batch of columns of equal length to the file."""
+        pass
+
+    def close(self):
+        """Write out the buffered records and close the file."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return self.__class__.__qualname__ + f"({self.path!r}, {self.compression!r})"
+
+
+class CsvSink(ColumnSink):
+    """Writes records as comma separated lines with a header."""
+
+    compressions = tuple(_COMPRESSION_MODULES)
+
+    def __init__(self, path, compression=None, chunk_size=100_000):
+        super().__init__(path, compression, chunk_size)
+        self._file = _open(path, "wt", compression, newline="")
+        self._file.write(",".join(name for name, _ in COLUMNS) + "\n")
+
+    def write_batch(self, columns):
+        lines = zip(*(map(str, column) for column in columns))
+        self._file.write("\n".join(map(",".join, lines)) + "\n")
+
+    def close(self):
+        super().close()
+        self._file.close()
+
+
+class NpySink(ColumnSink):
+    """Writes records as a NumPy structured array with a field per column.
+
+    The length of an ``.npy`` file is in its header, so the whole array is
+    kept in memory and written on :meth:`close`.  Compressed files can be
+    read with ``numpy.load(gzip.open(path))`` and the like.
+
+    """
+
+    compressions = tuple(_COMPRESSION_MODULES)
+
+    def __init__(self, path, compression=None, chunk_size=100_000):
+        import numpy  # noqa: F401
+
+        super().__init__(path, compression, chunk_size)
+        self._batches = list()
+
+    def write_batch(self, columns):
+        import numpy as np
+
+        batch = np.empty(
+            len(columns[0]), dtype=[(name, typecode) for name, typecode in COLUMNS]
+        )
+        for (name, typecode), column in zip(COLUMNS, columns):
+            batch[name] = np.frombuffer(column, dtype=typecode)
+        self._batches.append(batch)
+
+    def close(self):
+        import numpy as np
+
+        super().close()
+        dtype = [(name, typecode) for name, typecode in COLUMNS]
+        with _open(self.path, "wb", self.compression) as output:
+            np.save(output, np.concatenate(self._batches or [np.empty(0, dtype)]))
+
+
+def _arrow_types():
+    import pyarrow as pa
+
+    return {"d": pa.float64(), "q": pa.int64(), "b": pa.int8()}
+
+
+def _arrow_schema():
+    """Return the pyarrow.Schema of the columns."""
+    import pyarrow as pa
+
+    types = _arrow_types()
+    return pa.schema([(name, types[typecode]) for name, typecode in COLUMNS])
+
+
+def _arrow_batch(columns):
+    """Return the columns as a pyarrow.RecordBatch, without copying them.
+
+    The batch uses the buffers of the arrays, which mustn't change while
+    it is in use, see :meth:`ColumnSink.flush`.
+
+    """
+    import pyarrow as pa
+
+    types = _arrow_types()
+    return pa.record_batch(
+        [
+            pa.Array.from_buffers(
+                types[typecode], len(column), [None, pa.py_buffer(column)]
+            )
+            for (_, typecode), column in zip(COLUMNS, columns)
+        ],
+        schema=_arrow_schema(),
+    )
+
+
+class ArrowSink(ColumnSink):
+    """Writes records as an Arrow IPC (Feather version 2) file."""
+
+    compressions = ("lz4", "zstd")
+
+    def __init__(self, path, compression=None, chunk_size=100_000):
+        import pyarrow as pa
+
+        super().__init__(path, compression, chunk_size)
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        self._writer = pa.ipc.new_file(path, _arrow_schema(), options=options)
+
+    def write_batch(self, columns):
+        self._writer.write_batch(_arrow_batch(columns))
+
+    def close(self):
+        super().close()
+        self._writer.close()
+
+
+class ParquetSink(ColumnSink):
+    """Writes records as a Parquet file, a row group per batch."""
+
+    compressions = ("snappy", "gzip", "brotli", "lz4", "zstd")
+
+    def __init__(self, path, compression=None, chunk_size=100_000):
+        import pyarrow.parquet as pq
+
+        super().__init__(path, compression, chunk_size)
+        self._writer = pq.ParquetWriter(
+            path, _arrow_schema(), compression=compression or "none"
+        )
+
+    def write_batch(self, columns):
+        import pyarrow as pa
+
+        self._writer.write_table(pa.Table.from_batches([_arrow_batch(columns)]))
+
+    def close(self):
+        super().close()
+        self._writer.close()
+
+
+# Column sinks by format name.
+FORMATS = {
+    "csv": CsvSink,
+    "npy": NpySink,
+    "arrow": ArrowSink,
+    "parquet": ParquetSink,
+}
+
+
+def open_sink(path, format="csv", compression=None):
+    """Return a :class:`ColumnSink` writing a file in a format.
+
+    :param path: The file to write.
+    :type path: str
+    :param format: A name in :data:`FORMATS`.
+    :type format: str
+    :param compression: A compression the format supports, or None.
+    :type compression: str
+    :raises ValueError: If the compression isn't supported by the format.
+    :raises ImportError: If the format needs numpy or pyarrow and it is
+        missing.
+    """
+    return FORMATS[format](path, compression)
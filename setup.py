@@ -32,6 +32,8 @@ REQUIRED_TEST = read("requirements_test.txt").splitlines()
 # What packages are optional?
 EXTRAS = {
     # 'fancy feature': ['django'],
+    "vectorized": ["numpy"],
+    "arrow": ["pyarrow"],
 }
 
 # The rest you shouldn't have to touch too much :)
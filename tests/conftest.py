@@ -1,4 +1,33 @@
 # -*- coding: utf-8 -*-
-""" Module contains pytest fixtures used in multiple tests."""
+"""Module contains pytest fixtures used in multiple tests."""
 
 import pytest
+from .context import roulette
+
+
+@pytest.fixture
+def make_simulator():
+    """Return a function making a simulator on a fresh game.
+
+    Modules that need other defaults override this fixture, e.g. with a
+    :func:`functools.partial` of it.
+
+    """
+
+    def make(
+        player_cls=roulette.player.PlayerMartingale,
+        stake=100,
+        rounds=20,
+        table_limit=350,
+        chunk_size=7,
+    ):
+        game = roulette.model.Game(
+            roulette.model.Table(table_limit), roulette.wheel_builder.create_wheel()
+        )
+        simulator = roulette.model.Simulator(
+            game, player_cls(stake=stake, base_bet_amount=10, rounds=rounds)
+        )
+        simulator.chunk_size = chunk_size
+        return simulator
+
+    return make
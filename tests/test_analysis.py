@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import collections
+import itertools
+import pytest
+from .context import roulette
+
+analysis = roulette.analysis
+DETERMINISTIC = [
+    name
+    for name, cls in roulette.player.REGISTERED_PLAYERS.items()
+    if cls in analysis.CHAINS
+]
+
+
+class ScriptedSpins:
+    """Spins the bins of a script, in order."""
+
+    def __init__(self, bins):
+        self.bins = iter(bins)
+
+    def choice(self, seq):
+        return next(self.bins)
+
+
+def enumerate_sessions(player, rounds, limit):
+    """The exact distributions, by playing every sequence of spin colors."""
+    wheel = roulette.wheel_builder.create_wheel()
+    colors = {"Black": wheel.bins[2], "Red": wheel.bins[1], "Green": wheel.bins[0]}
+    weights = {"Black": 18 / 38, "Red": 18 / 38, "Green": 2 / 38}
+    durations, maxima = collections.defaultdict(float), collections.defaultdict(float)
+    for sequence in itertools.product(colors, repeat=rounds):
+        game = roulette.model.Game(roulette.model.Table(limit), wheel)
+        simulator = roulette.model.Simulator(game, player)
+        wheel.random_num_gen = ScriptedSpins(colors[color] for color in sequence)
+        record = next(simulator.iter_sessions(1))
+        p = 1.0
+        for color in sequence[: record.duration]:
+            p *= weights[color]
+        # Every sequence with the same played prefix reaches this session.
+        p /= 3 ** (rounds - record.duration)
+        durations[record.duration] += p
+        maxima[record.maximum] += p
+    return durations, maxima
+
+
+@pytest.mark.parametrize("name", DETERMINISTIC)
+def test_analyze_matches_enumeration(name):
+    player = roulette.player.REGISTERED_PLAYERS[name](
+        stake=100, base_bet_amount=10, rounds=6
+    )
+    result = analysis.analyze(player, table_limit=40)
+    durations, maxima = enumerate_sessions(player, rounds=6, limit=40)
+    assert result.durations() == pytest.approx(
+        {k: v for k, v in durations.items() if v > 0}
+    )
+    assert result.maxima() == pytest.approx({k: v for k, v in maxima.items() if v > 0})
+
+
+@pytest.mark.parametrize("name", DETERMINISTIC)
+def test_analyze_every_horizon(name):
+    player_cls = roulette.player.REGISTERED_PLAYERS[name]
+    longest = analysis.analyze(player_cls(stake=200, rounds=30), table_limit=350)
+    shorter = analysis.analyze(player_cls(stake=200, rounds=12), table_limit=350)
+    assert longest.durations(12) == pytest.approx(shorter.durations())
+    assert longest.maxima(12) == pytest.approx(shorter.maxima())
+    assert sum(longest.durations().values()) == pytest.approx(1)
+
+
+def test_analyze_horizon_out_of_range():
+    result = analysis.analyze(roulette.player.PlayerMartingale(rounds=5), 350)
+    with pytest.raises(ValueError):
+        result.durations(6)
+
+
+def test_analyze_random_player():
+    with pytest.raises(TypeError):
+        analysis.analyze(roulette.player.PlayerRandom(), 350)
+
+
+def test_chain_needs_every_method():
+    class Partial(analysis._Chain):
+        def initial(self, player):
+            return 0
+
+    with pytest.raises(TypeError):
+        Partial(roulette.player.PlayerMartingale(stake=100, base_bet_amount=10))
+
+
+def test_analyze_pruned_maxima_within_bound():
+    player = roulette.player.PlayerMartingale(stake=300, base_bet_amount=1, rounds=60)
+    exact = analysis.analyze(player, 350, tolerance=0)
+    pruned = analysis.analyze(player, 350, tolerance=1e-8)
+    assert exact.pruned == 0 < pruned.pruned
+    assert pruned.durations() == pytest.approx(exact.durations())
+    exact_maxima, pruned_maxima = exact.maxima(), pruned.maxima()
+    error = sum(
+        abs(pruned_maxima.get(maximum, 0.0) - exact_maxima.get(maximum, 0.0))
+        for maximum in {**exact_maxima, **pruned_maxima}
+    )
+    assert error <= 2 * pruned.pruned + 1e-12
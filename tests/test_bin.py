@@ -30,3 +30,19 @@ def test_bin_add(bin2):
     )
 
     assert bin3.outcomes == bin_to_match.outcomes
+
+
+def test_bin_mask(bin2):
+    red = roulette.model.Outcome("Red", 1)
+    black = roulette.model.Outcome("Black", 1)
+    assert bin2.mask == 1 << red.id
+    assert red in bin2
+    assert black not in bin2
+
+
+def test_bin_from_outcomes():
+    red = roulette.model.Outcome("Red", 1)
+    black = roulette.model.Outcome("Black", 1)
+    bin_ = roulette.model.Bin([red, black])
+    assert bin_.outcomes == frozenset([red, black])
+    assert bin_.mask == 1 << red.id | 1 << black.id
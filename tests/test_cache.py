@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+from .context import roulette
+
+cache = roulette.cache
+
+
+@pytest.fixture
+def results(make_simulator):
+    def play(samples, seed=5, result_cache=None):
+        simulator = make_simulator()
+        simulator.gather(samples, seed=seed, cache=result_cache)
+        return simulator.maxima, simulator.durations
+
+    return play
+
+
+@pytest.fixture
+def result_cache(tmp_path):
+    return cache.ResultCache(str(tmp_path))
+
+
+def test_key_depends_on_configuration(make_simulator):
+    keys = {
+        cache.key(cache.describe(make_simulator(stake=stake), seed))
+        for stake in (100, 200)
+        for seed in (1, 2)
+    }
+    assert len(keys) == 4
+    assert cache.key(cache.describe(make_simulator(), 1)) in keys
+
+
+def test_key_depends_on_player_state(make_simulator):
+    simulator = make_simulator()
+    before = cache.key(cache.describe(simulator, 1))
+    simulator._original_player.state = 3
+    assert cache.key(cache.describe(simulator, 1)) != before
+
+
+def test_cached_results_match(results, result_cache):
+    expected = results(30)
+    assert results(30, result_cache=result_cache) == expected
+    assert len(result_cache.entries()) == 1
+    # The second run reads the entry back.
+    assert results(30, result_cache=result_cache) == expected
+    assert results(20, result_cache=result_cache) == results(20)
+
+
+@pytest.mark.parametrize("first", [14, 17])
+def test_extend(results, result_cache, first, monkeypatch):
+    results(first, result_cache=result_cache)
+    starts = list()
+    gather = roulette.parallel.gather
+
+    def recording_gather(*args, start=0):
+        starts.append(start)
+        return gather(*args, start=start)
+
+    monkeypatch.setattr(roulette.parallel, "gather", recording_gather)
+    assert results(30, result_cache=result_cache) == results(30)
+    # Only the chunks after the last whole cached chunk are played.
+    assert starts[0] == 14
+    (entry,) = result_cache.entries()
+    assert entry.samples == 30
+
+
+def test_requires_seed(results, result_cache):
+    with pytest.raises(ValueError):
+        results(10, seed=None, result_cache=result_cache)
+
+
+def test_evict_least_recently_used(results, tmp_path):
+    result_cache = cache.ResultCache(str(tmp_path))
+    results(30, seed=1, result_cache=result_cache)
+    size = result_cache.entries()[0].size
+    result_cache.max_bytes = 2 * size
+    results(30, seed=2, result_cache=result_cache)
+    results(30, seed=1, result_cache=result_cache)
+    results(30, seed=3, result_cache=result_cache)
+    seeds = [entry.meta["seed"] for entry in result_cache.entries()]
+    assert seeds == [3, 1]
+
+
+def test_clear(results, result_cache):
+    results(10, seed=1, result_cache=result_cache)
+    results(10, seed=2, result_cache=result_cache)
+    entry = result_cache.entries()[0]
+    result_cache.remove(entry.key)
+    assert len(result_cache.entries()) == 1
+    result_cache.clear()
+    assert result_cache.entries() == []
+
+
+def test_zero_sessions(results, result_cache):
+    assert results(0, result_cache=result_cache) == ([], [])
+
+
+def test_incomplete_entry_is_a_miss(results, result_cache, tmp_path):
+    expected = results(14)
+    results(14, result_cache=result_cache)
+    (entry,) = result_cache.entries()
+    data = tmp_path / (entry.key + ".data")
+    data.write_bytes(data.read_bytes()[:-1])
+    assert result_cache.load(entry.key) is None
+    assert results(14, result_cache=result_cache) == expected
+    (tmp_path / (entry.key + ".json")).unlink()
+    assert result_cache.load(entry.key) is None
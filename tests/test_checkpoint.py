@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import signal
+import pytest
+from .context import roulette
+
+checkpoint = roulette.checkpoint
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "run.checkpoint")
+
+
+def press_ctrl_c():
+    raise KeyboardInterrupt
+
+
+def interrupt_after(monkeypatch, chunks, interrupt=press_ctrl_c):
+    """Make runs stop after playing a number of chunks."""
+    iter_chunks = roulette.parallel.iter_chunks
+
+    def interrupted_chunks(*args, **kwargs):
+        for index, chunk in enumerate(iter_chunks(*args, **kwargs)):
+            if index == chunks:
+                interrupt()
+            yield chunk
+
+    monkeypatch.setattr(roulette.parallel, "iter_chunks", interrupted_chunks)
+
+
+def test_resume_same_as_uninterrupted(make_simulator, path, monkeypatch):
+    interrupt_after(monkeypatch, 3)
+    simulator = make_simulator()
+    with pytest.raises(checkpoint.Interrupted) as info:
+        simulator.gather(40, checkpoint=checkpoint.Checkpoint(path))
+    # The sessions played before the interruption are kept.
+    assert len(simulator.maxima) == info.value.played == 21
+    monkeypatch.undo()
+
+    resumed = make_simulator()
+    resumed.gather(40, checkpoint=checkpoint.Checkpoint(path, resume=True))
+    description, played = checkpoint.Checkpoint(path).load()
+    expected = make_simulator()
+    expected.gather(40, seed=description["seed"])
+    assert (resumed.maxima, resumed.durations) == (expected.maxima, expected.durations)
+    assert played == 40
+
+
+def test_terminate_interrupts(make_simulator, path, monkeypatch):
+    interrupt_after(monkeypatch, 2, lambda: os.kill(os.getpid(), signal.SIGTERM))
+    with pytest.raises(checkpoint.Interrupted):
+        make_simulator().gather(40, seed=1, checkpoint=checkpoint.Checkpoint(path))
+    assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
+    _, played = checkpoint.Checkpoint(path).load()
+    assert played == 14
+
+
+def test_resume_different_run(make_simulator, path):
+    make_simulator().gather(10, seed=1, checkpoint=checkpoint.Checkpoint(path))
+    with pytest.raises(checkpoint.DifferentRun):
+        make_simulator(stake=200).gather(
+            10, checkpoint=checkpoint.Checkpoint(path, resume=True)
+        )
+
+
+def test_sessions_after_checkpoint_dropped(make_simulator, path):
+    simulator = make_simulator()
+    simulator.gather(21, seed=1, checkpoint=checkpoint.Checkpoint(path))
+    # Values appended after the last checkpoint of an interrupted run.
+    with open(path + ".maximum", "ab") as data:
+        data.write(bytes(8 * 3))
+    resumed = make_simulator()
+    resumed.gather(28, checkpoint=checkpoint.Checkpoint(path, resume=True))
+    expected = make_simulator()
+    expected.gather(28, seed=1)
+    assert resumed.maxima == expected.maxima
+    assert os.path.getsize(path + ".maximum") == 8 * 28
+
+
+def test_close_saves_sessions(make_simulator, path):
+    sessions = make_simulator().iter_sessions(
+        40, seed=1, checkpoint=checkpoint.Checkpoint(path, interval=3600)
+    )
+    for _ in range(10):
+        next(sessions)
+    sessions.close()
+    assert checkpoint.Checkpoint(path).load()[1] == 14
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import concurrent.futures
+import math
+import pytest
+from .context import roulette
+
+comparison = roulette.comparison
+
+
+def make_players(*names):
+    return {
+        name: roulette.registry.PLAYERS[name.split("/")[0]](
+            stake=100, base_bet_amount=10, rounds=30
+        )
+        for name in names
+    }
+
+
+def test_shared_spins_replay():
+    spins = comparison.SharedSpins(seed=1)
+    bins = list(range(38))
+    first = [spins.choice(bins) for _ in range(5)]
+    spins.rewind()
+    assert [spins.choice(bins) for _ in range(7)][:5] == first
+    spins.new_session()
+    assert [spins.choice(bins) for _ in range(5)] != first
+
+
+def test_same_player_has_no_difference():
+    result = comparison.compare(
+        make_players("martingale", "martingale/again"), 200, 350, seed=3
+    )
+    (row,) = [row for row in result.rows() if row[1] == "maximum"]
+    assert row[4] == 0 and row[5] == 0
+    assert math.isinf(row[7])
+
+
+def test_common_spins_reduce_variance():
+    result = comparison.compare(
+        make_players("martingale", "fibonacci"), 500, 350, seed=3
+    )
+    assert result.variance_reduction("fibonacci", "maximum") > 1.5
+
+
+def test_same_results_for_any_executor():
+    players = make_players("martingale", "1326", "random")
+    serial = comparison.compare(players, 50, 350, seed=5, chunk_size=7)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        pooled = comparison.compare(players, 50, 350, executor, seed=5, chunk_size=7)
+    assert pooled.rows() == serial.rows()
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1000])
+def test_count(chunk_size):
+    result = comparison.compare(
+        make_players("martingale", "1326"), 30, 350, seed=1, chunk_size=chunk_size
+    )
+    assert all(row[2] == 30 for row in result.rows())
+
+
+@pytest.mark.parametrize("samples", [0, 1])
+def test_too_few_sessions_for_std_error(samples):
+    result = comparison.compare(make_players("martingale", "fibonacci"), samples, 350)
+    assert all(math.isnan(row[6]) for row in result.rows())
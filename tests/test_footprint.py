@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The memory footprints documented on the model classes."""
+
+import sys
+import pytest
+from .context import roulette
+
+pytestmark = pytest.mark.skipif(
+    sys.implementation.name != "cpython" or sys.maxsize < 2 ** 32,
+    reason="The footprints are documented for 64-bit CPython.",
+)
+
+
+def test_outcome_footprint():
+    assert sys.getsizeof(roulette.wheel_builder.get_outcome("Red")) <= 56
+
+
+def test_bet_footprint():
+    bet = roulette.model.Bet(10, roulette.wheel_builder.get_outcome("Red"))
+    assert sys.getsizeof(bet) <= 48
+
+
+def test_bin_footprint():
+    assert sys.getsizeof(roulette.model.Bin()) <= 56
+
+
+def test_martingale_footprint():
+    assert sys.getsizeof(roulette.player.PlayerMartingale()) <= 80
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        roulette.wheel_builder.get_outcome("Red"),
+        roulette.model.Bet(10, roulette.wheel_builder.get_outcome("Red")),
+        roulette.model.Bin(),
+    ]
+    + [cls() for cls in roulette.player.REGISTERED_PLAYERS.values()],
+    ids=lambda obj: type(obj).__qualname__,
+)
+def test_no_instance_dict(obj):
+    assert not hasattr(obj, "__dict__")
@@ -18,6 +18,7 @@ def mock_wheel():
     bin_ = Mock(spec=roulette.model.Bin)
     # TODO: could you patch outcomes?
     bin_.outcomes = frozenset([roulette.wheel_builder.get_outcome("Black")])
+    bin_.mask = 1 << roulette.wheel_builder.get_outcome("Black").id
     wheel.spin.return_value = bin_
     return wheel
 
@@ -51,3 +52,11 @@ def test_game_cycle(mock_player, mock_table, mock_wheel):
     )
     mock_table.clear_bets.assert_called()
 
+
+def test_game_cycle_lose(mock_player, mock_table, mock_wheel):
+    mock_table.bets[0].outcome = roulette.wheel_builder.get_outcome("Red")
+    game = roulette.model.Game(mock_table, mock_wheel)
+    game.cycle(mock_player)
+
+    mock_player.lose.assert_called()
+    mock_player.win.assert_not_called()
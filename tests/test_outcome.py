@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
 import pytest
 from .context import roulette
 
@@ -32,3 +34,27 @@ def test_outcome_from_name():
     outcome_from_name = roulette.wheel_builder.get_outcome("Red")
     assert outcome_from_name == roulette.model.Outcome("Red", 1)
 
+
+def test_outcome_interned():
+    assert roulette.model.Outcome("Red", 1) is roulette.model.Outcome("Red", 1)
+
+
+def test_outcome_copy_interned():
+    outcome = roulette.model.Outcome("Red", 1)
+    assert copy.deepcopy(outcome) is outcome
+    assert pickle.loads(pickle.dumps(outcome)) is outcome
+
+
+def test_outcome_immutable():
+    outcome = roulette.model.Outcome("Red", 1)
+    with pytest.raises(AttributeError):
+        outcome.odds = 2
+    with pytest.raises(AttributeError):
+        del outcome.name
+    assert outcome.odds == 1
+
+
+def test_outcome_hash_stable():
+    outcome = roulette.model.Outcome("Red", 1)
+    assert hash(outcome) == hash(copy.deepcopy(outcome))
+    assert {outcome: 1}[roulette.wheel_builder.get_outcome("Red")] == 1
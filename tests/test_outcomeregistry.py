@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+from .context import roulette
+
+
+@pytest.fixture
+def registry():
+    return roulette.model.OutcomeRegistry(
+        [roulette.model.Outcome("Red", 1), roulette.model.Outcome("Black", 1)]
+    )
+
+
+def test_lookup_by_name(registry):
+    assert registry["Black"] is roulette.model.Outcome("Black", 1)
+    assert registry.get("Green") is None
+
+
+def test_lookup_by_id(registry):
+    black = registry["Black"]
+    assert registry.from_id(black.id) is black
+    assert registry.id_of(black) == black.id
+
+
+def test_shared_outcomes():
+    """The registry, wheels and players all hold the same objects."""
+    black = roulette.wheel_builder.get_outcome("Black")
+    assert roulette.wheel_builder.create_wheel().all_outcomes["Black"] is black
+    assert roulette.player.Player1326().outcome is black
+    assert len(roulette.wheel_builder.OUTCOMES) == len(
+        roulette.wheel_builder.create_wheel().all_outcomes
+    )
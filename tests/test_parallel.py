@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import concurrent.futures
+import functools
+import pytest
+from .context import roulette
+
+
+@pytest.fixture
+def make_simulator(make_simulator):
+    return functools.partial(make_simulator, roulette.player.PlayerRandom)
+
+
+@pytest.fixture
+def serial_results(make_simulator):
+    simulator = make_simulator()
+    simulator.gather(30, seed=11)
+    return simulator.maxima, simulator.durations
+
+
+def test_stream_seed():
+    assert roulette.parallel.stream_seed(1, 0) == roulette.parallel.stream_seed(1, 0)
+    assert roulette.parallel.stream_seed(1, 0) != roulette.parallel.stream_seed(1, 1)
+
+
+def test_serial_executor():
+    future = roulette.parallel.SerialExecutor().submit(pow, 2, 3)
+    assert future.result() == 8
+
+
+@pytest.mark.parametrize(
+    "executor_cls",
+    [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor],
+)
+def test_gather_same_results_for_any_executor(
+    make_simulator, executor_cls, serial_results
+):
+    simulator = make_simulator()
+    with executor_cls(max_workers=3) as executor:
+        simulator.gather(30, executor=executor, seed=11)
+    assert (simulator.maxima, simulator.durations) == serial_results
+
+
+def test_gather_different_seeds(make_simulator, serial_results):
+    simulator = make_simulator()
+    simulator.gather(30, seed=12)
+    assert (simulator.maxima, simulator.durations) != serial_results
+
+
+def test_gather_zero_sessions(make_simulator):
+    simulator = make_simulator()
+    simulator.gather(0, seed=1)
+    assert simulator.maxima == []
+    assert simulator.durations == []
+
+
+def test_shared_results_close_blocks_on_failure(monkeypatch):
+    from multiprocessing import shared_memory
+
+    made = list()
+
+    class Recorded(shared_memory.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            made.append(self)
+
+    monkeypatch.setattr(shared_memory, "SharedMemory", Recorded)
+    # The second cast fails, after the first two blocks are made.
+    monkeypatch.setattr(roulette.parallel.SharedResults, "typecodes", ("d", "?x"))
+    with pytest.raises(ValueError):
+        roulette.parallel.SharedResults(3)
+    assert len(made) == 2
+    for block in made:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(block.name)
+
+
+def test_iter_chunks_through_shared_memory(make_simulator, serial_results):
+    futures = list()
+
+    class Recording(concurrent.futures.ThreadPoolExecutor):
+        def submit(self, *args, **kwargs):
+            futures.append(super().submit(*args, **kwargs))
+            return futures[-1]
+
+    with Recording(max_workers=3) as executor:
+        chunks = list(
+            roulette.parallel.iter_chunks(make_simulator(), 30, executor, seed=11)
+        )
+    assert [maximum for chunk in chunks for maximum in chunk.maximum] == (
+        serial_results[0]
+    )
+    # The workers only send back their phase times, not the results.
+    assert [future.result() for future in futures] == [None] * 5
@@ -54,6 +54,15 @@ def test_place_bets(player_regular):
     assert player_regular.stake == 90.0  # 100.0 - bet amount
 
 
+def test_place_bets_over_limit_keeps_stake(player_regular):
+    red = roulette.wheel_builder.get_outcome("Red")
+    table = roulette.model.Table(300, [roulette.model.Bet(295.0, red)])
+    with pytest.raises(roulette.model.InvalidBet):
+        player_regular.place_bets(table)
+    assert player_regular.stake == 100.0
+    assert table.total == 295.0
+
+
 def test_bet_amount(player_regular):
     assert player_regular.bet_amount == player_regular.base_bet_amount
 
@@ -66,4 +75,45 @@ def test_track_last_winning_outcomes(player_regular):
         ]
     )
     # Add more than one outcome.
-    assert player_regular._winners[0] == roulette.wheel_builder.get_outcome("Black")
+    black = roulette.wheel_builder.get_outcome("Black")
+    assert player_regular.history.totals[black] == 1
+    assert player_regular.history.streaks[black] == 1
+
+
+def attributes(player):
+    """The values of every slot of a player, with lists copied."""
+    names = {
+        name
+        for cls in type(player).__mro__
+        for name in cls.__dict__.get("__slots__", ())
+    }
+    values = {name: getattr(player, name) for name in names if hasattr(player, name)}
+    return {
+        name: list(value) if isinstance(value, list) else value
+        for name, value in values.items()
+    }
+
+
+@pytest.mark.parametrize("player_cls", roulette.player.REGISTERED_PLAYERS.values())
+def test_reset(player_cls):
+    player = player_cls(stake=100, rounds=50, base_bet_amount=5)
+    assert player.resettable
+    player.snapshot()
+    initial = attributes(player)
+    history = dict(player.history.totals), list(player.history.spins)
+    table = roulette.model.Table(300)
+    for won in [True, False, False, True, False]:
+        bet = player._determine_bets()[0]
+        player.place_bets(table)
+        player.win(bet) if won else player.lose()
+        player.track_last_winning_outcomes([roulette.wheel_builder.get_outcome("Red")])
+    player.reset()
+    assert attributes(player) == initial
+    assert (dict(player.history.totals), list(player.history.spins)) == history
+
+
+def test_subclass_without_reset_fields_not_resettable():
+    class PlayerThirdParty(roulette.player.PlayerMartingale):
+        pass
+
+    assert not PlayerThirdParty().resettable
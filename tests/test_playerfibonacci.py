@@ -10,7 +10,7 @@ def playerfibonacci_regular():
     return roulette.player.PlayerFibonacci(stake=100, rounds=350, base_bet_amount=10)
 
 
-# Note: this class inherits most of it's method from PlayerMartingale so they aren't tested.
+# Note: this class inherits most of it's method from StrategyPlayer so they aren't tested.
 
 
 def test_bet_amount_win(playerfibonacci_regular):
@@ -24,7 +24,7 @@ def test__determine_bets_no_bet(playersevenreds_regular):
 
 def test__determine_bets_7reds(playersevenreds_regular):
     # We are testing if betting has begun after 7 reds being played in a row.
-    playersevenreds_regular._winners = [playersevenreds_regular._red]
+    playersevenreds_regular.track_last_winning_outcomes([playersevenreds_regular._red])
     # We determine bets 8 times with red being a winner each time
     playersevenreds_regular._determine_bets()
     playersevenreds_regular._determine_bets()
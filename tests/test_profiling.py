@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+from .context import roulette
+
+
+@pytest.fixture
+def simulator():
+    game = roulette.model.Game(
+        roulette.model.Table(350), roulette.wheel_builder.create_wheel()
+    )
+    return roulette.model.Simulator(
+        game, roulette.player.PlayerMartingale(stake=100, base_bet_amount=10, rounds=20)
+    )
+
+
+def test_phase_times_merge():
+    times = roulette.profiling.PhaseTimes()
+    times.add("PlayerMartingale", "spin", 1.0)
+    other = roulette.profiling.PhaseTimes()
+    other.add("PlayerMartingale", "spin", 2.0)
+    other.add("PlayerMartingale", "track", 0.5)
+    times.merge(other)
+    assert times.rows() == [
+        ("PlayerMartingale", "spin", 2, 3.0),
+        ("PlayerMartingale", "track", 1, 0.5),
+    ]
+
+
+def test_profile_counts_phases(simulator):
+    times = roulette.profiling.PhaseTimes()
+    simulator.profile(times)
+    simulator.gather(10)
+    rounds = sum(simulator.durations)
+    assert times.calls["PlayerMartingale", "session"] == 10
+    assert times.calls["PlayerMartingale", "reset_player"] == 10
+    for phase in ("place_bets", "is_valid", "spin", "settle", "track"):
+        assert times.calls["PlayerMartingale", phase] == rounds
+
+
+def test_profile_keeps_results(simulator):
+    simulator.gather(10, seed=3)
+    expected = simulator.maxima
+    simulator.maxima = []
+    simulator.profile(roulette.profiling.PhaseTimes())
+    simulator.gather(10, seed=3)
+    assert simulator.maxima == expected
+
+
+def test_profile_collects_chunks(simulator):
+    simulator.chunk_size = 3
+    simulator.profile(roulette.profiling.PhaseTimes())
+    list(simulator.iter_sessions(10, seed=1))
+    assert simulator.profiler.calls["PlayerMartingale", "session"] == 10
+
+
+def test_profile_off(simulator):
+    simulator.profile(None)
+    simulator.gather(5)
+    assert simulator.profiler is None
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import functools
+import math
+import pytest
+from .context import roulette
+
+rare = roulette.rare
+
+
+@pytest.fixture
+def make_simulator(make_simulator):
+    return functools.partial(
+        make_simulator, rounds=40, table_limit=1000, chunk_size=250
+    )
+
+
+def test_siegmund_tilt():
+    # A bet on Red wins on 18 of 38 bins.
+    nets = [1] * 18 + [-1] * 20
+    assert rare.siegmund_tilt(nets) == pytest.approx(math.log(20 / 18))
+    assert rare.siegmund_tilt([1] * 20 + [-1] * 18) == 0
+
+
+def test_likelihood_ratios_average_to_one(make_simulator):
+    simulator = make_simulator()
+    simulator.seed(1)
+    wheel = simulator.game.wheel
+    spins = rare.TiltedSpins(wheel.random_num_gen, simulator.game.table, 2.0)
+    wheel.random_num_gen = spins
+    weights = list()
+    for record in simulator._sessions(4000):
+        weights.append(math.exp(spins.log_weight))
+        spins.new_session()
+    assert sum(weights) / len(weights) == pytest.approx(1, abs=0.1)
+
+
+@pytest.mark.parametrize("event", [rare.Reach(200), rare.Ruin()])
+@pytest.mark.parametrize("method", ["importance", "splitting"])
+def test_estimates_agree(make_simulator, event, method):
+    plain = rare.estimate(make_simulator(), event, 4000, "plain", seed=2)
+    estimate = rare.estimate(make_simulator(), event, 2000, method, seed=3)
+    error = math.hypot(plain.std_error, estimate.std_error)
+    assert abs(estimate.mean - plain.mean) < 5 * error
+
+
+def test_impossible_event(make_simulator):
+    estimate = rare.estimate(
+        make_simulator(rounds=10), rare.Reach(1000), 500, "splitting"
+    )
+    assert estimate.mean == 0
+
+
+def test_seeded_estimates_independent_of_executor(make_simulator):
+    event = rare.Reach(200)
+    expected = rare.estimate(make_simulator(), event, 500, "splitting", seed=4)
+    with roulette.parallel.default_executor(2) as executor:
+        estimate = rare.estimate(
+            make_simulator(), event, 500, "splitting", executor=executor, seed=4
+        )
+    assert estimate == expected
+
+
+@pytest.mark.parametrize("method, samples", [("importance", 1), ("splitting", 499)])
+def test_too_few_samples(make_simulator, method, samples):
+    with pytest.raises(ValueError):
+        rare.estimate(make_simulator(), rare.Ruin(), samples, method)
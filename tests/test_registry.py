@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+import pytest
+from .context import roulette
+
+registry = roulette.registry
+
+
+@pytest.fixture
+def players(monkeypatch):
+    found = {"double": "pycasino.roulette.player:PlayerDouble"}
+    monkeypatch.setattr(registry, "_entry_points", lambda: found)
+    return registry.PlayerRegistry(registry.BUILTIN_PLAYERS)
+
+
+def test_builtin_paths_are_players():
+    for name, path in registry.BUILTIN_PLAYERS.items():
+        cls = registry.import_path(path)
+        assert issubclass(cls, roulette.player.Player)
+        assert roulette.player.REGISTERED_PLAYERS[name] is cls
+
+
+def test_entry_points_only_looked_up_when_needed(players):
+    assert players.known("martingale")
+    assert not players.known("double")
+    assert players._entry_points is None
+    assert players["martingale"] is roulette.player.PlayerMartingale
+    assert players._entry_points is None
+    assert "double" in players
+    assert players["double"] is roulette.player.PlayerDouble
+
+
+def test_names(players):
+    players["extra"] = roulette.player.PlayerDouble
+    assert list(players) == list(registry.BUILTIN_PLAYERS) + ["extra", "double"]
+    assert players.local_names() == list(registry.BUILTIN_PLAYERS) + ["extra"]
+    del players["extra"]
+    assert "extra" not in players
+    with pytest.raises(KeyError):
+        players["missing"]
+
+
+def test_cli_imports_no_simulation_modules():
+    code = (
+        "import sys, pycasino.cli; "
+        "print(sorted({'yaml', 'pycasino.roulette.model'} & set(sys.modules)))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "[]"
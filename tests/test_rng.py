@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+import pickle
+import random
+import pytest
+from .context import roulette
+
+
+def test_mt_backend_matches_random():
+    """The default backend draws what random.Random draws for a seed."""
+    buffered = roulette.rng.BufferedRandom(seed=7, block_size=16)
+    generator = random.Random(7)
+    seq = list(range(38))
+    assert [buffered.choice(seq) for _ in range(100)] == [
+        generator.choice(seq) for _ in range(100)
+    ]
+
+
+def test_randrange():
+    buffered = roulette.rng.BufferedRandom(seed=1, block_size=8)
+    values = [buffered.randrange(5, 10) for _ in range(50)]
+    assert set(values) <= set(range(5, 10))
+
+
+def test_seed_drops_buffer():
+    buffered = roulette.rng.BufferedRandom(seed=3)
+    first = [buffered.randrange(38) for _ in range(5)]
+    buffered.seed(3)
+    assert [buffered.randrange(38) for _ in range(5)] == first
+
+
+def test_copy_continues_stream():
+    buffered = roulette.rng.BufferedRandom(seed=3, block_size=4)
+    buffered.randrange(38)
+    duplicate = copy.deepcopy(pickle.loads(pickle.dumps(buffered)))
+    assert [duplicate.randrange(38) for _ in range(10)] == [
+        buffered.randrange(38) for _ in range(10)
+    ]
+
+
+@pytest.mark.parametrize("backend", ["pcg64", "philox"])
+def test_numpy_backends(backend):
+    pytest.importorskip("numpy")
+    first = roulette.rng.BufferedRandom(seed=2, backend=backend)
+    second = roulette.rng.BufferedRandom(seed=2, backend=backend)
+    values = [first.randrange(38) for _ in range(100)]
+    assert values == [second.randrange(38) for _ in range(100)]
+    assert set(values) <= set(range(38))
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        roulette.rng.BufferedRandom(backend="lcg")
+
+
+@pytest.mark.parametrize("stop", [1, 38, 2**32, 2**53])
+def test_mt_blocks_match_randrange(stop):
+    buffered = roulette.rng.BufferedRandom(seed=5, block_size=10)
+    generator = random.Random(5)
+    assert [buffered.randrange(stop) for _ in range(100)] == [
+        generator.randrange(stop) for _ in range(100)
+    ]
+
+
+def test_simulator_rng_backend():
+    pytest.importorskip("numpy")
+    game = roulette.model.Game(
+        roulette.model.Table(350), roulette.wheel_builder.create_wheel()
+    )
+    player = roulette.player.PlayerRandom(stake=100, base_bet_amount=10, rounds=5)
+    simulator = roulette.model.Simulator(game, player, rng_backend="pcg64")
+    assert game.wheel.random_num_gen.backend == "pcg64"
+    assert simulator._spawn().game.wheel.random_num_gen.backend == "pcg64"
+    assert simulator._original_player._random_number_generator.backend == "pcg64"
+    # Other wheels keep the default.
+    assert roulette.wheel_builder.create_wheel().random_num_gen.backend == "mt"
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+from .context import roulette
+
+
+@pytest.fixture
+def simulator():
+    game = roulette.model.Game(
+        roulette.model.Table(350), roulette.wheel_builder.create_wheel()
+    )
+    return roulette.model.Simulator(
+        game, roulette.player.PlayerMartingale(stake=100, base_bet_amount=10, rounds=20)
+    )
+
+
+def test_gather(simulator):
+    simulator.gather(5)
+    assert len(simulator.maxima) == 5
+    assert all(0 < duration <= 20 for duration in simulator.durations)
+
+
+def test_iter_sessions(simulator):
+    sessions = simulator.iter_sessions(3)
+    record = next(sessions)
+    assert record.maximum >= 100
+    assert len(list(sessions)) == 2
+    assert simulator.maxima == []
+
+
+def test_iter_sessions_same_as_gather(simulator):
+    simulator.chunk_size = 4
+    records = list(simulator.iter_sessions(10, seed=5))
+    simulator.gather(10, seed=5)
+    assert [record.maximum for record in records] == simulator.maxima
+    assert [record.duration for record in records] == simulator.durations
+
+
+def test_stats_of_latest_run(simulator):
+    simulator.gather(5, seed=1)
+    first = simulator.stats.summaries["maximum"].moments.mean
+    simulator.gather(3, seed=2)
+    assert simulator.stats.count == 3
+    list(simulator.iter_sessions(5, seed=1))
+    assert simulator.stats.count == 5
+    assert simulator.stats.summaries["maximum"].moments.mean == first
+
+
+def test_recreate_player_resets_in_place(simulator):
+    first = simulator._recreate_player()
+    first.lose()
+    second = simulator._recreate_player()
+    assert second is first
+    assert (second.loss_count, second.rounds) == (0, 20)
+
+
+def test_recreate_player_copies_without_reset_protocol():
+    class PlayerThirdParty(roulette.player.PlayerMartingale):
+        pass
+
+    game = roulette.model.Game(
+        roulette.model.Table(350), roulette.wheel_builder.create_wheel()
+    )
+    simulator = roulette.model.Simulator(game, PlayerThirdParty())
+    assert simulator._recreate_player() is not simulator._recreate_player()
+
+
+@pytest.mark.parametrize("seed", [None, 5])
+def test_stop_at_target_width(simulator, seed):
+    simulator.chunk_size = 50
+    stop = roulette.stats.StoppingRule("maximum", width=10)
+    simulator.gather(None, seed=seed, stop=stop)
+    assert stop.reason == "width"
+    assert len(simulator.maxima) % 50 == 0
+    low, high = simulator.stats.interval("maximum")
+    assert high - low <= 10
+
+
+def test_stopped_run_is_prefix_of_fixed_run(simulator):
+    simulator.chunk_size = 20
+    stop = roulette.stats.StoppingRule("ruined", width=0.2)
+    records = list(simulator.iter_sessions(None, seed=3, stop=stop))
+    assert len(records) < 1000
+    assert list(simulator.iter_sessions(len(records), seed=3)) == records
+
+
+def test_stop_at_most_samples(simulator):
+    stop = roulette.stats.StoppingRule("maximum", width=1e-9)
+    simulator.gather(30, stop=stop)
+    assert len(simulator.maxima) == 30
+    assert stop.reason is None
+
+
+def test_stop_after_time_budget(simulator):
+    simulator.chunk_size = 10
+    stop = roulette.stats.StoppingRule(time_budget=0)
+    simulator.gather(None, seed=1, stop=stop)
+    assert (stop.reason, simulator.maxima[10:]) == ("time", [])
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import pytest
+from pycasino import sinks
+
+
+@pytest.fixture
+def stream():
+    return io.StringIO()
+
+
+def test_buffered_sink_writes_in_chunks(stream):
+    sink = sinks.BufferedSink(stream, header="a, b", chunk_size=2)
+    sink.write((1, 2))
+    assert stream.getvalue() == "a, b\n"
+    sink.write((3, 4))
+    assert stream.getvalue() == "a, b\n1, 2\n3, 4\n"
+
+
+def test_buffered_sink_flushes_on_exit(stream):
+    with sinks.BufferedSink(stream) as sink:
+        sink.write_all([(1.5, 2)])
+    assert stream.getvalue() == "1.5, 2\n"
+
+
+RECORDS = [(120.0, 3, 80.0, 40.0, False), (100.0, 1, 0.0, 100.0, True)]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "xz"])
+def test_csv_sink(tmp_path, compression):
+    path = str(tmp_path / "results.csv")
+    with sinks.open_sink(path, "csv", compression) as sink:
+        sink.chunk_size = 1
+        sink.write_all(RECORDS)
+    with sinks._open(path, "rt", compression) as data:
+        lines = data.read().splitlines()
+    assert lines == [
+        "maximum_stake,rounds_played,final_stake,max_drawdown,ruined",
+        "120.0,3,80.0,40.0,0",
+        "100.0,1,0.0,100.0,1",
+    ]
+
+
+def test_sink_invalid_compression(tmp_path):
+    with pytest.raises(ValueError):
+        sinks.open_sink(str(tmp_path / "results.csv"), "csv", "zstd")
+
+
+def test_column_sink_needs_write_batch(tmp_path):
+    with pytest.raises(TypeError):
+        sinks.ColumnSink(str(tmp_path / "results"))
+
+
+def test_column_sink_keeps_written_batches(tmp_path):
+    batches = list()
+
+    class KeptSink(sinks.ColumnSink):
+        def write_batch(self, columns):
+            batches.append(columns)
+
+    with KeptSink(str(tmp_path / "results"), chunk_size=1) as sink:
+        sink.write_all(RECORDS)
+    assert [batch[1].tolist() for batch in batches] == [[3], [1]]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_npy_sink(tmp_path, compression):
+    np = pytest.importorskip("numpy")
+    path = str(tmp_path / "results.npy")
+    with sinks.open_sink(path, "npy", compression) as sink:
+        sink.chunk_size = 1
+        sink.write_all(RECORDS)
+    with sinks._open(path, "rb", compression) as data:
+        results = np.load(data)
+    assert results["rounds_played"].tolist() == [3, 1]
+    assert results["ruined"].tolist() == [0, 1]
+
+
+@pytest.mark.parametrize("format", ["arrow", "parquet"])
+def test_arrow_sinks(tmp_path, format):
+    pytest.importorskip("pyarrow")
+    import pyarrow.feather
+    import pyarrow.parquet
+
+    path = str(tmp_path / f"results.{format}")
+    with sinks.open_sink(path, format, "zstd") as sink:
+        # A batch per record, whose buffers must outlive the flush.
+        sink.chunk_size = 1
+        sink.write_all(RECORDS)
+    read = (
+        pyarrow.feather.read_table if format == "arrow" else pyarrow.parquet.read_table
+    )
+    table = read(path)
+    assert table.column("maximum_stake").to_pylist() == [120.0, 100.0]
+    assert table.column("ruined").to_pylist() == [0, 1]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+from .context import roulette
+
+
+@pytest.fixture
+def red():
+    return roulette.wheel_builder.get_outcome("Red")
+
+
+@pytest.fixture
+def black():
+    return roulette.wheel_builder.get_outcome("Black")
+
+
+@pytest.fixture
+def history(red, black):
+    return roulette.model.SpinHistory(size=3, tracked=[red, black])
+
+
+def test_history_is_bounded(history, red, black):
+    for outcomes in [{red}, {red}, {black}, {red}, {black}]:
+        history.add(outcomes)
+    assert list(history.spins) == [{black}, {red}, {black}]
+    assert history.count == 5
+
+
+def test_history_counters(history, red, black):
+    for outcomes in [{red}, {red}, {black}, {red}, {red}]:
+        history.add(outcomes)
+    assert history.streaks == {red: 2, black: 0}
+    assert history.recent == {red: 2, black: 1}
+    assert history.totals == {red: 4, black: 1}
+
+
+def test_history_without_buffer(red):
+    history = roulette.model.SpinHistory(tracked=[red])
+    history.add({red})
+    assert len(history) == 0
+    assert history.totals[red] == 1
+
+
+def test_history_reset(history, red):
+    history.snapshot()
+    history.add({red})
+    history.reset()
+    assert len(history) == 0
+    assert history.totals[red] == 0
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+import random
+import statistics
+import pytest
+from .context import roulette
+
+stats = roulette.stats
+
+
+@pytest.fixture
+def values():
+    generator = random.Random(0)
+    return [generator.expovariate(0.01) for _ in range(2000)]
+
+
+def test_moments(values):
+    moments = stats.Moments()
+    for value in values:
+        moments.add(value)
+    assert moments.count == len(values)
+    assert moments.mean == pytest.approx(statistics.mean(values))
+    assert moments.variance == pytest.approx(statistics.variance(values))
+    assert (moments.min, moments.max) == (min(values), max(values))
+
+
+def test_moments_merge(values):
+    whole, first, second = stats.Moments(), stats.Moments(), stats.Moments()
+    for value in values:
+        whole.add(value)
+    for value in values[:500]:
+        first.add(value)
+    for value in values[500:]:
+        second.add(value)
+    first.merge(second)
+    assert first.count == whole.count
+    assert first.mean == pytest.approx(whole.mean)
+    assert first.variance == pytest.approx(whole.variance)
+    assert first.max == whole.max
+
+
+def test_moments_empty():
+    assert math.isnan(stats.Moments().variance)
+
+
+def test_covariance(values):
+    other = [value / 2 + i % 7 for i, value in enumerate(values)]
+    whole, first, second = stats.Covariance(), stats.Covariance(), stats.Covariance()
+    for x, y in zip(values, other):
+        whole.add(x, y)
+    for x, y in zip(values[:500], other[:500]):
+        first.add(x, y)
+    for x, y in zip(values[500:], other[500:]):
+        second.add(x, y)
+    first.merge(second)
+    expected = statistics.covariance(values, other)
+    assert whole.covariance == pytest.approx(expected)
+    assert first.covariance == pytest.approx(expected)
+    assert first.correlation == pytest.approx(statistics.correlation(values, other))
+
+
+def test_histogram():
+    histogram = stats.Histogram(0, 10, bins=5)
+    for value in [-1, 0, 1.9, 2, 9.99, 10]:
+        histogram.add(value)
+    assert histogram.counts == [2, 1, 0, 0, 1]
+    assert (histogram.underflow, histogram.overflow) == (1, 1)
+    assert histogram.edges == [0, 2, 4, 6, 8, 10]
+
+
+def test_histogram_merge_different_bins():
+    with pytest.raises(ValueError):
+        stats.Histogram(0, 10, 5).merge(stats.Histogram(0, 10, 4))
+
+
+@pytest.mark.parametrize("q", [0, 0.1, 0.5, 0.9, 0.99, 1])
+def test_quantile_sketch(values, q):
+    sketch = stats.QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+    exact = sorted(values)[int(q * (len(values) - 1))]
+    assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+
+
+def test_quantile_sketch_merge(values):
+    whole, first, second = [stats.QuantileSketch() for _ in range(3)]
+    for value in values:
+        whole.add(value)
+    for value in values[:700]:
+        first.add(value)
+    for value in values[700:]:
+        second.add(value)
+    first.merge(second)
+    assert [first.quantile(q) for q in (0.1, 0.5, 0.9)] == [
+        whole.quantile(q) for q in (0.1, 0.5, 0.9)
+    ]
+
+
+def test_session_stats():
+    session_stats = stats.SessionStats(rounds=20)
+    session_stats.add(roulette.model.SessionResult(140.0, 6, 60.0, 80.0, True))
+    session_stats.add(roulette.model.SessionResult(100.0, 20, 110.0, 30.0, False))
+    assert session_stats.count == 2
+    assert session_stats.ruin_rate == 0.5
+    assert session_stats.summaries["maximum"].moments.mean == 120.0
+    assert sum(session_stats.durations.counts) == 2
+
+
+@pytest.mark.parametrize("statistic", ["maximum", "ruined"])
+def test_interval_covers(statistic):
+    generator = random.Random(1)
+    session_stats = stats.SessionStats(rounds=10)
+    for _ in range(400):
+        session_stats.add(
+            roulette.model.SessionResult(
+                generator.gauss(100, 10), 5, 0.0, 0.0, generator.random() < 0.2
+            )
+        )
+    low, high = session_stats.interval(statistic, confidence=0.99)
+    assert low < {"maximum": 100, "ruined": 0.2}[statistic] < high
+    narrow_low, narrow_high = session_stats.interval(statistic, confidence=0.5)
+    assert high - low > narrow_high - narrow_low
+
+
+def test_ruin_rate_interval_without_ruin():
+    session_stats = stats.SessionStats(rounds=10)
+    for _ in range(20):
+        session_stats.add(roulette.model.SessionResult(100.0, 5, 0.0, 0.0, False))
+    low, high = session_stats.interval("ruined")
+    assert low == pytest.approx(0)
+    assert high > 0.1
+
+
+def test_stopping_rule_needs_target():
+    with pytest.raises(ValueError):
+        stats.StoppingRule("maximum")
+
+
+def test_simulator_stats():
+    game = roulette.model.Game(
+        roulette.model.Table(350), roulette.wheel_builder.create_wheel()
+    )
+    simulator = roulette.model.Simulator(
+        game, roulette.player.PlayerMartingale(stake=100, base_bet_amount=10, rounds=20)
+    )
+    simulator.gather(30)
+    moments = simulator.stats.summaries["duration"].moments
+    assert moments.count == 30
+    assert moments.mean == pytest.approx(statistics.mean(simulator.durations))
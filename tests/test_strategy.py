@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import concurrent.futures
+import math
+import multiprocessing
+import os
+import pickle
+import pytest
+from .context import roulette
+
+strategy = roulette.strategy
+
+OSCAR = {
+    "outcome": "Black",
+    "states": {
+        "base": {"multiplier": 1, "won": "base", "lost": "up"},
+        "up": {"multiplier": 2, "won": "base", "lost": "top"},
+        "top": {"multiplier": 3, "won": "up", "lost": "top", "outcome": "Red"},
+    },
+}
+
+
+@pytest.fixture
+def registered(monkeypatch):
+    monkeypatch.setattr(roulette.player, "REGISTERED_PLAYERS", {})
+    return roulette.player.REGISTERED_PLAYERS
+
+
+def test_compile():
+    tables = strategy.Strategy(**OSCAR).compile()
+    assert tables.multipliers == (1.0, 2.0, 3.0)
+    assert tables.on_win == (0, 0, 1)
+    assert tables.on_loss == (1, 2, 2)
+    black = roulette.wheel_builder.get_outcome("Black")
+    red = roulette.wheel_builder.get_outcome("Red")
+    assert tables.outcomes == (black, black, red)
+    assert (tables.initial, tables.names) == (0, ("base", "up", "top"))
+
+
+def test_compile_initial():
+    assert strategy.Strategy(initial="up", **OSCAR).compile().initial == 1
+
+
+@pytest.mark.parametrize(
+    "state, error", [({"won": "nowhere"}, "state"), ({"outcome": "Purple"}, "outcome")]
+)
+def test_compile_unknown(state, error):
+    states = {"base": dict({"multiplier": 1, "won": "base", "lost": "base"}, **state)}
+    with pytest.raises(ValueError, match=error):
+        strategy.Strategy(states).compile()
+
+
+def test_empty_strategy():
+    with pytest.raises(ValueError):
+        strategy.Strategy({})
+
+
+def test_martingale_saturates():
+    tables = strategy.martingale(states=4).compile()
+    assert tables.multipliers == (1.0, 2.0, 4.0, 8.0)
+    assert tables.on_loss == (1, 2, 3, 3)
+    assert tables.on_win == (0, 0, 0, 0)
+
+
+def test_fibonacci():
+    assert strategy.fibonacci(states=6).compile().multipliers == (1, 1, 2, 3, 5, 8)
+
+
+@pytest.mark.parametrize("make", [strategy.martingale, strategy.fibonacci])
+def test_progression_ends_with_infinite_bet(make):
+    multipliers = make().compile().multipliers
+    assert multipliers[-1] == math.inf
+    assert all(math.isfinite(multiplier) for multiplier in multipliers[:-1])
+
+
+@pytest.mark.parametrize(
+    "player_cls", [roulette.player.PlayerMartingale, roulette.player.PlayerFibonacci]
+)
+def test_progression_not_capped_before_ruin(player_cls):
+    # A stake of more base bets than any finite multiplier.
+    player = player_cls(stake=1e300, base_bet_amount=1e-300, rounds=10_000)
+    player.state = len(player.tables.multipliers) - 2
+    assert player.playing
+    player.lose()
+    assert player.ruined and not player.playing
+
+
+def test_register_strategy(registered):
+    strategies = strategy.from_config({"oscar": OSCAR})
+    cls = roulette.player.register_strategy("oscar", strategies["oscar"])
+    assert registered == {"oscar": cls}
+
+    player = cls(stake=100, base_bet_amount=10, rounds=20)
+    assert player.resettable
+    player.lose()
+    player.lose()
+    assert player.bet_amount == 30
+    assert player._determine_bets()[0].outcome.name == "Red"
+    player.win(player._determine_bets()[0])
+    assert player.bet_amount == 20
+
+
+def test_registered_strategies_share_tables():
+    martingale = roulette.player.PlayerMartingale(stake=100)
+    martingale.lose()
+    assert (martingale.state, martingale.loss_count) == (1, 1)
+    assert martingale.tables is roulette.player.PlayerMartingale(stake=100).tables
+
+
+def test_analyze_strategy_player(registered):
+    doubler = strategy.Strategy(
+        {n: {"multiplier": 2 ** n, "won": 0, "lost": min(n + 1, 7)} for n in range(8)}
+    )
+    cls = roulette.player.register_strategy("doubler", doubler)
+    kwargs = dict(stake=100, base_bet_amount=10, rounds=12)
+    martingale = roulette.player.PlayerMartingale(**kwargs)
+    expected = roulette.analysis.analyze(martingale, 350)
+    result = roulette.analysis.analyze(cls(**kwargs), 350)
+    assert result.durations() == expected.durations()
+    assert result.maxima() == expected.maxima()
+
+
+def test_analyze_rejects_other_outcomes(registered):
+    cls = roulette.player.register_strategy("oscar", strategy.Strategy(**OSCAR))
+    with pytest.raises(TypeError):
+        roulette.analysis.analyze(cls(), 350)
+
+
+def test_strategy_player_pickles(registered):
+    cls = roulette.player.register_strategy("oscar", strategy.Strategy(**OSCAR))
+    player = cls(stake=50)
+    player.lose()
+    copied = pickle.loads(pickle.dumps(player))
+    assert type(copied) is cls
+    assert (copied.state, copied.stake) == (player.state, player.stake)
+    assert cls.__module__ == "pycasino.roulette.player"
+
+
+def test_yaml_strategy_in_spawned_workers(registered):
+    yaml = pytest.importorskip("yaml")
+    path = os.path.join(
+        os.path.dirname(__file__), "..", "pycasino", "config_example.yml"
+    )
+    with open(path) as config_data:
+        config = yaml.safe_load(config_data)["strategies"]
+    cls = roulette.player.register_strategy(
+        "oscar-lite", strategy.from_config(config)["oscar-lite"]
+    )
+
+    def gather(executor):
+        game = roulette.model.Game(
+            roulette.model.Table(350), roulette.wheel_builder.create_wheel()
+        )
+        simulator = roulette.model.Simulator(game, cls(stake=100, rounds=20))
+        simulator.chunk_size = 7
+        simulator.gather(40, executor, seed=1)
+        return simulator.maxima, simulator.durations
+
+    # Spawned workers only know the players registered on import.
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(2, mp_context=context) as executor:
+        assert gather(executor) == gather(None)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import concurrent.futures
+import multiprocessing
+import pytest
+from .context import roulette
+
+sweep = roulette.sweep
+
+
+class RecordingExecutor(roulette.parallel.SerialExecutor):
+    """Runs calls at once and remembers the order they were submitted in."""
+
+    def __init__(self):
+        self.submitted = list()
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted.append(args[0])
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.fixture
+def configs():
+    return sweep.grid(["martingale", "1326"], [100.0], [10.0, 20.0], [10, 30], [350.0])
+
+
+def means(results):
+    return [result.summaries["maximum"].moments.mean for result in results]
+
+
+def test_parse_values():
+    assert sweep.parse_values(["10:30:10", 45]) == [10.0, 20.0, 30.0, 45.0]
+    assert sweep.parse_values(["1:2:0.5"]) == [1.0, 1.5, 2.0]
+    assert sweep.parse_values(["10:25:10"], int) == [10, 20]
+
+
+@pytest.mark.parametrize("value", ["1:2", "a:b:c", "1:2:0"])
+def test_parse_values_invalid(value):
+    with pytest.raises(ValueError):
+        sweep.parse_values([value])
+
+
+def test_grid(configs):
+    assert len(configs) == 8
+    assert configs[0] == sweep.Config("martingale", 100.0, 10.0, 10, 350.0)
+    assert configs[-1] == sweep.Config("1326", 100.0, 20.0, 30, 350.0)
+
+
+def test_sweep_results_in_grid_order(configs):
+    results = sweep.sweep(configs, 50, seed=3)
+    assert [result.count for result in results] == [50] * len(configs)
+    config = configs[5]
+    expected = sweep.play(config, 50, roulette.parallel.stream_seed(3, 5))
+    assert means(results)[5] == expected.summaries["maximum"].moments.mean
+
+
+def test_sweep_largest_first(configs):
+    executor = RecordingExecutor()
+    sweep.sweep(configs, 5, executor, seed=1)
+    rounds = [config.max_rounds for config in executor.submitted]
+    assert rounds == sorted(rounds, reverse=True)
+    assert sorted(executor.submitted) == sorted(configs)
+
+
+def test_sweep_same_for_any_executor(configs):
+    serial = sweep.sweep(configs, 40, seed=9)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        pooled = sweep.sweep(configs, 40, executor, seed=9)
+    assert means(serial) == means(pooled)
+
+
+def test_sweep_strategy_in_spawned_workers(monkeypatch):
+    monkeypatch.setattr(roulette.player, "REGISTERED_PLAYERS", {})
+    doubler = roulette.strategy.Strategy(
+        {
+            "base": {"multiplier": 1, "won": "base", "lost": "double"},
+            "double": {"multiplier": 2, "won": "base", "lost": "double"},
+        }
+    )
+    roulette.player.register_strategy("doubler", doubler)
+    configs = sweep.grid(["doubler"], [100.0], [10.0], [10, 20], [350.0])
+    serial = sweep.sweep(configs, 20, seed=4)
+    # Spawned workers only know the players registered on import.
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(2, mp_context=context) as executor:
+        pooled = sweep.sweep(configs, 20, executor, seed=4)
+    assert means(serial) == means(pooled)
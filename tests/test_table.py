@@ -13,7 +13,7 @@ def table():
 @pytest.fixture
 def table_with_bets():
     return roulette.model.Table(
-        300, roulette.model.Bet(200, roulette.model.Outcome("Red", 1))
+        300, [roulette.model.Bet(200, roulette.model.Outcome("Red", 1))]
     )
 
 
@@ -47,3 +47,66 @@ def test_table_bets_is_valid_invalid_over_limit(table):
     with pytest.raises(roulette.model.InvalidBet):
         table.place_bet(roulette.model.Bet(400, roulette.model.Outcome("Red", 1)))
         table.is_valid()
+
+
+def test_table_running_total(table):
+    red = roulette.model.Outcome("Red", 1)
+    table.place_bet(roulette.model.Bet(100, red))
+    table.place_bet(roulette.model.Bet(50, red))
+    assert table.total == 150
+    assert len(table) == 2
+
+
+def test_table_place_bet_over_limit_keeps_bets(table):
+    red = roulette.model.Outcome("Red", 1)
+    bet = roulette.model.Bet(200, red)
+    table.place_bet(bet)
+    with pytest.raises(roulette.model.InvalidBet):
+        table.place_bet(roulette.model.Bet(101, red))
+    assert table.bets == [bet]
+    assert table.total == 200
+
+
+def test_table_clear_bets_reuses_slots(table):
+    red = roulette.model.Outcome("Red", 1)
+    table.place_bet(roulette.model.Bet(100, red))
+    table.place_bet(roulette.model.Bet(100, red))
+    slots = table._slots
+    table.clear_bets()
+    assert (table.bets, table.total, len(table)) == ([], 0.0, 0)
+    bet = roulette.model.Bet(300, red)
+    table.place_bet(bet)
+    assert table._slots is slots
+    assert list(table) == [bet]
+
+
+def test_table_iter_ignores_new_bets(table):
+    red = roulette.model.Outcome("Red", 1)
+    table.place_bet(roulette.model.Bet(10, red))
+    seen = [table.place_bet(roulette.model.Bet(10, red)) for _ in table]
+    assert len(seen) == 1
+    assert len(table) == 2
+
+
+def test_table_rejects_single_bet():
+    with pytest.raises(TypeError):
+        roulette.model.Table(
+            300, roulette.model.Bet(200, roulette.model.Outcome("Red", 1))
+        )
+
+
+def test_table_assign_bets(table_with_bets):
+    red = roulette.model.Outcome("Red", 1)
+    bets = [roulette.model.Bet(100, red), roulette.model.Bet(150, red)]
+    table_with_bets.bets = bets
+    assert (table_with_bets.bets, table_with_bets.total) == (bets, 250)
+    with pytest.raises(roulette.model.InvalidBet):
+        table_with_bets.bets = [roulette.model.Bet(301, red)]
+    assert (table_with_bets.bets, table_with_bets.total) == (bets, 250)
+
+
+def test_table_place_bets_all_or_none(table):
+    red = roulette.model.Outcome("Red", 1)
+    with pytest.raises(roulette.model.InvalidBet):
+        table.place_bets([roulette.model.Bet(200, red), roulette.model.Bet(200, red)])
+    assert (table.bets, table.total) == ([], 0.0)
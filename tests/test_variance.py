@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import functools
+import pytest
+from .context import roulette
+
+variance = roulette.variance
+
+
+@pytest.fixture
+def make_simulator(make_simulator):
+    return functools.partial(make_simulator, chunk_size=101)
+
+
+def test_mirror_bins():
+    wheel = roulette.wheel_builder.create_wheel()
+    mirror = variance.mirror_bins(wheel)
+    assert sorted(mirror) == list(range(len(wheel.bins)))
+    red, black = wheel.all_outcomes["Red"], wheel.all_outcomes["Black"]
+    for number, mirrored in enumerate(mirror):
+        assert mirror[mirrored] == number
+        assert (red in wheel.bins[number]) == (black in wheel.bins[mirrored])
+
+
+def test_bet_edges():
+    wheel = roulette.wheel_builder.create_wheel()
+    edges = variance.bet_edges(wheel)
+    assert edges[wheel.all_outcomes["Red"].id] == pytest.approx(-2 / 38)
+    assert edges[wheel.all_outcomes["Straight 00"].id] == pytest.approx(-2 / 38)
+
+
+@pytest.mark.parametrize("method", sorted(variance.METHODS))
+def test_estimates_agree(make_simulator, method):
+    plain = variance.estimate(make_simulator(), 2000, seed=1)
+    estimates = variance.estimate(make_simulator(), 2000, method, seed=2)
+    for field, estimate in estimates.items():
+        assert estimate.samples == 2000
+        error = (estimate.std_error**2 + plain[field].std_error ** 2) ** 0.5
+        assert abs(estimate.mean - plain[field].mean) < 5 * error
+
+
+@pytest.mark.parametrize("method", ["antithetic", "control"])
+def test_variance_is_reduced(make_simulator, method):
+    estimates = variance.estimate(make_simulator(), 2000, method, seed=3)
+    assert estimates["final"].effective_samples > 2000
+    assert estimates["ruined"].effective_samples > 2000
+
+
+def test_seeded_estimates_independent_of_executor(make_simulator):
+    expected = variance.estimate(make_simulator(), 400, "antithetic", seed=4)
+    with roulette.parallel.default_executor(2) as executor:
+        estimates = variance.estimate(
+            make_simulator(), 400, "antithetic", executor, seed=4
+        )
+    assert estimates == expected
+
+
+def test_stratified_fixes_first_spins(make_simulator):
+    simulator = make_simulator()
+    simulator.seed(5)
+    estimator = variance.Stratified(len(simulator.game.wheel.bins))
+    estimator.play(simulator, 0, 76)
+    for stratum in estimator.strata:
+        assert stratum["duration"].count == 2
+
+
+def test_stratified_needs_bins_of_wheel(make_simulator):
+    with pytest.raises(ValueError):
+        variance.estimate(make_simulator(), 100, variance.Stratified(37), seed=6)
+
+
+@pytest.mark.parametrize(
+    "method, samples", [("plain", 1), ("antithetic", 9), ("stratified", 75)]
+)
+def test_too_few_samples(make_simulator, method, samples):
+    with pytest.raises(ValueError):
+        variance.estimate(make_simulator(), samples, method, seed=6)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+import statistics
+import pytest
+from .context import roulette
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("pycasino.roulette.vectorized")
+
+
+class SharedSpins:
+    """Hands the scalar wheel the same spins the vectorized engine draws."""
+
+    def __init__(self, seed):
+        self.gen = np.random.default_rng(seed)
+
+    def choice(self, seq):
+        return seq[int(self.gen.integers(0, len(seq), size=1)[0])]
+
+
+def make_game(limit=350):
+    return roulette.model.Game(
+        roulette.model.Table(limit), roulette.wheel_builder.create_wheel()
+    )
+
+
+@pytest.mark.parametrize(
+    "name", [name for name in roulette.player.REGISTERED_PLAYERS if name != "random"]
+)
+@pytest.mark.parametrize(
+    "stake, base_bet_amount, rounds", [(100, 20, 20), (50, 1, 100)]
+)
+def test_gather_matches_scalar(name, stake, base_bet_amount, rounds):
+    """One lane at a time draws the same spins as the scalar simulator."""
+    player_cls = roulette.player.REGISTERED_PLAYERS[name]
+    kwargs = dict(stake=stake, base_bet_amount=base_bet_amount, rounds=rounds)
+
+    game = make_game(limit=40)
+    sim = roulette.model.Simulator(game, player_cls(**kwargs))
+    game.wheel.random_num_gen = SharedSpins(seed=3)
+    records = list(sim.iter_sessions(20))
+
+    vsim = vectorized.VectorizedSimulator(
+        make_game(limit=40), player_cls(**kwargs), seed=3, batch_size=1
+    )
+    assert list(vsim.iter_sessions(20)) == records
+
+
+def test_gather_random_player_statistically():
+    kwargs = dict(stake=100, base_bet_amount=10, rounds=20)
+    game = make_game()
+    game.wheel.random_num_gen = random.Random(1)
+    player = roulette.player.PlayerRandom(**kwargs)
+    player._random_number_generator = random.Random(2)
+    sim = roulette.model.Simulator(game, player)
+    sim.gather(500)
+
+    vsim = vectorized.VectorizedSimulator(
+        make_game(), roulette.player.PlayerRandom(**kwargs), seed=1
+    )
+    vsim.gather(5000)
+
+    assert statistics.mean(vsim.durations) == pytest.approx(
+        statistics.mean(sim.durations), rel=0.1
+    )
+    assert statistics.mean(vsim.maxima) == pytest.approx(
+        statistics.mean(sim.maxima), rel=0.1
+    )
+
+
+def test_gather_batches():
+    vsim = vectorized.VectorizedSimulator(
+        make_game(), roulette.player.PlayerMartingale(), seed=0, batch_size=7
+    )
+    vsim.gather(20)
+    assert len(vsim.maxima) == 20
+    assert len(vsim.durations) == 20
+
+
+def test_chunks_independent_of_batches():
+    vsim = vectorized.VectorizedSimulator(
+        make_game(), roulette.player.PlayerMartingale(), batch_size=7
+    )
+    assert vsim.chunk_size == roulette.model.Simulator.chunk_size
+    assert vsim._spawn().batch_size == 7
+
+
+def test_unregistered_player():
+    with pytest.raises(TypeError):
+        vectorized.VectorizedSimulator(make_game(), roulette.player.PlayerDouble())
+
+
+def test_gather_matches_scalar_strategy_player(monkeypatch):
+    monkeypatch.setattr(roulette.player, "REGISTERED_PLAYERS", {})
+    oscar = roulette.strategy.Strategy(
+        {
+            "base": {"multiplier": 1, "won": "base", "lost": "up"},
+            "up": {"multiplier": 2, "won": "base", "lost": "top", "outcome": "Odd"},
+            "top": {
+                "multiplier": 3,
+                "won": "up",
+                "lost": "top",
+                "outcome": "Street 1, 2, 3",
+            },
+        }
+    )
+    player_cls = roulette.player.register_strategy("oscar", oscar)
+    kwargs = dict(stake=100, base_bet_amount=5, rounds=50)
+
+    game = make_game()
+    sim = roulette.model.Simulator(game, player_cls(**kwargs))
+    game.wheel.random_num_gen = SharedSpins(seed=8)
+    records = list(sim.iter_sessions(20))
+
+    vsim = vectorized.VectorizedSimulator(
+        make_game(), player_cls(**kwargs), seed=8, batch_size=1
+    )
+    assert list(vsim.iter_sessions(20)) == records
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import copy
+import pickle
 import pytest
 import random
 from unittest.mock import Mock
@@ -22,3 +24,45 @@ def test_wheel_add_outcome(wheel1):
 def test_wheel_random_bin(wheel1):
     """Tests the wheel's random bin selection."""
     assert wheel1.spin() in wheel1.bins
+
+
+def test_layout_matches_builder():
+    """The static layout tables are up to date with the builder functions."""
+    built = roulette.wheel_builder.build_wheel()
+    outcomes, bins = roulette.wheel_builder.layout_tables(built)
+    assert outcomes == roulette.layout.OUTCOMES
+    assert bins == roulette.layout.BINS
+
+
+def test_create_wheel_shares_bins():
+    first = roulette.wheel_builder.create_wheel()
+    second = roulette.wheel_builder.create_wheel()
+    assert first.bins is second.bins
+    assert first.random_num_gen is not second.random_num_gen
+    built = roulette.wheel_builder.build_wheel()
+    assert [bin_.outcomes for bin_ in first.bins] == [
+        bin_.outcomes for bin_ in built.bins
+    ]
+
+
+@pytest.mark.parametrize(
+    "duplicate", [copy.deepcopy, lambda wheel: pickle.loads(pickle.dumps(wheel))]
+)
+def test_copied_wheel_shares_bins(duplicate):
+    wheel = roulette.wheel_builder.create_wheel()
+    wheel.random_num_gen.seed(1)
+    copied = duplicate(wheel)
+    assert copied.bins is wheel.bins
+    assert copied.all_outcomes is wheel.all_outcomes
+    assert copied.spin() is wheel.spin()
+
+
+def test_add_outcome_copies_shared_bins():
+    wheel = roulette.wheel_builder.create_wheel()
+    shared = roulette.wheel_builder.create_wheel()
+    outcome = roulette.model.Outcome("Lucky 7", 35)
+    wheel.add_outcome(7, outcome)
+    assert outcome in wheel[7].outcomes
+    assert outcome not in shared[7].outcomes
+    assert "Lucky 7" not in shared.all_outcomes
+    assert copy.deepcopy(wheel).bins is not wheel.bins